@@ -0,0 +1,144 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import DefaultDict, List, Optional, Tuple
+
+import numpy as np
+
+from game import HandBaseValue, NO_REPLACEMENT, spawn_generators
+from game.batch_scoring import EMPTY_SLOT, evaluate_hands, hand_values_to_base_values
+from game.game_state import CARDS_IN_HAND, HANDS_AMOUNT
+from players.simple_ai import simple_batch_moves
+
+FIRST_ROUND_CARDS = 2 * HANDS_AMOUNT
+PLACED_CARDS = 40
+
+
+class BatchPolicy(ABC):
+    """ Vectorized counterpart of `PokerAi`, deciding the same turn of many games at once. """
+
+    def __init__(self, is_first_player: bool, rng: Optional[np.random.Generator] = None):
+        self.is_first_player: bool = is_first_player
+        self.rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+
+    def reseed(self, rng: np.random.Generator) -> None:
+        self.rng = rng
+
+    @abstractmethod
+    def play_moves(self, cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray, hand_values: np.ndarray,
+                   other_hands: np.ndarray) -> np.ndarray:
+        pass
+
+    def play_last_moves(self, cards: np.ndarray, hands: np.ndarray, hand_values: np.ndarray,
+                        other_hands: np.ndarray) -> np.ndarray:
+        """ Return the hand whose last card is replaced per game, or NO_REPLACEMENT. """
+        return self.rng.integers(0, HANDS_AMOUNT, len(cards))
+
+
+class RandomBatchPolicy(BatchPolicy):
+    def play_moves(self, cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray, hand_values: np.ndarray,
+                   other_hands: np.ndarray) -> np.ndarray:
+        return np.argmin(hand_sizes, axis=1)
+
+
+class SimpleBatchPolicy(BatchPolicy):
+    def play_moves(self, cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray, hand_values: np.ndarray,
+                   other_hands: np.ndarray) -> np.ndarray:
+        return simple_batch_moves(cards, hands, hand_sizes, hand_values)
+
+
+@dataclass
+class BatchResult:
+    player1_won_hands: np.ndarray  # (games, hands) bool
+    base_values: np.ndarray  # (games, players, hands) HandBaseValue as int8
+
+    @property
+    def games(self) -> int:
+        return len(self.player1_won_hands)
+
+    @property
+    def player_scores(self) -> np.ndarray:
+        player1_scores = self.player1_won_hands.sum(axis=1, dtype=np.int8)
+        return np.stack([player1_scores, HANDS_AMOUNT - player1_scores], axis=1)
+
+    @property
+    def player_wins(self) -> Tuple[int, int]:
+        player1_wins = int(np.count_nonzero(self.player1_won_hands.sum(axis=1) > HANDS_AMOUNT // 2))
+        return player1_wins, self.games - player1_wins
+
+    def base_value_distribution(self) -> np.ndarray:
+        """ Count each HandBaseValue per player and hand position, shaped (players, hands, base values). """
+        distribution = np.zeros((2, HANDS_AMOUNT, len(HandBaseValue)), dtype=np.int64)
+        for player in range(2):
+            for hand_index in range(HANDS_AMOUNT):
+                distribution[player, hand_index] = np.bincount(self.base_values[:, player, hand_index],
+                                                               minlength=len(HandBaseValue))
+        return distribution
+
+    def win_by_hand_value(self) -> DefaultDict[HandBaseValue, int]:
+        winning_base_values = np.where(self.player1_won_hands, self.base_values[:, 0], self.base_values[:, 1])
+        win_by_hand_value = defaultdict(int)
+        for base_value, count in enumerate(np.bincount(winning_base_values.ravel(), minlength=len(HandBaseValue))):
+            if count:
+                win_by_hand_value[HandBaseValue(base_value)] = int(count)
+        return win_by_hand_value
+
+    @staticmethod
+    def concatenate(results: List["BatchResult"]) -> "BatchResult":
+        return BatchResult(np.concatenate([result.player1_won_hands for result in results]),
+                           np.concatenate([result.base_values for result in results]))
+
+
+def deal_decks(games: int, rng: np.random.Generator) -> np.ndarray:
+    """ Shuffle `games` decks of card ordinals, column 0 being the first card dealt. """
+    return rng.permuted(np.tile(np.arange(52, dtype=np.int8), (games, 1)), axis=1)
+
+
+def simulate_games(decks: np.ndarray, player1_policy: BatchPolicy, player2_policy: BatchPolicy) -> BatchResult:
+    games = len(decks)
+    rows = np.arange(games)
+    policies = [player1_policy, player2_policy]
+
+    hands = np.full((games, 2, HANDS_AMOUNT, CARDS_IN_HAND), EMPTY_SLOT, dtype=np.int8)
+    hands[:, 0, :, 0] = decks[:, 0:FIRST_ROUND_CARDS:2]
+    hands[:, 1, :, 0] = decks[:, 1:FIRST_ROUND_CARDS:2]
+    hand_sizes = np.ones((games, 2, HANDS_AMOUNT), dtype=np.int64)
+    hand_values = evaluate_hands(hands)
+
+    for turn in range(PLACED_CARDS):
+        player = turn % 2
+        cards = decks[:, FIRST_ROUND_CARDS + turn]
+        played_hands = policies[player].play_moves(cards, hands[:, player], hand_sizes[:, player],
+                                                   hand_values[:, player], hands[:, 1 - player, :, :-1])
+
+        hands[rows, player, played_hands, hand_sizes[rows, player, played_hands]] = cards
+        hand_sizes[rows, player, played_hands] += 1
+        hand_values[rows, player, played_hands] = evaluate_hands(hands[rows, player, played_hands])
+
+    for player in range(2):
+        cards = decks[:, FIRST_ROUND_CARDS + PLACED_CARDS + player]
+        replaced_hands = policies[player].play_last_moves(cards, hands[:, player], hand_values[:, player],
+                                                          hands[:, 1 - player, :, :-1])
+
+        replaced_games = np.nonzero(replaced_hands != NO_REPLACEMENT)[0]
+        replaced_hands = replaced_hands[replaced_games]
+        hands[replaced_games, player, replaced_hands, -1] = cards[replaced_games]
+        hand_values[replaced_games, player, replaced_hands] = evaluate_hands(
+            hands[replaced_games, player, replaced_hands])
+
+    return BatchResult(hand_values[:, 0] > hand_values[:, 1], hand_values_to_base_values(hand_values))
+
+
+def run_batch_games(player1_policy: BatchPolicy, player2_policy: BatchPolicy, games: int,
+                    seed: int | np.random.SeedSequence | None = None, batch_size: int = 100_000) -> BatchResult:
+    deck_rng = np.random.default_rng()
+    if seed is not None:
+        deck_rng, player1_rng, player2_rng = spawn_generators(seed, 3)
+        player1_policy.reseed(player1_rng)
+        player2_policy.reseed(player2_rng)
+
+    results = []
+    for first_game in range(0, games, batch_size):
+        decks = deal_decks(min(batch_size, games - first_game), deck_rng)
+        results.append(simulate_games(decks, player1_policy, player2_policy))
+    return BatchResult.concatenate(results)
@@ -0,0 +1,185 @@
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from game import Card, Deck, Hand, calculate_hand_base_value, has_better_cards
+from players import AdvancedPokerAi, MonteCarloPokerAi, PokerAi, RandomPokerAi, SimplePokerAi
+from run_game import initialize_hands, run_game
+
+BENCHMARK_SEED = 2024
+DEFAULT_TOLERANCE = 0.15
+
+AI_FACTORIES: Dict[str, Callable[[bool], PokerAi]] = {
+    "random": RandomPokerAi,
+    "simple": SimplePokerAi,
+    "advanced": AdvancedPokerAi,
+    "monte_carlo": lambda is_first_player: MonteCarloPokerAi(is_first_player, rollouts=200),
+}
+GAME_MATCHUPS: List[Tuple[str, str]] = [("random", "random"), ("simple", "simple"), ("advanced", "advanced")]
+
+Position = Tuple[Card, List[Hand], List[Hand], Deck]
+
+
+def best_time(function: Callable[..., object], repeats: int, setup: Callable[[], object] | None = None) -> float:
+    """ The fastest of `repeats` runs in seconds, the least disturbed by the rest of the machine. `setup` runs
+    untimed before each run and its result is passed to `function`. """
+    best = float("inf")
+    for _ in range(repeats):
+        arguments = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        function(*arguments)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def hand_corpus(hands: int, seed: int = BENCHMARK_SEED) -> List[List[Card]]:
+    rng = np.random.default_rng(seed)
+    corpus = []
+    while len(corpus) < hands:
+        deck = Deck(rng=rng)
+        corpus.extend([[deck.pop() for _ in range(5)] for _ in range(10)])
+    return corpus[:hands]
+
+
+def decision_positions(positions: int, seed: int = BENCHMARK_SEED) -> List[Position]:
+    """ Snapshots of the positions met by random players, spread over every turn of the placement rounds. """
+    rng = np.random.default_rng(seed)
+    player1_ai = RandomPokerAi(True, rng)
+    player2_ai = RandomPokerAi(False, rng)
+
+    snapshots = []
+    while len(snapshots) < positions:
+        deck = Deck(rng=rng)
+        player1_hands, player2_hands = initialize_hands(deck)
+        for i in range(40):
+            card = deck.pop()
+            turn = i % 2 == 0
+            current_hands = player1_hands if turn else player2_hands
+            other_hands = player2_hands if turn else player1_hands
+            if turn:
+                snapshots.append(copy.deepcopy((card, current_hands, other_hands, deck)))
+            player = player1_ai if turn else player2_ai
+            current_hands[player.play_move(card, current_hands, other_hands, deck)].add_card(card)
+    return snapshots[:positions]
+
+
+def bench_scoring(corpus: List[List[Card]], repeats: int) -> Dict[str, float]:
+    pairs = list(zip(corpus[::2], corpus[1::2]))
+
+    def base_values():
+        for cards in corpus:
+            calculate_hand_base_value(cards)
+
+    def comparisons():
+        for first_cards, second_cards in pairs:
+            has_better_cards(first_cards, second_cards)
+
+    return {"calculate_hand_base_value": len(corpus) / best_time(base_values, repeats),
+            "has_better_cards": len(pairs) / best_time(comparisons, repeats)}
+
+
+def bench_deck(deals: int, repeats: int) -> Dict[str, float]:
+    rng = np.random.default_rng(BENCHMARK_SEED)
+    decks = [Deck(rng=rng) for _ in range(deals)]
+    cards = decks[0].get_cards_left(True)[:]
+
+    def pops(fresh_decks: List[Deck]):
+        for deck in fresh_decks:
+            for _ in range(52):
+                deck.pop()
+
+    def removals(fresh_decks: List[Deck]):
+        for deck in fresh_decks:
+            for card in cards:
+                deck.remove_card(card)
+
+    def copy_decks() -> List[Deck]:
+        return copy.deepcopy(decks)
+
+    return {"deck_pop": 52 * deals / best_time(pops, repeats, copy_decks),
+            "deck_remove_card": 52 * deals / best_time(removals, repeats, copy_decks)}
+
+
+def bench_play_moves(positions: List[Position], monte_carlo_positions: int, repeats: int) -> Dict[str, float]:
+    results = {}
+    for name, ai_factory in AI_FACTORIES.items():
+        ai = ai_factory(True)
+        ai_positions = positions[:monte_carlo_positions] if name == "monte_carlo" else positions
+
+        def play_moves():
+            ai.reseed(np.random.default_rng(BENCHMARK_SEED))
+            for card, hands, other_hands, deck in ai_positions:
+                ai.play_move(card, hands, other_hands, deck)
+
+        results[f"play_move_{name}"] = len(ai_positions) / best_time(play_moves, repeats)
+    return results
+
+
+def bench_games(games: int, repeats: int) -> Dict[str, float]:
+    results = {}
+    for player1_name, player2_name in GAME_MATCHUPS:
+        player1_ai = AI_FACTORIES[player1_name](True)
+        player2_ai = AI_FACTORIES[player2_name](False)
+
+        def play_games():
+            for game_index in range(games):
+                run_game(player1_ai, player2_ai, seed=np.random.SeedSequence(BENCHMARK_SEED, spawn_key=(game_index,)))
+
+        results[f"games_{player1_name}_vs_{player2_name}"] = games / best_time(play_games, repeats)
+    return results
+
+
+def run_benchmarks(hands: int = 20_000, deals: int = 500, positions: int = 400, monte_carlo_positions: int = 20,
+                   games: int = 100, repeats: int = 3) -> Dict[str, float]:
+    """ Operations per second of each benchmark, higher being faster. """
+    results = {}
+    results.update(bench_scoring(hand_corpus(hands), repeats))
+    results.update(bench_deck(deals, repeats))
+    results.update(bench_play_moves(decision_positions(positions), monte_carlo_positions, repeats))
+    results.update(bench_games(games, repeats))
+    return results
+
+
+def find_regressions(results: Dict[str, float], baseline: Dict[str, float],
+                     tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, float]:
+    """ The benchmarks slower than `baseline` by more than `tolerance`, with their speed relative to it. """
+    return {name: results[name] / baseline_rate for name, baseline_rate in baseline.items()
+            if name in results and results[name] < baseline_rate * (1 - tolerance)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time scoring, the deck, AI decisions and full games.")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline before failing, as a fraction")
+    parser.add_argument("--quick", action="store_true", help="run smaller workloads")
+    args = parser.parse_args()
+
+    sizes = dict(hands=2000, deals=50, positions=40, monte_carlo_positions=4, games=10) if args.quick else {}
+    results = run_benchmarks(**sizes)
+    report = {"python": platform.python_version(), "numpy": np.__version__, "results": results}
+
+    for name, rate in results.items():
+        print(f"{name:<32}{rate:>14.1f} /s")
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = find_regressions(results, json.load(baseline_file)["results"], args.tolerance)
+        for name, ratio in regressions.items():
+            print(f"regression: {name} at {ratio:.0%} of the baseline")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
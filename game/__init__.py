@@ -1,6 +1,7 @@
 from game.card import Card
 from game.deck import Deck
 from game.hand import Hand
-from game.utils import get_playable_hands
+from game.decision import Decision, DecisionBatch, NO_REPLACEMENT, legal_moves
+from game.utils import get_playable_hands, get_potential_values, get_potential_strengths, spawn_generators
 from game.hand_scoring import has_better_cards, HandBaseValue, calculate_hand_base_value, extend_hand_base_value, \
-    compute_full_value
+    compute_full_value, evaluate_hand
@@ -0,0 +1,65 @@
+from itertools import combinations_with_replacement
+from math import prod
+from typing import Dict, Tuple
+
+import numpy as np
+
+from game.card import ordinal_to_card
+from game.hand_scoring import RANK_TABLE, FLUSH_TABLE, RANK_PRIMES, FLUSH_SUIT, BASE_VALUE_WEIGHT, TableEntry
+
+EMPTY_SLOT = -1
+
+# The extra last entry describes EMPTY_SLOT, which indexes it: no number and a suit no card has
+CARD_NUMBERS = np.array([ordinal_to_card(ordinal).number for ordinal in range(52)] + [0], dtype=np.int8)
+CARD_SUITS = np.array([int(ordinal_to_card(ordinal).suit) for ordinal in range(52)] + [EMPTY_SLOT], dtype=np.int8)
+
+
+# Vectorized lookups index the tables directly by the hand's sorted numbers, read as base 14 digits
+NUMBER_BASE = 14
+INDEX_WEIGHTS = NUMBER_BASE ** np.arange(5, dtype=np.int64)
+
+
+def _table_to_arrays(table: Dict[int, TableEntry]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    values = np.zeros(NUMBER_BASE ** 5, dtype=np.int64)
+    suit_numbers = np.full(NUMBER_BASE ** 5, EMPTY_SLOT, dtype=np.int8)
+    suit_weights = np.zeros(NUMBER_BASE ** 5, dtype=np.int64)
+    for cards_amount in range(1, 6):
+        for numbers in combinations_with_replacement(range(1, 14), cards_amount):
+            entry = table.get(prod(RANK_PRIMES[number] for number in numbers))
+            if entry is None:
+                continue
+            index = int(np.dot((0,) * (5 - cards_amount) + numbers, INDEX_WEIGHTS))
+            values[index] = entry[1]
+            suit_numbers[index] = EMPTY_SLOT if entry[2] is None else entry[2]
+            suit_weights[index] = entry[3]
+    return values, suit_numbers, suit_weights
+
+
+RANK_ARRAYS = _table_to_arrays(RANK_TABLE)
+FLUSH_ARRAYS = _table_to_arrays(FLUSH_TABLE)
+
+
+def evaluate_hands(cards: np.ndarray) -> np.ndarray:
+    """ Vectorized `evaluate_hand` over card ordinals shaped (..., cards), trailing empty slots hold EMPTY_SLOT. """
+    numbers = CARD_NUMBERS[cards]
+    suits = CARD_SUITS[cards]
+
+    # Empty hands land on index 0, whose entry is all zeros
+    indices = np.sort(numbers, axis=-1) @ INDEX_WEIGHTS
+    is_flush = (suits == suits[..., :1]).all(axis=-1)
+
+    values, suit_numbers, suit_weights = (array[indices] for array in RANK_ARRAYS)
+    if is_flush.any():
+        flush_values, flush_suit_numbers, flush_suit_weights = (array[indices] for array in FLUSH_ARRAYS)
+        values = np.where(is_flush, flush_values, values)
+        suit_numbers = np.where(is_flush, flush_suit_numbers, suit_numbers)
+        suit_weights = np.where(is_flush, flush_suit_weights, suit_weights)
+
+    # The tiebreak suit belongs to the only card with the entry's number, or to any card of a flush
+    tiebreak_suits = np.where(suit_numbers == FLUSH_SUIT, suits[..., 0],
+                              ((numbers == suit_numbers[..., None]) * suits).sum(axis=-1))
+    return values + tiebreak_suits * suit_weights
+
+
+def hand_values_to_base_values(hand_values: np.ndarray) -> np.ndarray:
+    return (hand_values // BASE_VALUE_WEIGHT).astype(np.int8)
@@ -0,0 +1,16 @@
+from typing import Tuple
+
+from game.decision import Decision
+
+CanonicalKey = Tuple
+
+
+def canonical_decision(decision: Decision) -> CanonicalKey:
+    """ Key shared by the decisions equal to `decision`, whatever the objects describing them. The hand positions
+    are kept in their order, as the AIs break ties by hand index, and suits are kept as they are, as they break ties
+    between equal hands. The deck is described by the cards the player has not seen. """
+    player = decision.is_first_player
+    positions = tuple((tuple(card.ordinal for card in hand.get_cards(player)),
+                       tuple(card.ordinal for card in other_hand.get_cards(player)))
+                      for hand, other_hand in zip(decision.hands, decision.other_hands))
+    return player, decision.is_last_move, decision.card.ordinal, positions, decision.deck.get_cards_left_mask(player)
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
 from enum import Enum
+from typing import Dict, List, Tuple
 
 
 class Suit(int, Enum):
@@ -9,26 +9,78 @@ class Suit(int, Enum):
     SPADES = 3
 
 
-@dataclass
+SUIT_ARTS = {
+    Suit.SPADES: "♠",
+    Suit.HEARTS: "♥",
+    Suit.CLUBS: "♣",
+    Suit.DIAMONDS: "♦",
+}
+
+
 class Card:
+    """ One of the 52 interned, immutable cards: `Card(suit, number)` always returns the same instance. """
+    __slots__ = ("suit", "number", "ordinal")
+
     suit: Suit
     number: int
+    # 0-51, ordered by number with the ace highest, then by suit
+    ordinal: int
+
+    def __new__(cls, suit: Suit | str, number: int) -> "Card":
+        try:
+            return _INTERNED_CARDS[suit, number]
+        except KeyError:
+            raise ValueError(f"no card with suit {suit!r} and number {number!r}") from None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("cards are immutable")
+
+    def __reduce__(self) -> Tuple[type, Tuple[Suit, int]]:
+        return Card, (self.suit, self.number)
+
+    def __hash__(self) -> int:
+        return self.ordinal
 
     def __gt__(self, other: "Card") -> bool:
-        if self.number == other.number:
-            return int(self.suit) > int(other.suit)
-        if self.number == 1:
-            return True
-        if other.number == 1:
-            return False
-        return self.number > other.number
+        return self.ordinal > other.ordinal
+
+    def __lt__(self, other: "Card") -> bool:
+        return self.ordinal < other.ordinal
+
+    def __ge__(self, other: "Card") -> bool:
+        return self.ordinal >= other.ordinal
+
+    def __le__(self, other: "Card") -> bool:
+        return self.ordinal <= other.ordinal
 
     def __str__(self) -> str:
-        suit_arts = {
-            Suit.SPADES: "♠",
-            Suit.HEARTS: "♥",
-            Suit.CLUBS: "♣",
-            Suit.DIAMONDS: "♦",
-        }
-
-        return str(self.number) + suit_arts[self.suit]
+        return str(self.number) + SUIT_ARTS[self.suit]
+
+    def __repr__(self) -> str:
+        return f"Card(suit={self.suit!r}, number={self.number})"
+
+
+def _create_card(suit: Suit, number: int) -> Card:
+    card = object.__new__(Card)
+    object.__setattr__(card, "suit", suit)
+    object.__setattr__(card, "number", number)
+    object.__setattr__(card, "ordinal", (number - 2) % 13 * 4 + int(suit))
+    return card
+
+
+CARDS: List[Card] = sorted((_create_card(suit, number) for suit in Suit for number in range(1, 14)),
+                           key=lambda card: card.ordinal)
+
+# Suits may also be given by value or by name, as iterating `Suit.__members__` yields
+_INTERNED_CARDS: Dict[Tuple[Suit | int | str, int], Card] = {}
+for _card in CARDS:
+    for _suit_key in [_card.suit, int(_card.suit), _card.suit.name]:
+        _INTERNED_CARDS[_suit_key, _card.number] = _card
+
+
+def card_to_ordinal(card: Card) -> int:
+    return card.ordinal
+
+
+def ordinal_to_card(ordinal: int) -> Card:
+    return CARDS[ordinal]
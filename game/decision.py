@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import List, NamedTuple
+
+import numpy as np
+
+from game.batch_scoring import EMPTY_SLOT
+from game.card import Card
+from game.deck import Deck
+from game.hand import Hand
+
+# Batched last moves keeping every hand, as None does for a single decision
+NO_REPLACEMENT = -1
+
+_PADDING = [[EMPTY_SLOT] * (5 - cards) for cards in range(6)]
+
+
+class Decision(NamedTuple):
+    """ A move asked from a player: the hand to place `card` in, or on the last move the hand whose last card
+    it replaces. """
+    is_first_player: bool
+    card: Card
+    hands: List[Hand]
+    other_hands: List[Hand]
+    deck: Deck
+    is_last_move: bool
+
+
+def legal_moves(decision: Decision) -> List[int | None]:
+    if decision.is_last_move:
+        return [None] + list(range(len(decision.hands)))
+    fewest_cards = min(len(hand) for hand in decision.hands)
+    return [hand_index for hand_index, hand in enumerate(decision.hands) if len(hand) == fewest_cards]
+
+
+class DecisionBatch:
+    """ The decisions of the same turn of many games, with arrays of what the player sees built on first use. """
+
+    def __init__(self, decisions: List[Decision]):
+        self.decisions: List[Decision] = decisions
+
+    def __len__(self) -> int:
+        return len(self.decisions)
+
+    @property
+    def is_last_move(self) -> bool:
+        return self.decisions[0].is_last_move
+
+    @staticmethod
+    def _hands_array(hands_per_decision: List[List[Hand]], players: List[bool]) -> np.ndarray:
+        ordinals = []
+        for hands, player in zip(hands_per_decision, players):
+            for hand in hands:
+                cards = hand.get_cards(player)
+                ordinals.extend([card.ordinal for card in cards])
+                ordinals.extend(_PADDING[len(cards)])
+        return np.array(ordinals, dtype=np.int8).reshape(len(hands_per_decision), 5, 5)
+
+    @cached_property
+    def cards(self) -> np.ndarray:
+        """ (decisions,) ordinal of the card to play. """
+        return np.array([decision.card.ordinal for decision in self.decisions], dtype=np.int8)
+
+    @cached_property
+    def hands(self) -> np.ndarray:
+        """ (decisions, hands, cards) ordinals of the player's hands, empty slots last. """
+        return self._hands_array([decision.hands for decision in self.decisions],
+                                 [decision.is_first_player for decision in self.decisions])
+
+    @cached_property
+    def hand_sizes(self) -> np.ndarray:
+        return np.count_nonzero(self.hands != EMPTY_SLOT, axis=2)
+
+    @cached_property
+    def hand_values(self) -> np.ndarray:
+        """ (decisions, hands) `evaluate_hand` values of the player's hands. """
+        return np.array([[hand.get_value(decision.is_first_player) for hand in decision.hands]
+                         for decision in self.decisions], dtype=np.int64)
+
+    @cached_property
+    def other_hands(self) -> np.ndarray:
+        """ (decisions, hands, cards) ordinals of the opponent's cards the player can see. """
+        return self._hands_array([decision.other_hands for decision in self.decisions],
+                                 [decision.is_first_player for decision in self.decisions])
+
+    @cached_property
+    def cards_left(self) -> np.ndarray:
+        """ (decisions, 52) whether each card ordinal is still unseen by the player. """
+        masks = b"".join(decision.deck.get_cards_left_mask(decision.is_first_player).to_bytes(7, "little")
+                         for decision in self.decisions)
+        bits = np.unpackbits(np.frombuffer(masks, dtype=np.uint8).reshape(len(self.decisions), 7), axis=1,
+                             bitorder="little")
+        return bits[:, :52].astype(bool)
@@ -1,81 +1,118 @@
-from collections import defaultdict
-from copy import deepcopy
-from random import shuffle
-from typing import List, Dict, Counter
+from typing import List, Optional
 
-from game.card import Card, Suit
+import numpy as np
+
+from game.card import Card, Suit, CARDS
 
 SUITS = [Suit.CLUBS, Suit.DIAMONDS, Suit.HEARTS, Suit.SPADES]
+HIDDEN_CARDS_START = 12
 
 
 class Deck:
-    def __init__(self, initial_cards: List[Card] = None):
+    def __init__(self, initial_cards: List[Card] = None, rng: Optional[np.random.Generator] = None):
+        self._rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+
+        # Draw order, popped from the end; cards taken out with `remove_card` are skipped
+        self._order: List[Card] = (list(initial_cards) if initial_cards is not None
+                                   else [Card(suit, number) for suit in SUITS for number in range(1, 14)])
+        self._next_index: int = len(self._order)
+
+        # Bit `card.ordinal` is set while the card is left in the deck
+        self._mask: int = 0
+        self._suits_left: List[int] = [0] * 4
+        self._number_left: List[int] = [0] * 14
+        for card in self._order:
+            self._mask |= 1 << card.ordinal
+            self._suits_left[card.suit] += 1
+            self._number_left[card.number] += 1
+        self.cards_left_amount = len(self._order)
+
+        # Once 12 cards are left each player's view also holds the cards the other player drew
+        self._player_masks: List[int] = []
+        self._player_suits_left: List[List[int]] = []
+        self._player_number_left: List[List[int]] = []
+        self._cards_left_cache: List[tuple] = [(-1, []), (-1, [])]
+        if self.cards_left_amount <= HIDDEN_CARDS_START:
+            self._split_views()
+
         if initial_cards is None:
-            self._cards_left: List[Card] = [Card(suit, number) for suit in SUITS for number in range(1, 14)]
             self.shuffle()
 
-            self.cards_left_amount = len(self._cards_left)
-            self._suits_left: Dict[Suit, int] = {suit: 13 for suit in SUITS}
-            self._number_left: Dict[int, int] = {number: 4 for number in range(1, 14)}
-            self._decks: List["Deck"] = []
-
-        else:
-            self._cards_left: List[Card] = initial_cards
-            self.cards_left_amount = len(self._cards_left)
-            self._suits_left: Dict[Suit, int] = defaultdict(int)
-            self._number_left: Dict[int, int] = defaultdict(int)
-
-            for card in self._cards_left:
-                self._suits_left[card.suit] += 1
-                self._number_left[card.number] += 1
+    def _split_views(self) -> None:
+        self._player_masks = [self._mask, self._mask]
+        self._player_suits_left = [list(self._suits_left), list(self._suits_left)]
+        self._player_number_left = [list(self._number_left), list(self._number_left)]
 
     def pop(self) -> Card | None:
         if self.cards_left_amount == 0:
             return None
 
-        returned_card = self._cards_left.pop()
+        returned_card = self._order[self._next_index - 1]
+        self._next_index -= 1
+        while not self._mask >> returned_card.ordinal & 1:
+            returned_card = self._order[self._next_index - 1]
+            self._next_index -= 1
+
+        self._mask ^= 1 << returned_card.ordinal
         self.cards_left_amount -= 1
         self._suits_left[returned_card.suit] -= 1
         self._number_left[returned_card.number] -= 1
 
-        if self.cards_left_amount == 12:
-            self._decks = [Deck(deepcopy(self._cards_left)), Deck(deepcopy(self._cards_left))]
+        if self.cards_left_amount == HIDDEN_CARDS_START:
+            self._split_views()
 
-        if self.cards_left_amount < 12:
-            deck_index_to_remove = (self.cards_left_amount + 1) % 2
-            self._decks[deck_index_to_remove].remove_card(returned_card)
+        if self.cards_left_amount < HIDDEN_CARDS_START:
+            player_index = (self.cards_left_amount + 1) % 2
+            self._player_masks[player_index] ^= 1 << returned_card.ordinal
+            self._player_suits_left[player_index][returned_card.suit] -= 1
+            self._player_number_left[player_index][returned_card.number] -= 1
 
         return returned_card
 
     def remove_card(self, card: Card) -> None:
-        if card in self._cards_left:
-            self._cards_left.remove(card)
+        if self._mask >> card.ordinal & 1:
+            self._mask ^= 1 << card.ordinal
             self._number_left[card.number] -= 1
             self._suits_left[card.suit] -= 1
             self.cards_left_amount -= 1
 
     def shuffle(self) -> None:
-        shuffle(self._cards_left)
+        cards_left = self._order[:self._next_index]
+        self._rng.shuffle(cards_left)
+        self._order[:self._next_index] = cards_left
 
     def get_suit_left(self, suit: Suit, player: bool) -> int:
-        if self.cards_left_amount > 12:
+        if self.cards_left_amount > HIDDEN_CARDS_START:
             return self._suits_left[suit]
         else:
             player_deck_index = 0 if player else 1
-            return self._decks[player_deck_index]._suits_left[suit]
+            return self._player_suits_left[player_deck_index][suit]
 
     def get_number_left(self, number: int, player: bool) -> int:
         if number == 14:
             number = 1
 
-        if self.cards_left_amount > 12:
+        if self.cards_left_amount > HIDDEN_CARDS_START:
             return self._number_left[number]
         else:
             player_deck_index = 0 if player else 1
-            return self._decks[player_deck_index]._number_left[number]
+            return self._player_number_left[player_deck_index][number]
+
+    def get_cards_left_mask(self, player: bool) -> int:
+        """ The cards `player` has not seen, as a mask of card ordinals. """
+        if self.cards_left_amount < HIDDEN_CARDS_START:
+            return self._player_masks[0 if player else 1]
+        return self._mask
+
+    def get_cards_left_amount(self, player: bool) -> int:
+        return self.get_cards_left_mask(player).bit_count()
 
     def get_cards_left(self, player: bool) -> List[Card]:
-        if self.cards_left_amount < 12:
-            player_deck_index = 0 if player else 1
-            return self._decks[player_deck_index]._cards_left
-        return self._cards_left
+        # The list is rebuilt only after the mask changed and is shared by callers until then
+        mask = self.get_cards_left_mask(player)
+        cache_index = 0 if player else 1
+        cached_mask, cards_left = self._cards_left_cache[cache_index]
+        if cached_mask != mask:
+            cards_left = [CARDS[ordinal] for ordinal in range(52) if mask >> ordinal & 1]
+            self._cards_left_cache[cache_index] = (mask, cards_left)
+        return cards_left
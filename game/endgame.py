@@ -0,0 +1,161 @@
+from typing import Dict, List, NamedTuple, Tuple
+
+from game.card import CARDS
+from game.decision import Decision
+from game.game_state import GameState, HANDS_AMOUNT, LAST_MOVES_TURN
+from game.hand_scoring import evaluate_hand
+
+# The opponent is not searched: it is assumed to place its hidden fifth cards and play its last move uniformly at
+# random, so the values are expected scores against that model rather than against a strategic opponent.
+
+# Scores are bounded, which lets chance nodes stop once the rest of their outcomes cannot matter
+MAX_SCORE = HANDS_AMOUNT
+
+
+class EndgamePosition(NamedTuple):
+    """ What a player knows once every hand holds at least four cards: its own hands, the four visible cards of
+    each opponent hand, and the cards it has not seen, as card ordinals. """
+    is_first_player: bool
+    card: int
+    hands: List[List[int]]
+    other_hands: List[List[int]]
+    unseen: List[int]
+    is_last_move: bool
+
+    @staticmethod
+    def from_decision(decision: Decision) -> "EndgamePosition":
+        player = decision.is_first_player
+        return EndgamePosition(player, decision.card.ordinal,
+                               [[card.ordinal for card in hand.get_cards(player)] for hand in decision.hands],
+                               [[card.ordinal for card in hand.get_cards(player)[:4]] for hand in decision.other_hands],
+                               [card.ordinal for card in decision.deck.get_cards_left(player)], decision.is_last_move)
+
+    @staticmethod
+    def from_game_state(state: GameState) -> "EndgamePosition":
+        """ The position of the player to move, whose card is the next one of the draw pile. """
+        player = state.current_player
+        card = state.cards[-1]
+        return EndgamePosition(player == 0, card, [list(hand) for hand in state.hands[player]],
+                               [state.visible_hand(player, 1 - player, hand_index)[:4]
+                                for hand_index in range(HANDS_AMOUNT)],
+                               [ordinal for ordinal in state.unseen_cards(player) if ordinal != card],
+                               state.turn >= LAST_MOVES_TURN)
+
+    @property
+    def is_endgame(self) -> bool:
+        return all(len(hand) >= 4 for hand in self.hands) and all(len(hand) == 4 for hand in self.other_hands)
+
+
+class EndgameSolver:
+    """ Expectimax over the moves left to a player once every hand holds at least four cards, against an opponent
+    playing uniformly at random.
+
+    The player draws its next cards uniformly from those it has not seen and places them in its hands (chance and
+    max nodes), then plays its last move. The opponent is taken to place its hidden fifth cards at random, so every
+    unseen card is as likely to end up in any of its hands and the search leaves it out; its last move is a uniform
+    reply, as in `game.equity`. Chance nodes are memoized and cut off once even their best remaining outcomes cannot
+    beat the best move found (Star1). """
+
+    def __init__(self, position: EndgamePosition):
+        if not position.is_endgame:
+            raise ValueError("the endgame starts once every hand holds at least four cards")
+        self.position: EndgamePosition = position
+        self.nodes: int = 0
+        self.pruned: int = 0
+        self._memo: Dict[Tuple[Tuple[int, ...], int], float] = {}
+
+        # Every card the fifth slots may hold, numbered from 0 to index the bits of card masks
+        fifth_cards = [hand[4] for hand in position.hands if len(hand) == 5]
+        self._cards: List[int] = position.unseen + [position.card] + fifth_cards
+        self._card_index: Dict[int, int] = {ordinal: index for index, ordinal in enumerate(self._cards)}
+        self._unseen_mask: int = (1 << len(position.unseen)) - 1
+
+        # For each hand and fifth card, the mask of the opponent's fifth cards it beats in that position
+        self._beaten_masks: List[List[int]] = []
+        for hand, other_hand in zip(position.hands, position.other_hands):
+            own_cards = [CARDS[ordinal] for ordinal in hand[:4]]
+            other_cards = [CARDS[ordinal] for ordinal in other_hand]
+            other_values = [evaluate_hand(other_cards + [CARDS[ordinal]]) for ordinal in position.unseen]
+            masks = []
+            for ordinal in self._cards:
+                value = evaluate_hand(own_cards + [CARDS[ordinal]])
+                beaten = [value > other_value if position.is_first_player else value >= other_value
+                          for other_value in other_values]
+                masks.append(sum(1 << index for index, is_beaten in enumerate(beaten) if is_beaten))
+            self._beaten_masks.append(masks)
+
+    def _fifth_cards(self) -> Tuple[int, ...]:
+        return tuple(self._card_index[hand[4]] if len(hand) == 5 else -1 for hand in self.position.hands)
+
+    def _last_move_values(self, fifth_cards: Tuple[int, ...], unseen_mask: int, card: int) -> List[float]:
+        """ Expected score of keeping every hand, then of replacing the fifth card of each hand with `card`. """
+        unseen_amount = unseen_mask.bit_count()
+        won = [(masks[fifth_card] & unseen_mask).bit_count() for masks, fifth_card in zip(self._beaten_masks,
+                                                                                          fifth_cards)]
+        kept_score = sum(won)
+        return [kept_score / unseen_amount] + [
+            (kept_score - won[hand_index] + (masks[card] & unseen_mask).bit_count()) / unseen_amount
+            for hand_index, masks in enumerate(self._beaten_masks)]
+
+    def _placements(self, fifth_cards: Tuple[int, ...], card: int) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(hand_index, fifth_cards[:hand_index] + (card,) + fifth_cards[hand_index + 1:])
+                for hand_index, fifth_card in enumerate(fifth_cards) if fifth_card == -1]
+
+    def _placement_values(self, fifth_cards: Tuple[int, ...], unseen_mask: int, card: int,
+                          alpha: float) -> Dict[int, float]:
+        """ Expected score of placing `card` in each hand missing its fifth card, only an upper bound for the
+        placements that cannot beat an earlier one. """
+        values = {}
+        for hand_index, placed in self._placements(fifth_cards, card):
+            values[hand_index] = self._chance_value(placed, unseen_mask, alpha)
+            alpha = max(alpha, values[hand_index])
+        return values
+
+    def _chance_value(self, fifth_cards: Tuple[int, ...], unseen_mask: int, alpha: float) -> float:
+        """ Expected score over the player's next card, or an upper bound at most `alpha` when pruned. """
+        key = (fifth_cards, unseen_mask)
+        value = self._memo.get(key)
+        if value is not None:
+            return value
+        self.nodes += 1
+
+        draws = [index for index in range(unseen_mask.bit_length()) if unseen_mask >> index & 1]
+        is_last_move = -1 not in fifth_cards
+        total = 0.0
+        for drawn, card in enumerate(draws):
+            card_unseen_mask = unseen_mask & ~(1 << card)
+            if is_last_move:
+                total += max(self._last_move_values(fifth_cards, card_unseen_mask, card))
+            else:
+                total += max(self._placement_values(fifth_cards, card_unseen_mask, card, -1.0).values())
+
+            bound = (total + (len(draws) - drawn - 1) * MAX_SCORE) / len(draws)
+            if bound <= alpha:
+                self.pruned += 1
+                return bound
+
+        value = total / len(draws)
+        self._memo[key] = value
+        return value
+
+    def _root_last_move_values(self) -> Dict[int | None, float]:
+        values = self._last_move_values(self._fifth_cards(), self._unseen_mask, self._card_index[self.position.card])
+        return {None: values[0], **dict(enumerate(values[1:]))}
+
+    def move_values(self) -> Dict[int | None, float]:
+        """ Expected score of every legal move against the uniform opponent, without cutoffs, None keeping every hand
+        on the last move. """
+        if self.position.is_last_move:
+            return self._root_last_move_values()
+        return {hand_index: self._chance_value(placed, self._unseen_mask, -float("inf"))
+                for hand_index, placed in self._placements(self._fifth_cards(), self._card_index[self.position.card])}
+
+    def best_move(self) -> int | None:
+        """ The move with the highest expected score against the uniform opponent, keeping every hand on ties of the
+        last move. """
+        if self.position.is_last_move:
+            values = self._root_last_move_values()
+        else:
+            values = self._placement_values(self._fifth_cards(), self._unseen_mask,
+                                            self._card_index[self.position.card], -1.0)
+        return max(values, key=values.get)
@@ -0,0 +1,67 @@
+from functools import lru_cache
+from itertools import permutations
+from typing import List
+
+import numpy as np
+
+from game.batch_scoring import evaluate_hands
+from game.decision import Decision
+
+RANDOM_REPLY = "random"
+BEST_REPLY = "best"
+
+
+@lru_cache(maxsize=None)
+def _worlds(unseen_cards: int, drawn_cards: int) -> np.ndarray:
+    """ Every ordered draw of `drawn_cards` out of `unseen_cards`, as (draws, drawn_cards) indices. """
+    return np.array(list(permutations(range(unseen_cards), drawn_cards)), dtype=np.intp).reshape(-1, drawn_cards)
+
+
+def last_move_equity(decision: Decision, opponent_reply: str = RANDOM_REPLY) -> np.ndarray:
+    """ Exact expected score of each last-move option, keeping every hand first and then replacing the last card
+    of hand 0 to 4. The opponent's hidden cards are equally likely to be any arrangement of the cards the player
+    has not seen. When the first player decides, the second player replies with the card left over, either
+    uniformly among its options or with the best one knowing every card. """
+    if opponent_reply not in (RANDOM_REPLY, BEST_REPLY):
+        raise ValueError(f"unknown opponent reply {opponent_reply!r}")
+    player = decision.is_first_player
+    hands = [hand.get_cards(player) for hand in decision.hands]
+    other_visible_cards = [hand.get_cards(player)[:4] for hand in decision.other_hands]
+    unseen_cards: List = decision.deck.get_cards_left(player)
+    hands_amount = len(hands)
+
+    # One vectorized evaluation for the replaced hands and every hand the opponent may end up with
+    replaced_hands = [[card.ordinal for card in cards[:4]] + [decision.card.ordinal] for cards in hands]
+    other_hands = [[card.ordinal for card in cards] + [unseen_card.ordinal]
+                   for cards in other_visible_cards for unseen_card in unseen_cards]
+    values = evaluate_hands(np.array(replaced_hands + other_hands, dtype=np.int8))
+
+    kept_values = np.array([hand.get_value(player) for hand in decision.hands], dtype=np.int64)
+    option_values = np.tile(kept_values, (hands_amount + 1, 1))
+    option_values[np.arange(1, hands_amount + 1), np.arange(hands_amount)] = values[:hands_amount]
+    other_values = values[hands_amount:].reshape(hands_amount, len(unseen_cards))
+
+    # Hands won by each option against each card the opponent may hold there, equal hands going to the second player
+    if player:
+        won = option_values[:, :, None] > other_values[None]
+    else:
+        won = option_values[:, :, None] >= other_values[None]
+
+    # The score adds up the hands and every unseen card is as likely to end up in any hand, random replies
+    # included, so the expectation is the sum of the per-hand averages
+    if not player or opponent_reply == RANDOM_REPLY:
+        return won.mean(axis=2).sum(axis=1)
+
+    # The best reply depends on every hand at once, so it is enumerated over all the deals of the unseen cards
+    worlds = _worlds(len(unseen_cards), hands_amount + 1)
+    won_against_kept = won[:, np.arange(hands_amount), worlds[:, :hands_amount]]
+    won_against_replaced = won[:, :, worlds[:, hands_amount]].transpose(0, 2, 1)
+    kept_scores = won_against_kept.sum(axis=2)
+    lost_by_reply = (won_against_kept & ~won_against_replaced).any(axis=2)
+    return (kept_scores - lost_by_reply).mean(axis=1)
+
+
+def best_last_move(decision: Decision, opponent_reply: str = RANDOM_REPLY) -> int | None:
+    """ Last move with the highest exact expected score, None when keeping every hand is best. """
+    option = int(np.argmax(last_move_equity(decision, opponent_reply)))
+    return None if option == 0 else option - 1
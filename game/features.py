@@ -0,0 +1,112 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from game.batch_scoring import CARD_NUMBERS, CARD_SUITS, EMPTY_SLOT, evaluate_hands, hand_values_to_base_values
+from game.card import Card
+from game.deck import Deck
+from game.game_state import CARDS_IN_HAND, HANDS_AMOUNT
+from game.hand_scoring import BASE_VALUE_WEIGHT, HandBaseValue
+
+BASE_VALUES = len(HandBaseValue)
+
+# Layout of the features of one hand, see `hand_features`
+OWN_BASE_VALUE = 0
+OWN_SIZE = OWN_BASE_VALUE + BASE_VALUES
+OWN_DRAWS = OWN_SIZE + CARDS_IN_HAND
+OTHER_BASE_VALUE = OWN_DRAWS + 6
+COMPARISON = OTHER_BASE_VALUE + BASE_VALUES
+FEATURES = COMPARISON + 4
+
+# Number index from 0 for a two to 12 for an ace, -1 for empty slots
+_NUMBER_INDICES = np.where(CARD_NUMBERS == 0, -1, (CARD_NUMBERS - 2) % 13).astype(np.int8)
+# Multiplying the unseen cards by it counts the unseen cards of each suit, then of each number
+_COUNTING = np.concatenate([np.tile(np.eye(4, dtype=np.float32), (13, 1)),
+                            np.repeat(np.eye(13, dtype=np.float32), 4, axis=0)], axis=1)
+_BASE_VALUE_RANGE = np.arange(BASE_VALUES, dtype=np.int8)
+_SIZE_RANGE = np.arange(1, CARDS_IN_HAND + 1)
+
+
+def unseen_cards(hands: np.ndarray, other_hands: np.ndarray, cards: np.ndarray) -> np.ndarray:
+    """ (games, 52) whether each card ordinal is neither in the player's hands, nor visible in the opponent's,
+    nor the card to play. """
+    games = len(cards)
+    seen = np.concatenate([hands.reshape(games, -1), other_hands.reshape(games, -1), cards[:, None]], axis=1)
+    unseen = np.ones((games, 53), dtype=bool)
+    unseen[np.arange(games)[:, None], seen] = False
+    return unseen[:, :52]
+
+
+def add_card(hands: np.ndarray, hand_sizes: np.ndarray, cards: np.ndarray) -> np.ndarray:
+    """ The hands of every game with the game's card added to each of them, full hands being left as they are. """
+    potential_hands = hands.copy()
+    games, hand_indices = np.nonzero(hand_sizes < CARDS_IN_HAND)
+    potential_hands[games, hand_indices, hand_sizes[games, hand_indices]] = cards[games]
+    return potential_hands
+
+
+def hand_features(hands: np.ndarray, hand_values: np.ndarray, other_hands: np.ndarray,
+                  unseen: np.ndarray) -> np.ndarray:
+    """ (games, hands, FEATURES) description of each hand against the opponent's hand in the same position:
+    the base value and size of the hand, how alive its flush, straight and pairs are given the unseen cards,
+    the base value of the opponent's visible cards, and how the two compare. """
+    games = len(hands)
+    rows = np.arange(games)[:, None]
+    is_empty = hands == EMPTY_SLOT
+    sizes = CARDS_IN_HAND - np.count_nonzero(is_empty, axis=2)
+    base_values = hand_values_to_base_values(hand_values)
+
+    suits = CARD_SUITS[hands]
+    numbers = _NUMBER_INDICES[hands]
+    # The extra last number count is zero, for the empty slots
+    counts = np.zeros((games, 4 + 13 + 1), dtype=np.float32)
+    counts[:, :-1] = unseen @ _COUNTING
+    suits_left, numbers_left = counts[:, :4], counts[:, 4:]
+    is_suited = ((suits == suits[..., :1]) | is_empty).all(axis=2)
+    sorted_numbers = np.sort(numbers, axis=2)
+    highest = sorted_numbers[..., -1]
+    lowest = np.where(is_empty, 13, numbers).min(axis=2)
+    # Empty slots are sorted first
+    is_distinct = ((np.diff(sorted_numbers, axis=2) != 0) | (sorted_numbers[..., :-1] < 0)).all(axis=2)
+    paired_left = numbers_left[rows[..., None], numbers].sum(axis=2)
+
+    # The visible cards of the opponent may come without the slot of the hidden fifth card
+    padding = np.full(other_hands.shape[:2] + (CARDS_IN_HAND - other_hands.shape[2],), EMPTY_SLOT, dtype=np.int8)
+    other_values = evaluate_hands(np.concatenate([other_hands, padding], axis=2))
+    other_base_values = hand_values_to_base_values(other_values)
+
+    features = np.empty((games, HANDS_AMOUNT, FEATURES), dtype=np.float32)
+    features[..., OWN_BASE_VALUE:OWN_SIZE] = base_values[..., None] == _BASE_VALUE_RANGE
+    features[..., OWN_SIZE:OWN_DRAWS] = sizes[..., None] == _SIZE_RANGE
+    features[..., OWN_DRAWS] = is_suited
+    features[..., OWN_DRAWS + 1] = is_suited * suits_left[rows, suits[..., 0]] / 13
+    features[..., OWN_DRAWS + 2] = is_distinct & (highest - lowest < CARDS_IN_HAND)
+    features[..., OWN_DRAWS + 3] = paired_left / (3 * CARDS_IN_HAND)
+    features[..., OWN_DRAWS + 4] = highest / 12
+    features[..., OWN_DRAWS + 5] = sizes.sum(axis=1, keepdims=True) / (HANDS_AMOUNT * CARDS_IN_HAND)
+    features[..., OTHER_BASE_VALUE:COMPARISON] = other_base_values[..., None] == _BASE_VALUE_RANGE
+    features[..., COMPARISON] = hand_values > other_values
+    features[..., COMPARISON + 1] = (base_values - other_base_values) / BASE_VALUES
+    features[..., COMPARISON + 2] = _NUMBER_INDICES[other_hands].max(axis=2) / 12
+    features[..., COMPARISON + 3] = 1
+    return features
+
+
+def own_hand_features(cards: List[Card], value: int, other_value: int, deck: Deck,
+                      player: bool) -> List[Tuple[int, float]]:
+    """ The non-zero `hand_features` of one hand as (index, value) pairs, leaving out those that do not depend on
+    the hand, so that placements are compared without building arrays. """
+    base_value = value // BASE_VALUE_WEIGHT
+    numbers = sorted((card.number - 2) % 13 for card in cards)
+    features = [(OWN_BASE_VALUE + base_value, 1.0), (OWN_SIZE + len(cards) - 1, 1.0),
+                (OWN_DRAWS + 3, sum(deck.get_number_left(card.number, player) for card in cards)
+                 / (3 * CARDS_IN_HAND)),
+                (OWN_DRAWS + 4, numbers[-1] / 12),
+                (COMPARISON, float(value > other_value)),
+                (COMPARISON + 1, base_value / BASE_VALUES)]
+    suit = cards[0].suit
+    if all(card.suit == suit for card in cards):
+        features += [(OWN_DRAWS, 1.0), (OWN_DRAWS + 1, deck.get_suit_left(suit, player) / 13)]
+    if len(set(numbers)) == len(cards) and numbers[-1] - numbers[0] < CARDS_IN_HAND:
+        features.append((OWN_DRAWS + 2, 1.0))
+    return features
@@ -0,0 +1,110 @@
+from typing import List, Tuple
+
+from game.card import Card, CARDS
+from game.hand import Hand
+from game.hand_scoring import evaluate_hand
+
+HANDS_AMOUNT = 5
+CARDS_IN_HAND = 5
+DEALT_CARDS = 2 * HANDS_AMOUNT
+LAST_MOVES_TURN = DEALT_CARDS + 40
+FINAL_TURN = LAST_MOVES_TURN + 2
+
+
+class GameState:
+    """ Compact game state of card ordinals, moves are applied and undone in place for search. """
+    __slots__ = ("cards", "hands", "turn", "_history")
+
+    def __init__(self, cards: List[int], hands: List[List[List[int]]] = None, turn: int = 0):
+        self.cards: List[int] = cards  # draw pile, next card last like `Deck`
+        self.hands: List[List[List[int]]] = hands if hands is not None else [[[] for _ in range(HANDS_AMOUNT)]
+                                                                                for _ in range(2)]
+        self.turn: int = turn  # cards drawn: the deal, then 40 placements, then the two last moves
+        self._history: List[int | None] = []
+
+    @staticmethod
+    def from_cards(cards: List[Card]) -> "GameState":
+        return GameState([card.ordinal for card in cards])
+
+    @staticmethod
+    def from_hands(cards_left: List[Card], player1_hands: List[Hand], player2_hands: List[Hand]) -> "GameState":
+        hands = [[[card.ordinal for card in hand.get_cards(hand.player)] for hand in player_hands]
+                 for player_hands in [player1_hands, player2_hands]]
+        return GameState([card.ordinal for card in cards_left], hands,
+                         sum(len(hand) for hand in player1_hands + player2_hands))
+
+    @property
+    def current_player(self) -> int:
+        """ 0 for the first player, 1 for the second. """
+        return self.turn % 2
+
+    @property
+    def is_over(self) -> bool:
+        return self.turn == FINAL_TURN
+
+    def legal_moves(self) -> List[int | None]:
+        if self.turn < DEALT_CARDS:
+            return [self.turn // 2]
+        if self.turn >= LAST_MOVES_TURN:
+            return [None] + list(range(HANDS_AMOUNT))
+
+        hands = self.hands[self.current_player]
+        min_number_of_cards = min(len(hand) for hand in hands)
+        return [hand_index for hand_index, hand in enumerate(hands) if len(hand) == min_number_of_cards]
+
+    def apply(self, move: int | None) -> None:
+        """ Draw the next card and place it in hand `move`, or on the last moves replace that hand's last card. """
+        card = self.cards.pop()
+        hands = self.hands[self.current_player]
+        if self.turn < LAST_MOVES_TURN:
+            hands[move].append(card)
+            self._history.append(move)
+            self._history.append(None)
+        elif move is None:
+            self._history.append(None)
+            self._history.append(card)
+        else:
+            self._history.append(move)
+            self._history.append(hands[move][-1])
+            hands[move][-1] = card
+        self.turn += 1
+
+    def undo(self) -> None:
+        self.turn -= 1
+        previous_card = self._history.pop()
+        move = self._history.pop()
+        hands = self.hands[self.current_player]
+        if self.turn < LAST_MOVES_TURN:
+            self.cards.append(hands[move].pop())
+        elif move is None:
+            self.cards.append(previous_card)
+        else:
+            self.cards.append(hands[move][-1])
+            hands[move][-1] = previous_card
+
+    def snapshot(self) -> int:
+        return len(self._history)
+
+    def restore(self, snapshot: int) -> None:
+        while len(self._history) > snapshot:
+            self.undo()
+
+    def copy(self) -> "GameState":
+        return GameState(list(self.cards), [[list(hand) for hand in hands] for hands in self.hands], self.turn)
+
+    def visible_hand(self, player: int, owner: int, hand_index: int) -> List[int]:
+        hand = self.hands[owner][hand_index]
+        return hand if player == owner else hand[:4]
+
+    def unseen_cards(self, player: int) -> List[int]:
+        """ The draw pile and the opponent's hidden fifth cards. """
+        hidden_cards = [hand[4] for hand in self.hands[1 - player] if len(hand) == CARDS_IN_HAND]
+        return self.cards + hidden_cards
+
+    def hand_value(self, player: int, hand_index: int) -> int:
+        return evaluate_hand([CARDS[ordinal] for ordinal in self.hands[player][hand_index]])
+
+    def scores(self) -> Tuple[int, int]:
+        player1_score = sum(self.hand_value(0, hand_index) > self.hand_value(1, hand_index)
+                            for hand_index in range(HANDS_AMOUNT))
+        return player1_score, HANDS_AMOUNT - player1_score
@@ -1,6 +1,7 @@
 from typing import List
 
-from game.card import Card
+from game.card import Card, Suit
+from game.hand_scoring import HandBaseValue, RANK_PRIMES, evaluate_hand, lookup_hand_value, hand_value_to_base_value
 
 
 class Hand:
@@ -9,13 +10,38 @@ class Hand:
         self._cards: List[Card] = []
         self._values: List[int] = []
 
+        # Scoring state kept up to date card by card, the rank key being the product of the numbers' primes
+        self._rank_key: int = 1
+        self._suit_counts: List[int] = [0, 0, 0, 0]
+        self._value: int = 0
+        self._visible_value: int = 0
+
         if cards is not None:
             self.add_cards(cards)
 
+    def _insert_value(self, number: int) -> None:
+        index = 0
+        while index < len(self._values) and self._values[index] >= number:
+            index += 1
+        self._values.insert(index, number)
+
+    def _lookup_value(self, rank_key: int, is_flush: bool, extra_card: Card | None = None) -> int:
+        value = lookup_hand_value(rank_key, is_flush, self._cards, extra_card)
+        if value is None:
+            return evaluate_hand(self._cards + [extra_card] if extra_card is not None else self._cards)
+        return value
+
     def add_card(self, card: Card) -> None:
         self._cards.append(card)
-        self._values.append(card.number)
-        self._values.sort(reverse=True)
+        self._insert_value(card.number)
+
+        self._rank_key *= RANK_PRIMES[card.number]
+        self._suit_counts[card.suit] += 1
+        if len(self._cards) == 5:
+            self._visible_value = self._value
+        self._value = self._lookup_value(self._rank_key, self._suit_counts[card.suit] == 5)
+        if len(self._cards) < 5:
+            self._visible_value = self._value
 
     def add_cards(self, cards: List[Card]) -> None:
         for card in cards:
@@ -26,8 +52,14 @@ class Hand:
         self._cards[-1] = new_card
 
         self._values.remove(replaced_card.number)
-        self._values.append(new_card.number)
-        self._values.sort(reverse=True)
+        self._insert_value(new_card.number)
+
+        self._rank_key = self._rank_key // RANK_PRIMES[replaced_card.number] * RANK_PRIMES[new_card.number]
+        self._suit_counts[replaced_card.suit] -= 1
+        self._suit_counts[new_card.suit] += 1
+        self._value = self._lookup_value(self._rank_key, self._suit_counts[new_card.suit] == 5)
+        if len(self._cards) < 5:
+            self._visible_value = self._value
 
     def get_cards(self, player: bool) -> List[Card]:
         if self.player == player:
@@ -39,6 +71,26 @@ class Hand:
             return self._values
         return sorted([card.number for card in self.get_cards(player)], reverse=True)
 
+    def get_value(self, player: bool) -> int:
+        """ The `evaluate_hand` value of the cards `player` can see. """
+        if self.player == player:
+            return self._value
+        return self._visible_value
+
+    def get_base_value(self, player: bool) -> HandBaseValue:
+        return hand_value_to_base_value(self.get_value(player))
+
+    def get_value_with(self, card: Card) -> int:
+        """ The `evaluate_hand` value of the full hand if `card` were added to it. """
+        is_flush = len(self._cards) == 4 and self._suit_counts[card.suit] == 4
+        return self._lookup_value(self._rank_key * RANK_PRIMES[card.number], is_flush, card)
+
+    def get_suit_count(self, suit: Suit) -> int:
+        return self._suit_counts[suit]
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
     # Note: repr full state of the hand for both players
     def __repr__(self) -> str:
         return " ".join([str(card) for card in self._cards])
@@ -0,0 +1,86 @@
+from functools import lru_cache
+from math import comb
+from typing import Dict, Iterator, List, Tuple
+
+from game.card import Card
+from game.deck import Deck
+from game.hand_scoring import HandBaseValue, RANK_PRIMES, RANK_TABLE, FLUSH_TABLE, calculate_hand_base_value
+from game.suit_isomorphism import cards_mask, suit_masks
+
+
+# Bit of each number in the card masks of `suit_masks`
+_NUMBER_BITS = [0] + [1 << (number - 2) % 13 * 4 for number in range(1, 14)]
+
+
+def _draws(rank_counts: Tuple[int, ...], cards_to_draw: int, number: int = 1) -> Iterator[Tuple[int, int, int]]:
+    """ Yield (drawn numbers mask, rank key, ways) for every multiset of numbers drawn from `rank_counts`. """
+    if cards_to_draw == 0:
+        yield 0, 1, 1
+        return
+    if number > 13:
+        return
+
+    number_left = rank_counts[number - 1]
+    for drawn in range(min(number_left, cards_to_draw) + 1):
+        for mask, rank_key, ways in _draws(rank_counts, cards_to_draw - drawn, number + 1):
+            yield ((mask | _NUMBER_BITS[number]) if drawn == 1 else mask if drawn == 0 else -1,
+                   rank_key * RANK_PRIMES[number] ** drawn, ways * comb(number_left, drawn))
+
+
+@lru_cache(maxsize=1 << 16)
+def _completion_odds(hand_rank_key: int, cards_to_draw: int, flush_masks: Tuple[int, ...],
+                     rank_counts: Tuple[int, ...]) -> Tuple[Tuple[HandBaseValue, float], ...]:
+    total_ways = comb(sum(rank_counts), cards_to_draw)
+    odds: Dict[HandBaseValue, int] = {}
+
+    for drawn_mask, drawn_rank_key, ways in _draws(rank_counts, cards_to_draw):
+        rank_key = hand_rank_key * drawn_rank_key
+
+        # Draws of distinct numbers that all remain in a suit the hand can still flush in
+        flush_ways = 0
+        if drawn_mask != -1:
+            flush_ways = sum(1 for flush_mask in flush_masks if drawn_mask & flush_mask == drawn_mask)
+        if flush_ways:
+            flush_base_value = FLUSH_TABLE[rank_key][0]
+            odds[flush_base_value] = odds.get(flush_base_value, 0) + flush_ways
+
+        entry = RANK_TABLE.get(rank_key)
+        if entry is not None and ways > flush_ways:
+            odds[entry[0]] = odds.get(entry[0], 0) + ways - flush_ways
+
+    return tuple(sorted((base_value, ways / total_ways) for base_value, ways in odds.items()))
+
+
+def completion_odds(cards: List[Card], cards_left: List[Card]) -> Dict[HandBaseValue, float]:
+    """ Exact probability of each final HandBaseValue when the hand is completed to five cards drawn
+    uniformly from `cards_left`. """
+    cards_to_draw = 5 - len(cards)
+    if cards_to_draw <= 0:
+        return {calculate_hand_base_value(cards): 1.0}
+    if cards_to_draw > len(cards_left):
+        raise ValueError(f"cannot draw {cards_to_draw} cards out of {len(cards_left)}")
+
+    hand_rank_key = 1
+    for card in cards:
+        hand_rank_key *= RANK_PRIMES[card.number]
+
+    rank_counts = [0] * 13
+    for card in cards_left:
+        rank_counts[card.number - 1] += 1
+
+    # Only the numbers left in the suits the hand can still flush in matter, not which suits those are
+    hand_suit_masks = suit_masks(cards_mask(cards))
+    flush_masks = [suit_cards_left & ~hand_suit_mask
+                   for hand_suit_mask, suit_cards_left in zip(hand_suit_masks, suit_masks(cards_mask(cards_left)))
+                   if hand_suit_mask.bit_count() == len(cards)]
+
+    return dict(_completion_odds(hand_rank_key, cards_to_draw, tuple(sorted(flush_masks)), tuple(rank_counts)))
+
+
+def hand_completion_odds(cards: List[Card], deck: Deck, player: bool) -> Dict[HandBaseValue, float]:
+    return completion_odds(cards, deck.get_cards_left(player))
+
+
+def flush_completion_probability(cards_to_draw: int, suit_cards_left: int, cards_left_amount: int) -> float:
+    """ Exact probability that a single-suited hand completes to a flush or straight flush. """
+    return comb(suit_cards_left, cards_to_draw) / comb(cards_left_amount, cards_to_draw)
@@ -1,6 +1,7 @@
 from copy import deepcopy
 from enum import IntEnum
-from typing import List
+from itertools import combinations_with_replacement
+from typing import List, Dict, Tuple
 
 from game import Card
 from game.card import Suit
@@ -67,7 +68,7 @@ def get_highest_single_card(cards: List[Card]) -> Card | None:
     return max(cards_repeat_once)
 
 
-def calculate_hand_base_value(cards: List[Card]) -> HandBaseValue:
+def _calculate_hand_base_value_by_rules(cards: List[Card]) -> HandBaseValue:
     if len(cards) == 0:
         return HandBaseValue.ILLEGAL
     if len(cards) == 0:
@@ -176,22 +177,168 @@ def extend_hand_base_value(base_value: HandBaseValue, cards: List[Card]) -> List
         ]
 
 
+def _compute_hand_value_by_rules(cards: List[Card]) -> int:
+    base_value = _calculate_hand_base_value_by_rules(cards)
+    return factors_to_int(base_value, extend_hand_base_value(base_value, cards))
+
+
+# Hands are ranked by a single integer: the base value followed by up to four two-digit factors, the same
+# digits `factors_to_float` spreads after the decimal point.
+FACTOR_BASE = 100
+FACTORS_AMOUNT = 4
+BASE_VALUE_WEIGHT = FACTOR_BASE ** FACTORS_AMOUNT
+
+# Each number maps to a prime, so the product of a hand's primes identifies its numbers regardless of order.
+RANK_PRIMES = [0, 41, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+
+# The factor holding a suit tiebreak for each base value, filled in after the table lookup.
+SUIT_FACTOR_INDEX = {
+    HandBaseValue.HIGHEST_CARD: 1,
+    HandBaseValue.PAIR: 2,
+    HandBaseValue.TWO_PAIR: 3,
+    HandBaseValue.FLUSH: 1,
+    HandBaseValue.STRAIGHT_FLUSH: 1,
+}
+FLUSH_SUIT = 0
+
+_BASE_VALUES = list(HandBaseValue)
+
+# (base value, hand value without the suit factor, number of the card whose suit breaks ties, suit weight)
+TableEntry = Tuple[HandBaseValue, int, int | None, int]
+
+
+def factors_to_int(base_value: HandBaseValue, factors: List[int | Suit]) -> int:
+    value = int(base_value)
+    for index in range(FACTORS_AMOUNT):
+        value = value * FACTOR_BASE + (int(factors[index]) if index < len(factors) else 0)
+    return value
+
+
+def hand_value_to_factors(hand_value: int) -> List[int]:
+    factors = []
+    for _ in range(FACTORS_AMOUNT):
+        hand_value, factor = divmod(hand_value, FACTOR_BASE)
+        factors.append(factor)
+    return factors[::-1]
+
+
+def _create_table_entry(cards: List[Card]) -> TableEntry | None:
+    try:
+        base_value = _calculate_hand_base_value_by_rules(cards)
+        factors = extend_hand_base_value(base_value, cards)
+    except AttributeError:  # five cards of the same number, impossible with a single deck
+        return None
+
+    suit_number = None
+    suit_weight = 0
+    suit_factor_index = SUIT_FACTOR_INDEX.get(base_value)
+    if suit_factor_index is not None:
+        if base_value in (HandBaseValue.FLUSH, HandBaseValue.STRAIGHT_FLUSH):
+            suit_number = FLUSH_SUIT
+        else:
+            highest_single_card = get_highest_single_card(cards)
+            suit_number = highest_single_card.number if highest_single_card is not None else None
+        factors = list(factors)
+        factors[suit_factor_index] = 0
+        suit_weight = FACTOR_BASE ** (FACTORS_AMOUNT - 1 - suit_factor_index)
+
+    return base_value, factors_to_int(base_value, factors), suit_number, suit_weight
+
+
+def _build_rank_tables() -> Tuple[Dict[int, TableEntry], Dict[int, TableEntry]]:
+    rank_table = {}
+    flush_table = {}
+    suits = list(Suit)
+    for cards_amount in range(1, 6):
+        for numbers in combinations_with_replacement(range(1, 14), cards_amount):
+            key = 1
+            for number in numbers:
+                key *= RANK_PRIMES[number]
+
+            # Cycling the suits keeps five-card hands from being a flush
+            entry = _create_table_entry([Card(suits[index % 4], number) for index, number in enumerate(numbers)])
+            if entry is not None:
+                rank_table[key] = entry
+
+            if cards_amount == 5 and len(set(numbers)) == 5:
+                flush_table[key] = _create_table_entry([Card(Suit.CLUBS, number) for number in numbers])
+
+    return rank_table, flush_table
+
+
+RANK_TABLE, FLUSH_TABLE = _build_rank_tables()
+
+
+def lookup_hand_value(rank_key: int, is_flush: bool, cards: List[Card], extra_card: Card | None = None) -> int | None:
+    """ Look up the value of `cards` plus an optional `extra_card`, given their combined rank key. """
+    entry = (FLUSH_TABLE if is_flush else RANK_TABLE).get(rank_key)
+    if entry is None:
+        return None
+
+    _, hand_value, suit_number, suit_weight = entry
+    if suit_number == FLUSH_SUIT:
+        hand_value += int((cards[0] if cards else extra_card).suit) * suit_weight
+    elif suit_number is not None:
+        for card in cards:
+            if card.number == suit_number:
+                return hand_value + int(card.suit) * suit_weight
+        hand_value += int(extra_card.suit) * suit_weight
+    return hand_value
+
+
+def evaluate_hand(cards: List[Card]) -> int:
+    """ Rank a hand as one integer, a higher value beats a lower one exactly like `has_better_cards`. """
+    cards_amount = len(cards)
+    if cards_amount == 0:
+        return 0
+    if cards_amount > 5:
+        return _compute_hand_value_by_rules(cards)
+
+    first_suit = cards[0].suit
+    is_flush = cards_amount == 5
+    rank_key = 1
+    for card in cards:
+        rank_key *= RANK_PRIMES[card.number]
+        if card.suit != first_suit:
+            is_flush = False
+
+    hand_value = lookup_hand_value(rank_key, is_flush, cards)
+    if hand_value is None:
+        return _compute_hand_value_by_rules(cards)
+    return hand_value
+
+
+def hand_value_to_base_value(hand_value: int) -> HandBaseValue:
+    return _BASE_VALUES[hand_value // BASE_VALUE_WEIGHT]
+
+
+def calculate_hand_base_value(cards: List[Card]) -> HandBaseValue:
+    return hand_value_to_base_value(evaluate_hand(cards))
+
+
+def hand_value_to_float(hand_value: int) -> float:
+    if hand_value == 0:
+        return 0
+    return hand_value // BASE_VALUE_WEIGHT + factors_to_float(hand_value_to_factors(hand_value))
+
+
 def compute_full_value(cards: List[Card]) -> float:
-    base_value = calculate_hand_base_value(cards)
-    return int(base_value) + factors_to_float(extend_hand_base_value(base_value, cards))
+    return hand_value_to_float(evaluate_hand(cards))
 
 
 def has_better_cards(cards: List[Card], compared_cards: List[Card]) -> bool:
-    cards_base_value = calculate_hand_base_value(cards)
-    compared_base_value = calculate_hand_base_value(compared_cards)
-    if cards_base_value == compared_base_value:
-        return (factors_to_float(extend_hand_base_value(cards_base_value, cards)) >
-                factors_to_float(extend_hand_base_value(compared_base_value, compared_cards)))
-    return cards_base_value > compared_base_value
+    return evaluate_hand(cards) > evaluate_hand(compared_cards)
 
 
 def get_potential_strength(starting_cards: List[Card], card: Card) -> HandBaseValue:
-    cards = starting_cards + [card]
-    hand_strength = calculate_hand_base_value(cards)
-    cards.remove(card)
-    return hand_strength
+    rank_key = RANK_PRIMES[card.number]
+    is_flush = len(starting_cards) == 4
+    for starting_card in starting_cards:
+        rank_key *= RANK_PRIMES[starting_card.number]
+        if starting_card.suit != card.suit:
+            is_flush = False
+
+    hand_value = lookup_hand_value(rank_key, is_flush, starting_cards, card)
+    if hand_value is None:
+        hand_value = evaluate_hand(starting_cards + [card])
+    return hand_value_to_base_value(hand_value)
@@ -0,0 +1,66 @@
+import json
+from game.card import Card, Suit
+from game.deck import Deck
+from game.decision import Decision, legal_moves
+from game.hand import Hand
+
+NUMBER_CODES = "A23456789TJQK"
+SUIT_CODES = "CDHS"
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def is_legal_move(played_hand: object, decision: Decision) -> bool:
+    """ Whether a decoded move is a hand index, or None, legal in `decision`. Moves are compared by type first,
+    so that 1.0 or true are not taken for hand 1. """
+    return (played_hand is None or type(played_hand) is int) and played_hand in legal_moves(decision)
+
+
+def card_to_code(card: Card) -> str:
+    """ Two letters naming the card, as "AS" for the ace of spades or "TD" for the ten of diamonds. """
+    return NUMBER_CODES[card.number - 1] + SUIT_CODES[card.suit]
+
+
+def code_to_card(code: str) -> Card:
+    if len(code) != 2 or code[0] not in NUMBER_CODES or code[1] not in SUIT_CODES:
+        raise ProtocolError(f"unknown card {code!r}")
+    return Card(Suit(SUIT_CODES.index(code[1])), NUMBER_CODES.index(code[0]) + 1)
+
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    try:
+        message = json.loads(line)
+    except ValueError as error:
+        raise ProtocolError(f"invalid message {line[:80]!r}") from error
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError(f"message without a type {line[:80]!r}")
+    return message
+
+
+def encode_decision(decision: Decision, game_id: int) -> dict:
+    """ The decision as seen by the player asked, the opponent's hidden cards left out. """
+    player = decision.is_first_player
+    return {
+        "type": "last_move" if decision.is_last_move else "move",
+        "game": game_id,
+        "first_player": player,
+        "card": card_to_code(decision.card),
+        "hands": [[card_to_code(card) for card in hand.get_cards(player)] for hand in decision.hands],
+        "other_hands": [[card_to_code(card) for card in hand.get_cards(player)] for hand in decision.other_hands],
+        "cards_left": [card_to_code(card) for card in decision.deck.get_cards_left(player)],
+    }
+
+
+def decode_decision(message: dict) -> Decision:
+    """ Rebuild a decision from its message, the opponent's hands holding only their visible cards. """
+    player = bool(message["first_player"])
+    hands = [Hand(player, [code_to_card(code) for code in cards]) for cards in message["hands"]]
+    other_hands = [Hand(not player, [code_to_card(code) for code in cards]) for cards in message["other_hands"]]
+    deck = Deck([code_to_card(code) for code in message["cards_left"]])
+    return Decision(player, code_to_card(message["card"]), hands, other_hands, deck, message["type"] == "last_move")
@@ -0,0 +1,88 @@
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
+
+from game.card import CARDS, Card
+
+# Renaming suits keeps base values and probabilities, which are what these helpers are for, as in `hand_odds`.
+# Hand values break ties by suit, so decisions comparing them are not the same under a permutation of the suits.
+
+# The canonical suit of each suit, by suit value
+SuitPermutation = Tuple[int, ...]
+IDENTITY: SuitPermutation = (0, 1, 2, 3)
+
+# Card masks have a bit per card ordinal, these bits holding the cards of the first suit
+SUIT_MASK = sum(1 << ordinal for ordinal in range(0, 52, 4))
+
+
+def cards_mask(cards: Iterable[Card]) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.ordinal
+    return mask
+
+
+def mask_cards(mask: int) -> List[Card]:
+    return [CARDS[ordinal] for ordinal in range(52) if mask >> ordinal & 1]
+
+
+def suit_masks(mask: int) -> List[int]:
+    """ The cards of each suit in `mask`, shifted to the bits of the first suit. """
+    return [mask >> suit & SUIT_MASK for suit in range(4)]
+
+
+@lru_cache(maxsize=None)
+def _suits_mask(masks_amount: int) -> int:
+    return sum(SUIT_MASK << 52 * index for index in range(masks_amount))
+
+
+def _suit_signatures(masks: Sequence[int]) -> List[int]:
+    """ The cards of each suit in every mask, as one number comparing like the tuple of the masks would. """
+    combined = 0
+    for mask in masks:
+        combined = combined << 52 | mask
+    suits_mask = _suits_mask(len(masks))
+    return [combined >> suit & suits_mask for suit in range(4)]
+
+
+def suit_permutation(masks: Sequence[int]) -> SuitPermutation:
+    """ The permutation taking the card masks, together, to the representative of their class: suits are ordered
+    by their cards in the first mask, then in the next ones. Masks differing only by a permutation of the suits
+    get the same canonical masks. """
+    signatures = _suit_signatures(masks)
+    permutation = [0] * 4
+    for canonical_suit, suit in enumerate(sorted(range(4), key=signatures.__getitem__, reverse=True)):
+        permutation[suit] = canonical_suit
+    return tuple(permutation)
+
+
+def inverse_permutation(permutation: SuitPermutation) -> SuitPermutation:
+    inverse = [0] * 4
+    for suit, canonical_suit in enumerate(permutation):
+        inverse[canonical_suit] = suit
+    return tuple(inverse)
+
+
+def permute_mask(mask: int, permutation: SuitPermutation) -> int:
+    permuted = 0
+    for suit, canonical_suit in enumerate(permutation):
+        permuted |= (mask >> suit & SUIT_MASK) << canonical_suit
+    return permuted
+
+
+def permute_card(card: Card, permutation: SuitPermutation) -> Card:
+    suit = int(card.suit)
+    return CARDS[card.ordinal - suit + permutation[suit]]
+
+
+def canonical_masks(masks: Sequence[int]) -> Tuple[Tuple[int, ...], SuitPermutation]:
+    """ The representative of the card masks up to suit isomorphism, and the permutation taking them to it. """
+    permutation = suit_permutation(masks)
+    return tuple(permute_mask(mask, permutation) for mask in masks), permutation
+
+
+def canonicalize_cards(*card_groups: Sequence[Card]) -> Tuple[List[List[Card]], SuitPermutation]:
+    """ The card groups with their suits renamed as in the representative of their class, keeping the order of the
+    cards, and the permutation applied. Base values and probabilities computed over the representative map back to
+    the original cards with `inverse_permutation`, hand values do not. """
+    permutation = suit_permutation([cards_mask(cards) for cards in card_groups])
+    return [[permute_card(card, permutation) for card in cards] for cards in card_groups], permutation
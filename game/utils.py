@@ -1,9 +1,29 @@
 from typing import List
 
+import numpy as np
+
+from game.card import Card
 from game.hand import Hand
+from game.hand_scoring import HandBaseValue, hand_value_to_base_value
 
 
 def get_playable_hands(hands: List[Hand]) -> List[Hand]:
-    hand_with_minimum_cards = min(hands, key=lambda hand: len(hand.get_cards(hand.player)))
-    min_number_of_cards = len(hand_with_minimum_cards.get_cards(hand_with_minimum_cards.player))
-    return [hand for hand in hands if len(hand.get_cards(hand.player)) == min_number_of_cards]
+    min_number_of_cards = min(len(hand) for hand in hands)
+    return [hand for hand in hands if len(hand) == min_number_of_cards]
+
+
+def get_potential_values(hands: List[Hand], card: Card) -> List[int | None]:
+    """ The value each hand would have with `card` added, None for full hands that cannot take it. """
+    return [hand.get_value_with(card) if len(hand) < 5 else None for hand in hands]
+
+
+def get_potential_strengths(hands: List[Hand], card: Card) -> List[HandBaseValue | None]:
+    return [hand_value_to_base_value(hand.get_value_with(card)) if len(hand) < 5 else None for hand in hands]
+
+
+def spawn_generators(seed: int | np.random.SeedSequence | None, amount: int) -> List[np.random.Generator]:
+    seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    # Children are derived from the spawn key instead of `spawn`, so the same seed always gives the same streams
+    return [np.random.default_rng(np.random.SeedSequence(seed_sequence.entropy,
+                                                         spawn_key=seed_sequence.spawn_key + (index,)))
+            for index in range(amount)]
@@ -0,0 +1,154 @@
+import json
+import os
+import struct
+from typing import BinaryIO, Iterator, List, Tuple
+
+import numpy as np
+
+from game import Card, Deck, Hand
+from game.batch_scoring import EMPTY_SLOT
+from game.card import CARDS
+from players import ScriptedPokerAi
+from run_game import GameResult, run_game
+
+LOG_MAGIC = b"CPGLOG1\n"
+HEADER_LENGTH_FORMAT = "<I"
+NO_LAST_MOVE = 255
+
+# One fixed-size record per game, the deck being the card ordinals in the order they were dealt:
+# 10 first cards alternating between the players, the 40 placed cards and the 2 last cards
+RECORD_DTYPE = np.dtype([
+    ("deck", np.uint8, (52,)),
+    ("moves", np.uint8, (40,)),  # hand index of each placed card, player 1 on even turns
+    ("last_moves", np.uint8, (2,)),  # replaced hand of each player or NO_LAST_MOVE
+    ("scores", np.uint8, (2,)),
+    ("base_values", np.uint8, (2, 5)),  # HandBaseValue of each final hand
+])
+
+Move = Tuple[Card, int]
+
+
+def _read_header(log_file: BinaryIO) -> Tuple[dict, int]:
+    """ Return the header and the offset of the first record. """
+    if log_file.read(len(LOG_MAGIC)) != LOG_MAGIC:
+        raise ValueError(f"{log_file.name} is not a game log")
+    (header_length,) = struct.unpack(HEADER_LENGTH_FORMAT, log_file.read(struct.calcsize(HEADER_LENGTH_FORMAT)))
+    header = json.loads(log_file.read(header_length))
+    return header, len(LOG_MAGIC) + struct.calcsize(HEADER_LENGTH_FORMAT) + header_length
+
+
+class GameLogWriter:
+    """ Writes games to a log file of fixed-size records, all played by the same pair of AIs. An existing log is
+    replaced, unless `append` adds the games after its records. """
+
+    def __init__(self, file_name: str, player_names: Tuple[str, str], buffer_size: int = 1024,
+                 append: bool = False):
+        self.file_name: str = file_name
+        self.player_names: Tuple[str, str] = tuple(player_names)
+
+        if append and os.path.exists(file_name) and os.path.getsize(file_name) > 0:
+            with open(file_name, "rb") as log_file:
+                header, records_offset = _read_header(log_file)
+            if tuple(header["players"]) != self.player_names:
+                raise ValueError(f"{file_name} logs {header['players']}, not {list(self.player_names)}")
+            if (os.path.getsize(file_name) - records_offset) % RECORD_DTYPE.itemsize:
+                raise ValueError(f"{file_name} ends with a partial record")
+            self._file: BinaryIO = open(file_name, "ab")
+        else:
+            self._file = open(file_name, "wb")
+            header = json.dumps({"version": 1, "players": list(self.player_names)}).encode()
+            self._file.write(LOG_MAGIC + struct.pack(HEADER_LENGTH_FORMAT, len(header)) + header)
+
+        self._buffer: np.ndarray = np.zeros(buffer_size, dtype=RECORD_DTYPE)
+        self._buffered: int = 0
+
+    def record_game(self, player1_hands: List[Hand], player2_hands: List[Hand], moves: List[Move],
+                    last_moves: List[Move | Tuple[Card, None]], result: GameResult) -> None:
+        record = self._buffer[self._buffered]
+        first_cards = [card for hands in zip(player1_hands, player2_hands) for card in
+                       (hands[0].get_cards(True)[0], hands[1].get_cards(False)[0])]
+        record["deck"] = [card.ordinal for card in first_cards + [card for card, _ in moves + last_moves]]
+        record["moves"] = [hand_index for _, hand_index in moves]
+        record["last_moves"] = [NO_LAST_MOVE if hand_index is None else hand_index for _, hand_index in last_moves]
+        record["scores"] = result.player_scores
+        record["base_values"] = [[hand.get_base_value(True) for hand in player1_hands],
+                                 [hand.get_base_value(False) for hand in player2_hands]]
+
+        self._buffered += 1
+        if self._buffered == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        self._file.write(self._buffer[:self._buffered].tobytes())
+        self._file.flush()
+        self._buffered = 0
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GameLogReader:
+    """ Memory-maps the records of a game log, so only the games looked at are read from disk. """
+
+    def __init__(self, file_name: str):
+        self.file_name: str = file_name
+        with open(file_name, "rb") as log_file:
+            header, records_offset = _read_header(log_file)
+        self.player_names: Tuple[str, str] = tuple(header["players"])
+
+        games = (os.path.getsize(file_name) - records_offset) // RECORD_DTYPE.itemsize
+        self.records: np.ndarray = (np.memmap(file_name, dtype=RECORD_DTYPE, mode="r", offset=records_offset,
+                                              shape=(games,))
+                                    if games else np.zeros(0, dtype=RECORD_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def chunks(self, chunk_size: int = 100_000) -> Iterator[np.ndarray]:
+        for first_game in range(0, len(self.records), chunk_size):
+            yield self.records[first_game:first_game + chunk_size]
+
+    def replay(self, game_index: int, verbose: bool = False) -> GameResult:
+        return replay_game(self.records[game_index], verbose)
+
+
+def replay_game(record: np.void, verbose: bool = False) -> GameResult:
+    """ Play a recorded game again through `run_game`. """
+    # Deck pops from the end of its initial cards
+    deck = Deck([CARDS[ordinal] for ordinal in record["deck"][::-1]])
+    last_moves = [None if move == NO_LAST_MOVE else int(move) for move in record["last_moves"]]
+    player1_ai = ScriptedPokerAi(True, record["moves"][0::2], last_moves[0])
+    player2_ai = ScriptedPokerAi(False, record["moves"][1::2], last_moves[1])
+    return run_game(player1_ai, player2_ai, verbose=verbose, deck=deck)
+
+
+def records_to_hands(records: np.ndarray) -> np.ndarray:
+    """ The final hands of the recorded games as (games, players, hands, cards) card ordinals. """
+    games = len(records)
+    rows = np.arange(games)
+    deck = records["deck"].astype(np.int8)
+    moves = records["moves"].astype(np.intp)
+    last_moves = records["last_moves"].astype(np.intp)
+
+    hands = np.full((games, 2, 5, 5), EMPTY_SLOT, dtype=np.int8)
+    hands[:, 0, :, 0] = deck[:, 0:10:2]
+    hands[:, 1, :, 0] = deck[:, 1:10:2]
+    hand_sizes = np.ones((games, 2, 5), dtype=np.intp)
+    for turn in range(40):
+        player = turn % 2
+        played_hands = moves[:, turn]
+        hands[rows, player, played_hands, hand_sizes[rows, player, played_hands]] = deck[:, 10 + turn]
+        hand_sizes[rows, player, played_hands] += 1
+
+    for player in range(2):
+        replaced_games = np.nonzero(last_moves[:, player] != NO_LAST_MOVE)[0]
+        hands[replaced_games, player, last_moves[replaced_games, player], -1] = deck[replaced_games, 50 + player]
+    return hands
@@ -0,0 +1,266 @@
+import argparse
+import asyncio
+import itertools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from game import Decision, Deck, spawn_generators
+from game.protocol import ProtocolError, decode_message, encode_decision, encode_message, is_legal_move
+from players import AI_TYPES, PokerAi
+from run_game import GameResult, play_game_steps
+from tournament import TournamentResult, game_seed
+
+# AIs slow enough that their moves are played in the executor rather than on the event loop
+OFFLOADED_AIS: Set[str] = {"monte_carlo"}
+REMOTE_OPPONENT = "remote"
+MAX_MATCH_GAMES = 10_000
+
+
+def _integer_field(message: dict, name: str, default: int, low: int, high: int) -> int:
+    value = message.get(name, default)
+    # JSON booleans are ints in Python
+    if type(value) is not int or not low <= value <= high:
+        raise ProtocolError(f"{name} must be an integer from {low} to {high}, not {value!r}")
+    return value
+
+
+class Seat(ABC):
+    """ One side of a game hosted by the server. """
+
+    @abstractmethod
+    async def decide(self, game_id: int, decision: Decision) -> int | None:
+        pass
+
+    async def game_over(self, game_id: int, result: GameResult) -> None:
+        pass
+
+
+class LocalSeat(Seat):
+    def __init__(self, ai: PokerAi, executor: Optional[Executor] = None):
+        self.ai: PokerAi = ai
+        self.executor: Optional[Executor] = executor
+
+    async def decide(self, game_id: int, decision: Decision) -> int | None:
+        if self.executor is None:
+            return self.ai.decide(decision)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.ai.decide, decision)
+
+
+class ClientConnection:
+    """ A JSON-lines client, answering the decisions of any number of its games in any order. """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+        self._pending_moves: Dict[int, asyncio.Future] = {}
+        self._closed: bool = False
+
+    def send(self, message: dict) -> None:
+        if not self._closed:
+            self.writer.write(encode_message(message))
+
+    async def drain(self) -> None:
+        if not self._closed:
+            await self.writer.drain()
+
+    async def request_move(self, game_id: int, decision: Decision) -> int | None:
+        if self._closed:
+            raise ConnectionError("client disconnected")
+        future = asyncio.get_running_loop().create_future()
+        self._pending_moves[game_id] = future
+        self.send(encode_decision(decision, game_id))
+        return await future
+
+    def answer_move(self, message: dict) -> None:
+        game_id = message.get("game")
+        future = self._pending_moves.pop(game_id, None) if type(game_id) is int else None
+        if future is None:
+            raise ProtocolError(f"no move was asked for game {game_id!r}")
+        future.set_result(message.get("hand"))
+
+    def close(self) -> None:
+        self._closed = True
+        for future in self._pending_moves.values():
+            if not future.done():
+                future.set_exception(ConnectionError("client disconnected"))
+        self._pending_moves.clear()
+        self.writer.close()
+
+
+class RemoteSeat(Seat):
+    def __init__(self, connection: ClientConnection):
+        self.connection: ClientConnection = connection
+
+    async def decide(self, game_id: int, decision: Decision) -> int | None:
+        played_hand = await self.connection.request_move(game_id, decision)
+        if not is_legal_move(played_hand, decision):
+            raise ProtocolError(f"illegal move {played_hand!r} in game {game_id}")
+        return played_hand
+
+    async def game_over(self, game_id: int, result: GameResult) -> None:
+        self.connection.send({"type": "result", "game": game_id, "scores": list(result.player_scores)})
+        await self.connection.drain()
+
+
+class GameServer:
+    """ Hosts concurrent games between AIs of `AI_TYPES` and remote clients, each game in its own task. """
+
+    def __init__(self, executor: Optional[Executor] = None):
+        self.executor: Executor = executor if executor is not None else ThreadPoolExecutor()
+        self._game_ids = itertools.count()
+        self._waiting_client: Optional[Tuple[ClientConnection, int, asyncio.Future]] = None
+
+    def local_seat(self, ai_name: str, is_first_player: bool, rng: np.random.Generator) -> LocalSeat:
+        if ai_name not in AI_TYPES:
+            raise ProtocolError(f"unknown AI {ai_name!r}")
+        return LocalSeat(AI_TYPES[ai_name](is_first_player, rng),
+                         self.executor if ai_name in OFFLOADED_AIS else None)
+
+    async def play_game(self, player1_seat: Seat, player2_seat: Seat, deck: Optional[Deck] = None) -> GameResult:
+        game_id = next(self._game_ids)
+        steps = play_game_steps(deck if deck is not None else Deck())
+        decision = next(steps)
+        while True:
+            seat = player1_seat if decision.is_first_player else player2_seat
+            played_hand = await seat.decide(game_id, decision)
+            try:
+                decision = steps.send(played_hand)
+            except StopIteration as game_over:
+                result = game_over.value
+                break
+
+        for seat in (player1_seat, player2_seat):
+            await seat.game_over(game_id, result)
+        return result
+
+    async def run_match(self, player1_ai: str, player2_ai: str, games: int, seed: int = 0) -> TournamentResult:
+        """ Play `games` games at once between two server AIs, seeded like `run_tournament`. """
+
+        async def play_seeded_game(game_index: int) -> GameResult:
+            deck_rng, player1_rng, player2_rng = spawn_generators(game_seed(seed, game_index), 3)
+            return await self.play_game(self.local_seat(player1_ai, True, player1_rng),
+                                        self.local_seat(player2_ai, False, player2_rng), Deck(rng=deck_rng))
+
+        result = TournamentResult()
+        for game_result in await asyncio.gather(*[play_seeded_game(game_index) for game_index in range(games)]):
+            result.add_game(game_result)
+        return result
+
+    async def _play_match(self, game_seats: List[Tuple[Seat, Seat]], decks: List[Deck],
+                          connections: List[ClientConnection]) -> TournamentResult:
+        """ Play the games at once and report the total to the clients, games aborted by a client error or
+        failing otherwise being reported and left out. """
+        results = await asyncio.gather(*[self.play_game(player1_seat, player2_seat, deck)
+                                         for (player1_seat, player2_seat), deck in zip(game_seats, decks)],
+                                       return_exceptions=True)
+        match_result = TournamentResult()
+        for game_result in results:
+            if isinstance(game_result, GameResult):
+                match_result.add_game(game_result)
+            elif isinstance(game_result, (ProtocolError, ConnectionError)):
+                for connection in connections:
+                    connection.send({"type": "error", "message": str(game_result)})
+            elif isinstance(game_result, Exception):
+                for connection in connections:
+                    connection.send({"type": "error", "message": f"game failed: {game_result!r}"})
+            else:
+                raise game_result
+
+        for connection in connections:
+            connection.send({"type": "match_over", "games": match_result.games,
+                             "scores": list(match_result.player_scores), "wins": list(match_result.player_wins)})
+            await connection.drain()
+        return match_result
+
+    async def _play_remote_match(self, connection: ClientConnection, games: int) -> None:
+        # The first client waits, taking seat 1, and the task of the client pairing with it plays the match
+        if self._waiting_client is None:
+            match_over = asyncio.get_running_loop().create_future()
+            self._waiting_client = (connection, games, match_over)
+            await match_over
+            return
+
+        waiting_connection, games, match_over = self._waiting_client
+        self._waiting_client = None
+        try:
+            game_seats = [(RemoteSeat(waiting_connection), RemoteSeat(connection)) for _ in range(games)]
+            await self._play_match(game_seats, [Deck() for _ in range(games)], [waiting_connection, connection])
+        finally:
+            match_over.set_result(None)
+
+    async def _play_ai_match(self, connection: ClientConnection, opponent: str, games: int, is_first_player: bool,
+                             seed: Optional[int]) -> None:
+        game_seats, decks = [], []
+        for game_index in range(games):
+            deck_rng, ai_rng = spawn_generators(game_seed(seed, game_index), 2) if seed is not None else (None, None)
+            ai_seat = self.local_seat(opponent, not is_first_player, ai_rng)
+            remote_seat = RemoteSeat(connection)
+            game_seats.append((remote_seat, ai_seat) if is_first_player else (ai_seat, remote_seat))
+            decks.append(Deck(rng=deck_rng))
+        await self._play_match(game_seats, decks, [connection])
+
+    def _start_match(self, connection: ClientConnection, message: dict) -> asyncio.Task:
+        games = _integer_field(message, "games", 1, 1, MAX_MATCH_GAMES)
+        opponent = message.get("opponent", "random")
+        if not isinstance(opponent, str):
+            raise ProtocolError(f"opponent must be a name, not {opponent!r}")
+        if opponent == REMOTE_OPPONENT:
+            return asyncio.create_task(self._play_remote_match(connection, games))
+        if opponent not in AI_TYPES:
+            raise ProtocolError(f"unknown AI {opponent!r}")
+        seat = _integer_field(message, "seat", 1, 1, 2)
+        seed = message.get("seed")
+        if seed is not None:
+            seed = _integer_field(message, "seed", 0, 0, 2 ** 63 - 1)
+        return asyncio.create_task(self._play_ai_match(connection, opponent, games, seat == 1, seed))
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = ClientConnection(reader, writer)
+        matches: List[asyncio.Task] = []
+        try:
+            while line := await reader.readline():
+                try:
+                    message = decode_message(line)
+                    if message["type"] == "play":
+                        matches.append(self._start_match(connection, message))
+                    elif message["type"] == "move":
+                        connection.answer_move(message)
+                    else:
+                        raise ProtocolError(f"unknown message type {message['type']!r}")
+                except ProtocolError as error:
+                    connection.send({"type": "error", "message": str(error)})
+        except asyncio.CancelledError:
+            # The server is shutting down: the client's matches are cancelled with it and the handler ends quietly
+            for match in matches:
+                match.cancel()
+        finally:
+            if self._waiting_client is not None and self._waiting_client[0] is connection:
+                self._waiting_client[2].set_result(None)
+                self._waiting_client = None
+            connection.close()
+            try:
+                await asyncio.gather(*matches, return_exceptions=True)
+            except asyncio.CancelledError:
+                for match in matches:
+                    match.cancel()
+                await asyncio.wait(matches)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+async def _serve_forever(host: str, port: int) -> None:
+    server = await GameServer().serve(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host chinese poker games over JSON lines.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(_serve_forever(args.host, args.port))
@@ -0,0 +1,171 @@
+import argparse
+import math
+from dataclasses import dataclass, field
+from itertools import combinations
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+from tqdm import tqdm
+
+from game import Card, Deck
+from game.card import CARDS
+from game.game_state import HANDS_AMOUNT
+from players import AI_TYPES, PokerAi
+from run_game import run_game
+from tournament import game_seed
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_HALF_WIDTH = 0.03
+DEFAULT_MIN_DEALS = 50
+DEFAULT_MAX_DEALS = 5000
+
+
+def paired_interval(deal_wins: Sequence[int], confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+    """ Normal interval on the win rate from the share of its two games the first AI won in each deal, as both
+    games of a deal are played on the same cards and are not independent. One pseudo-deal won twice and one lost
+    twice keep the interval from collapsing when every deal ends the same way. """
+    counts = [deal_wins[0] + 1, deal_wins[1], deal_wins[2] + 1]
+    deals = sum(counts)
+    mean = (counts[1] / 2 + counts[2]) / deals
+    variance = ((counts[1] / 4 + counts[2]) / deals - mean * mean) * deals / (deals - 1)
+    half_width = NormalDist().inv_cdf((1 + confidence) / 2) * math.sqrt(variance / deals)
+    return max(0.0, mean - half_width), min(1.0, mean + half_width)
+
+
+@dataclass
+class MatchupResult:
+    """ Games of `first` against `second`, each deal played twice with the seats swapped, and the confidence at
+    which the matchup was tested for stopping. """
+    first: str
+    second: str
+    games: int = 0
+    first_wins: int = 0
+    first_hands_won: int = 0
+    deal_wins: List[int] = field(default_factory=lambda: [0, 0, 0])  # deals in which `first` won 0, 1 and 2 games
+    confidence: float = DEFAULT_CONFIDENCE
+
+    @property
+    def deals(self) -> int:
+        return sum(self.deal_wins)
+
+    @property
+    def win_rate(self) -> float:
+        return self.first_wins / self.games if self.games else 0.5
+
+    def interval(self, confidence: Optional[float] = None) -> Tuple[float, float]:
+        """ Interval on the win rate, at the confidence of the stopping test by default. """
+        return paired_interval(self.deal_wins, confidence if confidence is not None else self.confidence)
+
+    @property
+    def hands_won_per_game(self) -> float:
+        return self.first_hands_won / self.games if self.games else 0.0
+
+    def add_deal(self, first_scores: Sequence[int]) -> None:
+        """ Add the hands `first` won in both games of a deal. """
+        wins = sum(score > HANDS_AMOUNT - score for score in first_scores)
+        self.games += len(first_scores)
+        self.first_wins += wins
+        self.first_hands_won += sum(first_scores)
+        self.deal_wins[wins] += 1
+
+
+def look_schedule(min_deals: int, max_deals: int) -> List[int]:
+    """ The deal counts at which a matchup may stop, doubling from `min_deals` up to `max_deals`. """
+    looks = []
+    deals = max(1, min(min_deals, max_deals))
+    while deals < max_deals:
+        looks.append(deals)
+        deals *= 2
+    return looks + [max_deals]
+
+
+def is_decided(result: MatchupResult, half_width: float, confidence: Optional[float] = None) -> bool:
+    """ Whether the interval on the win rate is narrower than `half_width` on each side, or already tells which
+    player is better. """
+    low, high = result.interval(confidence)
+    return high - low <= 2 * half_width or low > 0.5 or high < 0.5
+
+
+def shuffled_cards(rng: np.random.Generator) -> List[Card]:
+    return [CARDS[ordinal] for ordinal in rng.permutation(len(CARDS))]
+
+
+def play_matchup(first: str, second: str, ai_types: Dict[str, Type[PokerAi]], seed: int = 0,
+                 half_width: float = DEFAULT_HALF_WIDTH, confidence: float = DEFAULT_CONFIDENCE,
+                 min_deals: int = DEFAULT_MIN_DEALS, max_deals: int = DEFAULT_MAX_DEALS) -> MatchupResult:
+    """ Play mirrored deals between two AIs until `is_decided` or `max_deals`: every deal is played once with
+    each AI as player 1, so neither the luck of the cards nor the first card favours either of them. The result is
+    only looked at on the deal counts of `look_schedule`, each look spending an equal share of the error rate, so
+    that stopping on any of them stays within `confidence`. The result keeps the confidence of a single look, at
+    which its interval is reported. """
+    first_type, second_type = ai_types[first], ai_types[second]
+    seatings = [(first_type(True), second_type(False), True), (second_type(True), first_type(False), False)]
+    looks = look_schedule(min_deals, max_deals)
+    result = MatchupResult(first, second, confidence=1 - (1 - confidence) / len(looks))
+
+    for deal in range(max_deals):
+        deal_seed = game_seed(seed, deal)
+        cards = shuffled_cards(np.random.default_rng(deal_seed))
+        first_scores = []
+        for player1_ai, player2_ai, first_is_player1 in seatings:
+            player1_score, player2_score = run_game(player1_ai, player2_ai, seed=deal_seed,
+                                                    deck=Deck(cards)).player_scores
+            first_scores.append(player1_score if first_is_player1 else player2_score)
+        result.add_deal(first_scores)
+        if deal + 1 in looks and is_decided(result, half_width):
+            break
+    return result
+
+
+def run_league(ai_types: Optional[Dict[str, Type[PokerAi]]] = None, seed: int = 0,
+               half_width: float = DEFAULT_HALF_WIDTH, confidence: float = DEFAULT_CONFIDENCE,
+               min_deals: int = DEFAULT_MIN_DEALS, max_deals: int = DEFAULT_MAX_DEALS,
+               progress: bool = False) -> List[MatchupResult]:
+    """ Round-robin of every pair of AIs, the same seed giving every matchup the same deals. """
+    ai_types = ai_types if ai_types is not None else AI_TYPES
+    pairs = list(combinations(ai_types, 2))
+    return [play_matchup(first, second, ai_types, seed, half_width, confidence, min_deals, max_deals)
+            for first, second in tqdm(pairs, disable=not progress)]
+
+
+def standings(results: List[MatchupResult]) -> List[Tuple[str, int, float]]:
+    """ Name, games and overall win rate of every AI, best first. """
+    games: Dict[str, int] = {}
+    wins: Dict[str, int] = {}
+    for result in results:
+        for name, name_wins in [(result.first, result.first_wins), (result.second, result.games - result.first_wins)]:
+            games[name] = games.get(name, 0) + result.games
+            wins[name] = wins.get(name, 0) + name_wins
+    return sorted(((name, games[name], wins[name] / games[name]) for name in games), key=lambda row: -row[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a round-robin league between the AIs.")
+    parser.add_argument("ais", nargs="*", help=f"AIs to play among {', '.join(AI_TYPES)}, all of them by default")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--half-width", type=float, default=DEFAULT_HALF_WIDTH,
+                        help="stop a matchup once its win rate is known within this margin")
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE)
+    parser.add_argument("--min-deals", type=int, default=DEFAULT_MIN_DEALS,
+                        help="first deal count at which a matchup may stop, the next ones doubling it")
+    parser.add_argument("--max-deals", type=int, default=DEFAULT_MAX_DEALS)
+    args = parser.parse_args()
+    unknown_ais = [name for name in args.ais if name not in AI_TYPES]
+    if unknown_ais:
+        parser.error(f"unknown AIs: {', '.join(unknown_ais)}")
+
+    ai_types = {name: AI_TYPES[name] for name in args.ais} if args.ais else AI_TYPES
+    results = run_league(ai_types, args.seed, args.half_width, args.confidence, args.min_deals, args.max_deals,
+                         progress=True)
+    for result in results:
+        low, high = result.interval()
+        print(f"{result.first:>12} vs {result.second:<12}{result.games:>7} games  win rate {result.win_rate:.3f} "
+              f"[{low:.3f}, {high:.3f}]  {result.hands_won_per_game:.2f} hands/game")
+    print()
+    for name, games, win_rate in standings(results):
+        print(f"{name:>12}{games:>8} games  win rate {win_rate:.3f}")
+
+
+if __name__ == "__main__":
+    main()
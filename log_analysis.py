@@ -0,0 +1,103 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from game import HandBaseValue
+from game.batch_scoring import evaluate_hands, hand_values_to_base_values
+from game.game_state import HANDS_AMOUNT
+from game_log import GameLogReader, records_to_hands
+
+
+def _zeros(*shape: int) -> np.ndarray:
+    return np.zeros(shape, dtype=np.int64)
+
+
+@dataclass
+class LogStatistics:
+    """ Counts over recorded games, all of fixed size whatever the number of games. """
+    games: int = 0
+    seat_wins: np.ndarray = field(default_factory=lambda: _zeros(2))
+    # Hands won by the first player per hand position
+    hand_wins: np.ndarray = field(default_factory=lambda: _zeros(HANDS_AMOUNT))
+    # Final HandBaseValue counts per seat and hand position
+    base_value_distribution: np.ndarray = field(default_factory=lambda: _zeros(2, HANDS_AMOUNT, len(HandBaseValue)))
+    # HandBaseValue counts of the winning hands
+    winning_base_values: np.ndarray = field(default_factory=lambda: _zeros(len(HandBaseValue)))
+    ai_games: Dict[str, int] = field(default_factory=dict)
+    ai_wins: Dict[str, int] = field(default_factory=dict)
+    # Games per score 0-5 of each AI, whichever seat it played
+    ai_score_histograms: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def add_records(self, records: np.ndarray, player_names: Tuple[str, str]) -> None:
+        hand_values = evaluate_hands(records_to_hands(records))
+        player1_won_hands = hand_values[:, 0] > hand_values[:, 1]
+        scores = np.stack([player1_won_hands.sum(axis=1), HANDS_AMOUNT - player1_won_hands.sum(axis=1)], axis=1)
+        player1_wins = int(np.count_nonzero(scores[:, 0] > HANDS_AMOUNT // 2))
+        seat_wins = [player1_wins, len(records) - player1_wins]
+
+        self.games += len(records)
+        self.seat_wins += seat_wins
+        self.hand_wins += player1_won_hands.sum(axis=0)
+
+        base_values = hand_values_to_base_values(hand_values)
+        for seat in range(2):
+            for hand_index in range(HANDS_AMOUNT):
+                self.base_value_distribution[seat, hand_index] += np.bincount(base_values[:, seat, hand_index],
+                                                                              minlength=len(HandBaseValue))
+        winning_base_values = np.where(player1_won_hands, base_values[:, 0], base_values[:, 1])
+        self.winning_base_values += np.bincount(winning_base_values.ravel(), minlength=len(HandBaseValue))
+
+        for seat, name in enumerate(player_names):
+            self._add_ai(name, len(records), seat_wins[seat], np.bincount(scores[:, seat], minlength=HANDS_AMOUNT + 1))
+
+    def _add_ai(self, name: str, games: int, wins: int, score_histogram: np.ndarray) -> None:
+        self.ai_games[name] = self.ai_games.get(name, 0) + games
+        self.ai_wins[name] = self.ai_wins.get(name, 0) + wins
+        self.ai_score_histograms[name] = self.ai_score_histograms.get(name, _zeros(HANDS_AMOUNT + 1)) + score_histogram
+
+    def merge(self, other: "LogStatistics") -> None:
+        self.games += other.games
+        self.seat_wins += other.seat_wins
+        self.hand_wins += other.hand_wins
+        self.base_value_distribution += other.base_value_distribution
+        self.winning_base_values += other.winning_base_values
+        for name in other.ai_games:
+            self._add_ai(name, other.ai_games[name], other.ai_wins[name], other.ai_score_histograms[name])
+
+    def ai_win_rates(self) -> Dict[str, float]:
+        return {name: self.ai_wins[name] / games for name, games in self.ai_games.items()}
+
+    def hand_win_rates(self) -> np.ndarray:
+        """ Share of each hand position won by the first player. """
+        return self.hand_wins / max(self.games, 1)
+
+    def win_by_hand_value(self) -> Dict[HandBaseValue, int]:
+        return {HandBaseValue(base_value): int(count) for base_value, count in enumerate(self.winning_base_values)
+                if count}
+
+    def summary(self) -> str:
+        lines = [f"{self.games} games, first seat won {self.seat_wins[0] / max(self.games, 1):.1%}"]
+        for name, win_rate in sorted(self.ai_win_rates().items()):
+            histogram = " ".join(str(count) for count in self.ai_score_histograms[name])
+            lines.append(f"{name:<24} games {self.ai_games[name]:>10} win rate {win_rate:>7.1%} "
+                         f"scores 0-5: {histogram}")
+        lines.append("first seat hand win rates: " + " ".join(f"{rate:.1%}" for rate in self.hand_win_rates()))
+        for base_value, count in self.win_by_hand_value().items():
+            lines.append(f"{base_value.name:<24} won {count:>10} hands")
+        return "\n".join(lines)
+
+
+def analyze_logs(file_names: Iterable[str], chunk_size: int = 100_000) -> LogStatistics:
+    """ Statistics of every game in the logs, reading at most `chunk_size` games at once. """
+    statistics = LogStatistics()
+    for file_name in file_names:
+        log = GameLogReader(file_name)
+        for records in log.chunks(chunk_size):
+            statistics.add_records(records, log.player_names)
+    return statistics
+
+
+if __name__ == "__main__":
+    print(analyze_logs(sys.argv[1:]).summary())
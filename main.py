@@ -1,31 +1,15 @@
-from collections import defaultdict
-
 import matplotlib.pyplot as plt
-from tqdm import tqdm
 
 from run_game import run_game
 from players import RandomPokerAi, SimplePokerAi
+from tournament import run_tournament
 
 
 def main():
-    win_by_hand_value = defaultdict(int)
-    total_player1_score = 0
-    total_player2_score = 0
-    player1_wins = 0
-    player2_wins = 0
-    for _ in tqdm(range(1000)):
-        game_result = run_game(RandomPokerAi(True), SimplePokerAi(False))
-        player1_score, player2_score = game_result.player_scores
-        total_player1_score += player1_score
-        total_player2_score += player2_score
-
-        if player1_score > player2_score:
-            player1_wins += 1
-        else:
-            player2_wins += 1
-
-        for key, value in game_result.win_by_hand_value.items():
-            win_by_hand_value[key] += value
+    result = run_tournament(RandomPokerAi, SimplePokerAi, 1000, progress=True)
+    total_player1_score, total_player2_score = result.player_scores
+    player1_wins, player2_wins = result.player_wins
+    win_by_hand_value = result.win_by_hand_value
 
     labels = 'player 1', 'player 2',
     sizes = [total_player1_score, total_player2_score]
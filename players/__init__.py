@@ -2,3 +2,19 @@ from players.advanced_ai import AdvancedPokerAi
 from players.random_ai import RandomPokerAi
 from players.simple_ai import SimplePokerAi
 from players.pocker_ai import PokerAi
+from players.monte_carlo_ai import MonteCarloPokerAi
+from players.equity_ai import EquityPokerAi
+from players.learned_ai import LearnedPokerAi, LinearValueModel
+from players.decision_cache import CachedPokerAi, DecisionCache
+from players.endgame_ai import EndgamePokerAi
+from players.scripted_ai import ScriptedPokerAi
+from players.remote_ai import BotConnection, RemotePokerAi
+
+AI_TYPES = {
+    "random": RandomPokerAi,
+    "simple": SimplePokerAi,
+    "advanced": AdvancedPokerAi,
+    "monte_carlo": MonteCarloPokerAi,
+    "equity": EquityPokerAi,
+    "learned": LearnedPokerAi,
+}
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, TypeVar
+
+import numpy as np
+
+from game import Card, Decision, Deck, Hand
+from game.canonical import canonical_decision
+from players.pocker_ai import PokerAi
+
+Value = TypeVar("Value")
+_MISSING = object()
+
+
+class DecisionCache:
+    """ Bounded map from canonical states to what was decided for them, evicting the least recently used entry
+    when full. Independent random games almost never reach the same state twice: hits come from replaying the same
+    deals, as against several opponents, and from positions repeated within a search. """
+
+    def __init__(self, max_size: int = 1_000_000):
+        self.max_size: int = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, key: Hashable, compute: Callable[[], Value]) -> Value:
+        """ The value cached for `key`, computed and stored on a miss. """
+        value = self._entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def decide(self, decision: Decision, decide: Callable[[Decision], int | None]) -> int | None:
+        """ `decide(decision)`, shared by all the decisions with the same cards in the same hand positions. """
+        return self.lookup(canonical_decision(decision), lambda: decide(decision))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (f"DecisionCache({len(self)}/{self.max_size} entries, {self.hits} hits, {self.misses} misses, "
+                f"{self.hit_rate:.1%} hit rate)")
+
+
+class CachedPokerAi(PokerAi):
+    """ Plays the decisions of `ai` through a `DecisionCache`, which may be shared by several players of the same
+    AI. Last moves are only cached when asked, as most AIs play them at random. """
+
+    def __init__(self, ai: PokerAi, cache: Optional[DecisionCache] = None, cache_last_moves: bool = False):
+        super().__init__(ai.is_first_player, ai.rng)
+        self.ai: PokerAi = ai
+        self.cache: DecisionCache = cache if cache is not None else DecisionCache()
+        self.cache_last_moves: bool = cache_last_moves
+
+    def reseed(self, rng: np.random.Generator) -> None:
+        super().reseed(rng)
+        self.ai.reseed(rng)
+
+    def decide(self, decision: Decision) -> int | None:
+        if decision.is_last_move and not self.cache_last_moves:
+            return self.ai.decide(decision)
+        return self.cache.decide(decision, self.ai.decide)
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
+        return self.decide(Decision(self.is_first_player, card_to_play, hands, other_hands, deck, False))
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        return self.decide(Decision(self.is_first_player, card_to_play, hands, other_hands, deck, True))
@@ -0,0 +1,37 @@
+from typing import List
+
+import numpy as np
+
+from game import Card, Decision, Deck, Hand
+from game.endgame import EndgamePosition, EndgameSolver
+from players.pocker_ai import PokerAi
+
+# Solving takes about 0.15s with 10 unseen cards and twenty times longer with 11
+DEFAULT_MAX_CARDS = 10
+
+
+class EndgamePokerAi(PokerAi):
+    """ Plays like `ai` until every hand holds four cards and at most `max_cards` cards are left unseen, then
+    plays the moves of `EndgameSolver`, which takes the opponent to play at random. """
+
+    def __init__(self, ai: PokerAi, max_cards: int = DEFAULT_MAX_CARDS):
+        super().__init__(ai.is_first_player, ai.rng)
+        self.ai: PokerAi = ai
+        self.max_cards: int = max_cards
+
+    def reseed(self, rng: np.random.Generator) -> None:
+        super().reseed(rng)
+        self.ai.reseed(rng)
+
+    def decide(self, decision: Decision) -> int | None:
+        if decision.deck.get_cards_left_amount(self.is_first_player) <= self.max_cards:
+            position = EndgamePosition.from_decision(decision)
+            if position.is_endgame:
+                return EndgameSolver(position).best_move()
+        return self.ai.decide(decision)
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
+        return self.decide(Decision(self.is_first_player, card_to_play, hands, other_hands, deck, False))
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        return self.decide(Decision(self.is_first_player, card_to_play, hands, other_hands, deck, True))
@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+import numpy as np
+
+from game import Card, Decision, Deck, Hand
+from game.equity import RANDOM_REPLY, best_last_move
+from players.advanced_ai import AdvancedPokerAi
+
+
+class EquityPokerAi(AdvancedPokerAi):
+    """ Plays like `AdvancedPokerAi`, then picks the last move with the best exact expected score. """
+
+    def __init__(self, is_first_player: bool, rng: Optional[np.random.Generator] = None,
+                 opponent_reply: str = RANDOM_REPLY):
+        super().__init__(is_first_player, rng)
+        self.opponent_reply: str = opponent_reply
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        decision = Decision(self.is_first_player, card_to_play, hands, other_hands, deck, True)
+        return best_last_move(decision, self.opponent_reply)
@@ -0,0 +1,99 @@
+import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from game import Card, Decision, DecisionBatch, Deck, Hand
+from game.batch_scoring import evaluate_hands
+from game.equity import best_last_move
+from game.features import FEATURES, add_card, hand_features, own_hand_features
+from players.pocker_ai import PokerAi
+
+DEFAULT_WEIGHTS_FILE = os.path.join(os.path.dirname(__file__), "learned_ai_weights.npz")
+
+
+class LinearValueModel:
+    """ Linear estimate of the chance of winning a hand from its `hand_features`. """
+
+    def __init__(self, weights: Optional[np.ndarray] = None):
+        self.weights: np.ndarray = weights if weights is not None else np.zeros(FEATURES, dtype=np.float32)
+        # Python floats are faster than array items for scoring one decision
+        self._weights_list: List[float] = self.weights.tolist()
+
+    @staticmethod
+    def load(file) -> "LinearValueModel":
+        with np.load(file) as weights_file:
+            weights = weights_file["weights"]
+        if weights.shape != (FEATURES,):
+            raise ValueError(f"expected {FEATURES} weights, got shape {weights.shape}")
+        return LinearValueModel(weights.astype(np.float32))
+
+    def save(self, file) -> None:
+        np.savez(file, weights=self.weights)
+
+    def move_scores(self, cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray, hand_values: np.ndarray,
+                    other_hands: np.ndarray, unseen: np.ndarray,
+                    current_features: Optional[np.ndarray] = None) -> np.ndarray:
+        """ (games, hands) gain in the estimated hands won from placing the card in each hand, minus infinity
+        for the hands it cannot go to. """
+        if current_features is None:
+            current_features = hand_features(hands, hand_values, other_hands, unseen)
+        potential_hands = add_card(hands, hand_sizes, cards)
+        current = current_features @ self.weights
+        potential = hand_features(potential_hands, evaluate_hands(potential_hands), other_hands, unseen) @ self.weights
+        playable = hand_sizes == hand_sizes.min(axis=1, keepdims=True)
+        return np.where(playable, potential - current, -np.inf)
+
+    def play_moves(self, cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray, hand_values: np.ndarray,
+                   other_hands: np.ndarray, unseen: np.ndarray) -> np.ndarray:
+        return np.argmax(self.move_scores(cards, hands, hand_sizes, hand_values, other_hands, unseen), axis=1)
+
+    def hand_score(self, features: List[Tuple[int, float]]) -> float:
+        """ Estimate from the sparse features of `own_hand_features`. """
+        weights = self._weights_list
+        return sum(weights[index] * value for index, value in features)
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck,
+                  player: bool) -> int:
+        """ `play_moves` for one decision, scoring only the playable hands. """
+        fewest_cards = min(len(hand) for hand in hands)
+        best_hand, best_gain = 0, -float("inf")
+        for hand_index, hand in enumerate(hands):
+            if len(hand) != fewest_cards:
+                continue
+            cards = hand.get_cards(player)
+            other_value = other_hands[hand_index].get_value(player)
+            gain = (self.hand_score(own_hand_features(cards + [card_to_play], hand.get_value_with(card_to_play),
+                                                      other_value, deck, player))
+                    - self.hand_score(own_hand_features(cards, hand.get_value(player), other_value, deck, player)))
+            if gain > best_gain:
+                best_hand, best_gain = hand_index, gain
+        return best_hand
+
+
+class LearnedPokerAi(PokerAi):
+    """ Places cards with a `LinearValueModel` trained by self-play in `training.py`, and plays the last move with
+    the best exact equity. """
+
+    def __init__(self, is_first_player: bool, rng: Optional[np.random.Generator] = None,
+                 model: Optional[LinearValueModel] = None):
+        super().__init__(is_first_player, rng)
+        self.model: LinearValueModel = model if model is not None else _default_model()
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
+        return self.model.play_move(card_to_play, hands, other_hands, deck, self.is_first_player)
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        return best_last_move(Decision(self.is_first_player, card_to_play, hands, other_hands, deck, True))
+
+    def play_moves_batch(self, batch: DecisionBatch) -> np.ndarray:
+        if batch.is_last_move:
+            return super().play_moves_batch(batch)
+        return self.model.play_moves(batch.cards, batch.hands, batch.hand_sizes, batch.hand_values,
+                                     batch.other_hands, batch.cards_left)
+
+
+@lru_cache(maxsize=None)
+def _default_model() -> LinearValueModel:
+    return LinearValueModel.load(DEFAULT_WEIGHTS_FILE)
@@ -0,0 +1,122 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from game import Card, Deck, Hand, get_playable_hands
+from game.batch_scoring import EMPTY_SLOT, evaluate_hands
+from players.pocker_ai import PokerAi
+
+
+def hands_to_template(hands: List[Hand], player: bool) -> np.ndarray:
+    """ The cards of `hands` that `player` can see as a (hands, 5) ordinal array, unknown slots left empty. """
+    template = np.full((len(hands), 5), EMPTY_SLOT, dtype=np.int8)
+    for hand_index, hand in enumerate(hands):
+        for card_index, card in enumerate(hand.get_cards(player)):
+            template[hand_index, card_index] = card.ordinal
+    return template
+
+
+def rollout_scores(option_templates: np.ndarray, other_template: np.ndarray, cards_left: np.ndarray,
+                   is_first_player: bool, rollouts: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """ Sum over `rollouts` random completions of the hands won by each option, (options, 5, 5) templates
+    whose empty slots are filled from the shuffled `cards_left`. """
+    options = len(option_templates)
+    own_empty = option_templates.reshape(options, -1) == EMPTY_SLOT
+    other_empty = other_template.ravel() == EMPTY_SLOT
+    own_missing = int(own_empty[0].sum())
+
+    # Every option sees the same shuffles, so their scores differ by the choice and not by luck
+    shuffled = np.random.default_rng(seed).permuted(np.tile(cards_left, (rollouts, 1)), axis=1)
+
+    other_hands = np.tile(other_template.ravel(), (rollouts, 1))
+    other_hands[:, other_empty] = shuffled[:, own_missing:own_missing + int(other_empty.sum())]
+    other_values = evaluate_hands(other_hands.reshape(rollouts, 5, 5))
+
+    scores = np.zeros(options, dtype=np.int64)
+    for option, template in enumerate(option_templates):
+        own_hands = np.tile(template.ravel(), (rollouts, 1))
+        own_hands[:, own_empty[option]] = shuffled[:, :own_missing]
+        own_values = evaluate_hands(own_hands.reshape(rollouts, 5, 5))
+        won_hands = own_values > other_values if is_first_player else ~(other_values > own_values)
+        scores[option] = won_hands.sum()
+    return scores
+
+
+class MonteCarloPokerAi(PokerAi):
+    """ Plays the option with the most hands won over random completions of the cards it has not seen. """
+
+    def __init__(self, is_first_player: bool, rng: Optional[np.random.Generator] = None, rollouts: int = 1000,
+                 time_budget: Optional[float] = None, batch_size: int = 250, workers: int = 1):
+        super().__init__(is_first_player, rng)
+        self.rollouts: int = rollouts
+        self.time_budget: Optional[float] = time_budget
+        self.batch_size: int = batch_size
+        self.workers: int = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _batch_seeds(self, batches: int) -> List[np.random.SeedSequence]:
+        return [np.random.SeedSequence(int(seed)) for seed in self.rng.integers(0, 2 ** 62, batches)]
+
+    def evaluate_options(self, option_templates: np.ndarray, other_hands: List[Hand], deck: Deck) -> np.ndarray:
+        """ Average hands won by each option within the rollout and time budgets. """
+        other_template = hands_to_template(other_hands, self.is_first_player)
+        cards_left = np.array([card.ordinal for card in deck.get_cards_left(self.is_first_player)],
+                              dtype=np.int8)
+        arguments = (option_templates, other_template, cards_left, self.is_first_player)
+
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        scores = np.zeros(len(option_templates), dtype=np.int64)
+        rollouts_done = 0
+        while rollouts_done < self.rollouts and (deadline is None or time.perf_counter() < deadline):
+            if self.workers > 1:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                batches = [min(self.batch_size, self.rollouts - rollouts_done - index * self.batch_size)
+                           for index in range(self.workers)]
+                batches = [batch for batch in batches if batch > 0]
+                futures = [self._executor.submit(rollout_scores, *arguments, batch, seed)
+                           for batch, seed in zip(batches, self._batch_seeds(len(batches)))]
+                for future in futures:
+                    scores += future.result()
+                rollouts_done += sum(batches)
+            else:
+                batch = min(self.batch_size, self.rollouts - rollouts_done)
+                scores += rollout_scores(*arguments, batch, self._batch_seeds(1)[0])
+                rollouts_done += batch
+
+        return scores / max(rollouts_done, 1)
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
+        playable_hands = get_playable_hands(hands)
+        if len(playable_hands) == 1:
+            return hands.index(playable_hands[0])
+
+        template = hands_to_template(hands, self.is_first_player)
+        option_templates = np.repeat(template[None], len(playable_hands), axis=0)
+        for option, hand in enumerate(playable_hands):
+            option_templates[option, hands.index(hand), len(hand)] = card_to_play.ordinal
+
+        scores = self.evaluate_options(option_templates, other_hands, deck)
+        return hands.index(playable_hands[int(np.argmax(scores))])
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        # Option 0 keeps every hand, option i replaces the last card of hand i - 1
+        template = hands_to_template(hands, self.is_first_player)
+        option_templates = np.repeat(template[None], len(hands) + 1, axis=0)
+        for hand_index in range(len(hands)):
+            option_templates[hand_index + 1, hand_index, -1] = card_to_play.ordinal
+
+        best_option = int(np.argmax(self.evaluate_options(option_templates, other_hands, deck)))
+        return None if best_option == 0 else best_option - 1
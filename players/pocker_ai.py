@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
-from game import Card, Deck, Hand
+import numpy as np
+
+from game import Card, Decision, DecisionBatch, Deck, Hand, NO_REPLACEMENT
 
 
 class PokerAi(ABC):
-    def __init__(self, is_first_player: bool):
+    def __init__(self, is_first_player: bool, rng: Optional[np.random.Generator] = None):
         self.is_first_player: bool = is_first_player
+        self.rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+
+    def reseed(self, rng: np.random.Generator) -> None:
+        self.rng = rng
 
     @abstractmethod
     def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
@@ -15,3 +21,20 @@ class PokerAi(ABC):
     @abstractmethod
     def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
         pass
+
+    def decide(self, decision: Decision) -> int | None:
+        if decision.is_last_move:
+            return self.play_last_move(decision.card, decision.hands, decision.other_hands, decision.deck)
+        return self.play_move(decision.card, decision.hands, decision.other_hands, decision.deck)
+
+    def decide_batch(self, decisions: List[Decision]) -> List[int | None]:
+        """ Decide the same turn of many games at once. """
+        played_hands = self.play_moves_batch(DecisionBatch(decisions))
+        return [None if played_hand == NO_REPLACEMENT else int(played_hand) for played_hand in played_hands]
+
+    def play_moves_batch(self, batch: DecisionBatch) -> np.ndarray:
+        """ Hand index chosen in each game of the batch, or NO_REPLACEMENT on last moves. Players that can
+        decide many games faster than one by one override it using the batch arrays. """
+        played_hands = (self.decide(decision) for decision in batch.decisions)
+        return np.array([NO_REPLACEMENT if played_hand is None else played_hand for played_hand in played_hands],
+                        dtype=np.int64)
@@ -1,7 +1,5 @@
 from typing import List
 
-import numpy as np
-
 from game import Card, Deck, Hand, get_playable_hands
 from players.pocker_ai import PokerAi
 
@@ -12,4 +10,4 @@ class RandomPokerAi(PokerAi):
         return hands.index(playable_hands[0])
 
     def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
-        return np.random.randint(0, len(hands))
+        return int(self.rng.integers(0, len(hands)))
@@ -0,0 +1,110 @@
+import socket
+import subprocess
+from typing import BinaryIO, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from game import Card, Decision, Deck, Hand
+from game.protocol import ProtocolError, decode_decision, decode_message, encode_decision, encode_message, \
+    is_legal_move
+from players.pocker_ai import PokerAi
+
+
+class BotConnection:
+    """ A JSON-lines channel to an external bot, each request answered by one reply line. """
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO, on_close: Optional[Callable[[], None]] = None):
+        self.reader: BinaryIO = reader
+        self.writer: BinaryIO = writer
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    @staticmethod
+    def start_process(command: Sequence[str]) -> "BotConnection":
+        """ Run the bot as a child process talking on its stdin and stdout. """
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+        def stop_process():
+            process.stdin.close()
+            process.wait()
+            process.stdout.close()
+
+        return BotConnection(process.stdout, process.stdin, stop_process)
+
+    @staticmethod
+    def connect(host: str, port: int) -> "BotConnection":
+        connection = socket.create_connection((host, port))
+        stream = connection.makefile("rwb")
+
+        def close_socket():
+            stream.close()
+            connection.close()
+
+        return BotConnection(stream, stream, close_socket)
+
+    def request(self, message: dict) -> dict:
+        self.writer.write(encode_message(message))
+        self.writer.flush()
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("the bot closed the connection")
+        reply = decode_message(line)
+        if reply["type"] == "error":
+            raise ProtocolError(f"the bot failed: {reply.get('message')}")
+        return reply
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+
+class RemotePokerAi(PokerAi):
+    """ Asks an external bot for its moves, the decisions of a whole batch of games going in one request. """
+
+    def __init__(self, is_first_player: bool, connection: BotConnection, rng: Optional[np.random.Generator] = None):
+        super().__init__(is_first_player, rng)
+        self.connection: BotConnection = connection
+
+    def decide_batch(self, decisions: List[Decision]) -> List[int | None]:
+        decision_messages = [encode_decision(decision, game_index) for game_index, decision in enumerate(decisions)]
+        reply = self.connection.request({"type": "decide", "decisions": decision_messages})
+        played_hands = reply.get("hands")
+        if reply["type"] != "moves" or not isinstance(played_hands, list) or len(played_hands) != len(decisions):
+            raise ProtocolError(f"expected {len(decisions)} moves, got {reply}")
+        for decision, played_hand in zip(decisions, played_hands):
+            if not is_legal_move(played_hand, decision):
+                raise ProtocolError(f"illegal move {played_hand!r}")
+        return list(played_hands)
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
+        return self.decide_batch([Decision(self.is_first_player, card_to_play, hands, other_hands, deck, False)])[0]
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        return self.decide_batch([Decision(self.is_first_player, card_to_play, hands, other_hands, deck, True)])[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def run_bot(ai_type: Callable[[bool], PokerAi], reader: BinaryIO, writer: BinaryIO) -> None:
+    """ Answer the requests of a `RemotePokerAi` with `ai_type` players until the input ends. """
+    players: Dict[bool, PokerAi] = {True: ai_type(True), False: ai_type(False)}
+    while line := reader.readline():
+        try:
+            message = decode_message(line)
+            if message["type"] != "decide":
+                raise ProtocolError(f"unknown message type {message['type']!r}")
+            decisions = [decode_decision(decision_message) for decision_message in message["decisions"]]
+            played_hands: List[int | None] = [None] * len(decisions)
+            for is_first_player, player in players.items():
+                indices = [index for index, decision in enumerate(decisions)
+                           if decision.is_first_player == is_first_player]
+                if indices:
+                    batch = player.decide_batch([decisions[index] for index in indices])
+                    for index, played_hand in zip(indices, batch):
+                        played_hands[index] = played_hand
+            reply = {"type": "moves", "hands": played_hands}
+        except (ProtocolError, KeyError, ValueError) as error:
+            reply = {"type": "error", "message": str(error)}
+        writer.write(encode_message(reply))
+        writer.flush()
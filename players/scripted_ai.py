@@ -0,0 +1,22 @@
+from typing import List, Sequence
+
+from game import Card, Deck, Hand
+from players.pocker_ai import PokerAi
+
+
+class ScriptedPokerAi(PokerAi):
+    """ Plays a fixed list of moves, used to replay recorded games. """
+
+    def __init__(self, is_first_player: bool, moves: Sequence[int], last_move: int | None):
+        super().__init__(is_first_player)
+        self.moves: List[int] = [int(move) for move in moves]
+        self.last_move: int | None = last_move
+        self._next_move: int = 0
+
+    def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
+        move = self.moves[self._next_move]
+        self._next_move += 1
+        return move
+
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        return self.last_move
@@ -1,23 +1,43 @@
-from copy import deepcopy
 from typing import List
 
 import numpy as np
 
-from game import Card, Hand, Deck, get_playable_hands, has_better_cards
+from game import Card, DecisionBatch, Hand, Deck, get_playable_hands, get_potential_values
+from game.batch_scoring import evaluate_hands
 from players.pocker_ai import PokerAi
 
 
+def simple_batch_moves(cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray,
+                       hand_values: np.ndarray) -> np.ndarray:
+    """ `SimplePokerAi.play_move` over arrays of games: the first playable hand the card improves, else the first
+    playable hand. """
+    playable = hand_sizes == hand_sizes.min(axis=1, keepdims=True)
+
+    games, hand_indices = np.nonzero(playable)
+    potential_hands = hands[games, hand_indices]
+    potential_hands[np.arange(len(games)), hand_sizes[games, hand_indices]] = cards[games]
+    improves = np.zeros_like(playable)
+    improves[games, hand_indices] = evaluate_hands(potential_hands) > hand_values[games, hand_indices]
+
+    return np.where(improves.any(axis=1), np.argmax(improves, axis=1), np.argmin(hand_sizes, axis=1))
+
+
 class SimplePokerAi(PokerAi):
     def play_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int:
         playable_hands = get_playable_hands(hands)
+        potential_values = get_potential_values(hands, card_to_play)
 
         for position, hand in enumerate(hands):
             if hand in playable_hands:
-                if has_better_cards(hand.get_cards(self.is_first_player) + [card_to_play],
-                                    hand.get_cards(self.is_first_player)):
+                if potential_values[position] > hand.get_value(self.is_first_player):
                     return position
 
         return hands.index(playable_hands[0])
 
     def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
-        return np.random.randint(0, len(hands))
+        return int(self.rng.integers(0, len(hands)))
+
+    def play_moves_batch(self, batch: DecisionBatch) -> np.ndarray:
+        if batch.is_last_move:
+            return super().play_moves_batch(batch)
+        return simple_batch_moves(batch.cards, batch.hands, batch.hand_sizes, batch.hand_values)
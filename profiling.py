@@ -0,0 +1,72 @@
+import marshal
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple, TypeVar
+
+GAME_PHASE = "run_game"
+
+T = TypeVar("T")
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class GameProfiler:
+    """ Wall time and call count of each phase of the games it is passed to, summed over all of them. """
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseStats] = {}
+
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = PhaseStats()
+        stats.calls += calls
+        stats.seconds += seconds
+
+    def call(self, phase: str, function: Callable[..., T], *args) -> T:
+        start = time.perf_counter()
+        result = function(*args)
+        self.add(phase, time.perf_counter() - start)
+        return result
+
+    def merge(self, other: "GameProfiler") -> None:
+        for phase, stats in other.phases.items():
+            self.add(phase, stats.seconds, stats.calls)
+
+    @property
+    def games(self) -> int:
+        return self.phases[GAME_PHASE].calls if GAME_PHASE in self.phases else 0
+
+    def summary(self) -> str:
+        game_seconds = self.phases[GAME_PHASE].seconds if GAME_PHASE in self.phases else 0.0
+        lines = [f"{'phase':<40}{'calls':>10}{'total s':>12}{'per call us':>14}{'share':>8}"]
+        for phase, stats in sorted(self.phases.items(), key=lambda item: -item[1].seconds):
+            share = f"{stats.seconds / game_seconds:.1%}" if game_seconds else "-"
+            lines.append(f"{phase:<40}{stats.calls:>10}{stats.seconds:>12.3f}"
+                         f"{stats.seconds / stats.calls * 1e6:>14.1f}{share:>8}")
+        return "\n".join(lines)
+
+    def stats(self) -> Dict[Tuple[str, int, str], tuple]:
+        """ The phases in the `pstats` layout, each phase being a function called by the game. """
+        game_key = ("run_game.py", 0, GAME_PHASE)
+        child_seconds = sum(stats.seconds for phase, stats in self.phases.items() if phase != GAME_PHASE)
+
+        pstats_stats = {}
+        for phase, stats in self.phases.items():
+            if phase == GAME_PHASE:
+                pstats_stats[game_key] = (stats.calls, stats.calls, max(stats.seconds - child_seconds, 0.0),
+                                          stats.seconds, {})
+            else:
+                callers = {game_key: (stats.calls, stats.calls, stats.seconds, stats.seconds)}
+                pstats_stats[("run_game.py", 0, phase)] = (stats.calls, stats.calls, stats.seconds, stats.seconds,
+                                                          callers if GAME_PHASE in self.phases else {})
+        return pstats_stats
+
+    def dump_stats(self, file_name: str) -> None:
+        """ Write the phases like `cProfile.Profile.dump_stats`, to be loaded with `pstats.Stats`. """
+        with open(file_name, "wb") as stats_file:
+            marshal.dump(self.stats(), stats_file)
@@ -0,0 +1,27 @@
+import argparse
+import socket
+import sys
+
+from players import AI_TYPES
+from players.remote_ai import run_bot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play one of the AIs as an external bot for RemotePokerAi.")
+    parser.add_argument("ai", choices=sorted(AI_TYPES))
+    parser.add_argument("--port", type=int, help="serve connections on this local port instead of stdin/stdout")
+    args = parser.parse_args()
+
+    if args.port is None:
+        run_bot(AI_TYPES[args.ai], sys.stdin.buffer, sys.stdout.buffer)
+        return
+
+    with socket.create_server(("127.0.0.1", args.port)) as server:
+        while True:
+            connection, _ = server.accept()
+            with connection, connection.makefile("rwb") as stream:
+                run_bot(AI_TYPES[args.ai], stream, stream)
+
+
+if __name__ == "__main__":
+    main()
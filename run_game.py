@@ -1,9 +1,18 @@
+import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import DefaultDict, Optional, Tuple, List
+from typing import TYPE_CHECKING, Callable, DefaultDict, Generator, Optional, Tuple, List, TypeVar
 
-from game import Hand, HandBaseValue, Deck, calculate_hand_base_value, has_better_cards
+import numpy as np
+
+from game import Decision, Hand, HandBaseValue, Deck, spawn_generators
 from players import PokerAi, RandomPokerAi
+from profiling import GAME_PHASE, GameProfiler
+
+if TYPE_CHECKING:
+    from game_log import GameLogWriter
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -29,32 +38,66 @@ def return_game_score(player1_hands: List[Hand], player2_hands: List[Hand], verb
     player1_score = 0
     player2_score = 0
     for hand1, hand2 in zip(player1_hands, player2_hands):
+        # Hands keep their `evaluate_hand` value up to date, so the showdown only compares integers
+        hand1_value = hand1.get_value(True)
+        hand2_value = hand2.get_value(False)
         if verbose:
-            print(hand1, calculate_hand_base_value(hand1.get_cards(True)))
-            print(hand2, calculate_hand_base_value(hand2.get_cards(False)))
-        result = has_better_cards(hand1.get_cards(True), hand2.get_cards(False))
+            print(hand1, hand1.get_base_value(True))
+            print(hand2, hand2.get_base_value(False))
+        result = hand1_value > hand2_value
         if verbose:
             print(result)
         if result:
             player1_score += 1
-            win_by_hand_value[calculate_hand_base_value(hand1.get_cards(True))] += 1
+            win_by_hand_value[hand1.get_base_value(True)] += 1
         else:
             player2_score += 1
-            win_by_hand_value[calculate_hand_base_value(hand1.get_cards(False))] += 1
+            win_by_hand_value[hand2.get_base_value(False)] += 1
     return GameResult((player1_score, player2_score), win_by_hand_value)
 
 
+def _profiled(profiler: Optional[GameProfiler], phase: str, function: Callable[..., T], *args) -> T:
+    if profiler is None:
+        return function(*args)
+    return profiler.call(phase, function, *args)
+
+
 def run_game(player1_ai: Optional[PokerAi] = None, player2_ai: Optional[PokerAi] = None,
-             verbose: bool = False) -> GameResult:
-    deck = Deck()
+             verbose: bool = False, seed: int | np.random.SeedSequence | None = None,
+             deck: Optional[Deck] = None, profiler: Optional[GameProfiler] = None,
+             recorder: Optional["GameLogWriter"] = None) -> GameResult:
     player1_ai = player1_ai if player1_ai is not None else RandomPokerAi(True)
     player2_ai = player2_ai if player2_ai is not None else RandomPokerAi(False)
-    player1_hands, player2_hands = initialize_hands(deck)
+
+    # A seed replays the same game: the deck and both players get their own stream derived from it
+    deck_rng = None
+    if seed is not None:
+        deck_rng, player1_rng, player2_rng = spawn_generators(seed, 3)
+        player1_ai.reseed(player1_rng)
+        player2_ai.reseed(player2_rng)
+
+    start = time.perf_counter() if profiler is not None else 0.0
+    if deck is None:
+        deck = _profiled(profiler, "shuffle_deck", Deck, None, deck_rng)
+    result = _play_game(player1_ai, player2_ai, deck, verbose, profiler, recorder)
+    if profiler is not None:
+        profiler.add(GAME_PHASE, time.perf_counter() - start)
+    return result
+
+
+def decision_phase(player: PokerAi, decision: Decision) -> str:
+    return f"{'play_last_move' if decision.is_last_move else 'play_move'}[{type(player).__name__}]"
+
+
+def play_game_steps(deck: Deck, verbose: bool = False, profiler: Optional[GameProfiler] = None,
+                    recorder: Optional["GameLogWriter"] = None) -> Generator[Decision, int | None, GameResult]:
+    """ Play a game on `deck`, yielding every decision and taking the chosen hand index back through `send`. """
+    player1_hands, player2_hands = _profiled(profiler, "initialize_hands", initialize_hands, deck)
+    moves = [] if recorder is not None else None
 
     for i in range(40):
         card = deck.pop()
         turn: bool = i % 2 == 0  # TODO: e2e test about that player turn and deck
-        player = player1_ai if turn else player2_ai
         current_hands = player1_hands if turn else player2_hands
         other_hands = player2_hands if turn else player1_hands
 
@@ -63,17 +106,71 @@ def run_game(player1_ai: Optional[PokerAi] = None, player2_ai: Optional[PokerAi]
             print("to play", card)
             print(current_hands)
 
-        played_hand = player.play_move(card, current_hands, other_hands, deck)
+        played_hand = yield Decision(turn, card, current_hands, other_hands, deck, False)
         current_hands[played_hand].add_card(card)
+        if moves is not None:
+            moves.append((card, played_hand))
 
     first_player_card = deck.pop()
-    player1_replaced_index = player1_ai.play_last_move(first_player_card, other_hands, current_hands, deck)
+    player1_replaced_index = yield Decision(True, first_player_card, other_hands, current_hands, deck, True)
     if player1_replaced_index is not None:
         other_hands[player1_replaced_index].replace_last_card(first_player_card)
 
     second_player_card = deck.pop()
-    player2_replaced_index = player2_ai.play_last_move(second_player_card, current_hands, other_hands, deck)
+    player2_replaced_index = yield Decision(False, second_player_card, current_hands, other_hands, deck, True)
     if player2_replaced_index is not None:
         current_hands[player2_replaced_index].replace_last_card(second_player_card)
 
-    return return_game_score(player1_hands, player2_hands, verbose)
+    result = _profiled(profiler, "return_game_score", return_game_score, player1_hands, player2_hands, verbose)
+    if recorder is not None:
+        last_moves = [(first_player_card, player1_replaced_index), (second_player_card, player2_replaced_index)]
+        recorder.record_game(player1_hands, player2_hands, moves, last_moves, result)
+    return result
+
+
+def _play_game(player1_ai: PokerAi, player2_ai: PokerAi, deck: Deck, verbose: bool,
+               profiler: Optional[GameProfiler], recorder: Optional["GameLogWriter"]) -> GameResult:
+    steps = play_game_steps(deck, verbose, profiler, recorder)
+    decision = next(steps)
+    while True:
+        player = player1_ai if decision.is_first_player else player2_ai
+        if profiler is None:
+            played_hand = player.decide(decision)
+        else:
+            played_hand = profiler.call(decision_phase(player, decision), player.decide, decision)
+
+        try:
+            decision = steps.send(played_hand)
+        except StopIteration as game_over:
+            return game_over.value
+
+
+def run_games(player1_ai: PokerAi, player2_ai: PokerAi, games: int,
+              seed: int | np.random.SeedSequence | None = None) -> List[GameResult]:
+    """ Play `games` games in lockstep, every turn of all of them asked from its player in one `decide_batch`. """
+    if seed is not None:
+        player1_rng, player2_rng, *deck_rngs = spawn_generators(seed, 2 + games)
+        player1_ai.reseed(player1_rng)
+        player2_ai.reseed(player2_rng)
+    else:
+        deck_rngs = [None] * games
+
+    steps = [play_game_steps(Deck(rng=deck_rng)) for deck_rng in deck_rngs]
+    decisions = [next(game_steps) for game_steps in steps]
+    results: List[Optional[GameResult]] = [None] * games
+
+    # Every game is at the same turn, so all decisions are asked from the same player
+    playing = list(range(games))
+    while playing:
+        player = player1_ai if decisions[playing[0]].is_first_player else player2_ai
+        played_hands = player.decide_batch([decisions[game] for game in playing])
+
+        still_playing = []
+        for game, played_hand in zip(playing, played_hands):
+            try:
+                decisions[game] = steps[game].send(played_hand)
+                still_playing.append(game)
+            except StopIteration as game_over:
+                results[game] = game_over.value
+        playing = still_playing
+    return results
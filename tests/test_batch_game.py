@@ -0,0 +1,69 @@
+import unittest
+from typing import List
+
+import numpy as np
+
+from batch_game import BatchPolicy, RandomBatchPolicy, SimpleBatchPolicy, NO_REPLACEMENT, deal_decks, \
+    run_batch_games, simulate_games
+from game import Card, Deck, Hand
+from game.card import ordinal_to_card
+from players import RandomPokerAi, SimplePokerAi
+from run_game import run_game
+
+
+class KeepLastCard:
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> None:
+        return None
+
+    def play_last_moves(self, cards: np.ndarray, hands: np.ndarray, hand_values: np.ndarray,
+                        other_hands: np.ndarray) -> np.ndarray:
+        return np.full(len(cards), NO_REPLACEMENT)
+
+
+class KeepingRandomPokerAi(KeepLastCard, RandomPokerAi):
+    pass
+
+
+class KeepingSimplePokerAi(KeepLastCard, SimplePokerAi):
+    pass
+
+
+class KeepingRandomBatchPolicy(KeepLastCard, RandomBatchPolicy):
+    pass
+
+
+class KeepingSimpleBatchPolicy(KeepLastCard, SimpleBatchPolicy):
+    pass
+
+
+class TestBatchGame(unittest.TestCase):
+    def test_matches_run_game(self):
+        decks = deal_decks(30, np.random.default_rng(4))
+        policy_pairs = [
+            (KeepingRandomBatchPolicy, KeepingSimpleBatchPolicy, KeepingRandomPokerAi, KeepingSimplePokerAi),
+            (KeepingSimpleBatchPolicy, KeepingSimpleBatchPolicy, KeepingSimplePokerAi, KeepingSimplePokerAi),
+        ]
+        for player1_policy, player2_policy, player1_ai, player2_ai in policy_pairs:
+            result = simulate_games(decks, player1_policy(True), player2_policy(False))
+            for deck_ordinals, player_scores in zip(decks, result.player_scores):
+                deck = Deck([ordinal_to_card(int(ordinal)) for ordinal in reversed(deck_ordinals)])
+                game_result = run_game(player1_ai(True), player2_ai(False), deck=deck)
+                self.assertEqual(game_result.player_scores, tuple(player_scores.tolist()))
+
+    def test_result_totals(self):
+        result = run_batch_games(RandomBatchPolicy(True), SimpleBatchPolicy(False), 500, seed=1, batch_size=200)
+        self.assertEqual(result.games, 500)
+        self.assertTrue((result.player_scores.sum(axis=1) == 5).all())
+        self.assertEqual(sum(result.player_wins), 500)
+        self.assertEqual(sum(result.win_by_hand_value().values()), 500 * 5)
+        self.assertEqual(result.base_value_distribution().sum(), 500 * 10)
+
+    def test_seeded_batch(self):
+        first_result = run_batch_games(RandomBatchPolicy(True), SimpleBatchPolicy(False), 100, seed=8)
+        second_result = run_batch_games(RandomBatchPolicy(True), SimpleBatchPolicy(False), 100, seed=8)
+        self.assertTrue((first_result.base_values == second_result.base_values).all())
+        self.assertTrue((first_result.player1_won_hands == second_result.player1_won_hands).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from benchmark import AI_FACTORIES, GAME_MATCHUPS, find_regressions, hand_corpus, run_benchmarks
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_hand_corpus_is_fixed(self):
+        self.assertListEqual(hand_corpus(30), hand_corpus(30))
+        self.assertTrue(all(len(set(cards)) == 5 for cards in hand_corpus(30)))
+
+    def test_run_benchmarks_reports_every_benchmark(self):
+        results = run_benchmarks(hands=20, deals=2, positions=4, monte_carlo_positions=1, games=1, repeats=1)
+
+        for name in AI_FACTORIES:
+            self.assertIn(f"play_move_{name}", results)
+        for player1_name, player2_name in GAME_MATCHUPS:
+            self.assertIn(f"games_{player1_name}_vs_{player2_name}", results)
+        self.assertTrue(all(rate > 0 for rate in results.values()))
+
+    def test_find_regressions(self):
+        baseline = {"fast": 100.0, "slow": 100.0, "removed": 100.0}
+        results = {"fast": 90.0, "slow": 50.0, "added": 1.0}
+
+        self.assertDictEqual(find_regressions(results, baseline, tolerance=0.15), {"slow": 0.5})
+        self.assertDictEqual(find_regressions(results, baseline, tolerance=0.05), {"fast": 0.9, "slow": 0.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import copy
+import pickle
+import unittest
+
+from game.card import Card, Suit, CARDS, ordinal_to_card
+
+
+class TestCard(unittest.TestCase):
+    def test_interned(self):
+        card = Card(Suit.HEARTS, 5)
+        self.assertIs(Card(Suit.HEARTS, 5), card)
+        self.assertIs(Card("HEARTS", 5), card)
+        self.assertIs(copy.deepcopy(card), card)
+        self.assertIs(pickle.loads(pickle.dumps(card)), card)
+        self.assertIs(ordinal_to_card(card.ordinal), card)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            Card(Suit.SPADES, 2).number = 3
+
+    def test_invalid_card(self):
+        with self.assertRaises(ValueError):
+            Card(Suit.SPADES, 14)
+
+    def test_ordering(self):
+        self.assertEqual(len(set(CARDS)), 52)
+        self.assertGreater(Card(Suit.CLUBS, 1), Card(Suit.SPADES, 13))
+        self.assertGreater(Card(Suit.SPADES, 10), Card(Suit.HEARTS, 10))
+        self.assertLess(Card(Suit.SPADES, 2), Card(Suit.CLUBS, 3))
+        self.assertListEqual(sorted(reversed(CARDS)), CARDS)
+        self.assertIs(max(CARDS), Card(Suit.SPADES, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from typing import Callable, List
+
+import numpy as np
+
+from game import Decision, DecisionBatch, Deck, NO_REPLACEMENT, spawn_generators
+from game.batch_scoring import EMPTY_SLOT
+from players import RandomPokerAi, SimplePokerAi
+from run_game import play_game_steps
+
+
+def play_lockstep(games: int, seed: int, check_turn: Callable[[List[Decision]], None]) -> None:
+    """ Play games between random players in lockstep, calling `check_turn` on the decisions of each turn. """
+    players = {True: RandomPokerAi(True), False: RandomPokerAi(False)}
+    steps = [play_game_steps(Deck(rng=deck_rng)) for deck_rng in spawn_generators(seed, games)]
+    decisions = [next(game_steps) for game_steps in steps]
+    while decisions:
+        check_turn(decisions)
+        try:
+            decisions = [game_steps.send(players[decision.is_first_player].decide(decision))
+                         for game_steps, decision in zip(steps, decisions)]
+        except StopIteration:
+            decisions = []
+
+
+class TestDecisionBatch(unittest.TestCase):
+    def test_arrays(self):
+        players = {True: RandomPokerAi(True), False: RandomPokerAi(False)}
+        steps = play_game_steps(Deck(rng=np.random.default_rng(3)))
+        decision = next(steps)
+        for _ in range(41):
+            decision = steps.send(players[decision.is_first_player].decide(decision))
+
+        batch = DecisionBatch([decision])
+        player = decision.is_first_player
+        self.assertTrue(decision.is_last_move)
+        self.assertEqual(batch.cards[0], decision.card.ordinal)
+        for hand_index, (hand, other_hand) in enumerate(zip(decision.hands, decision.other_hands)):
+            self.assertListEqual(list(batch.hands[0, hand_index]), [card.ordinal for card in hand.get_cards(player)])
+            self.assertListEqual(list(batch.other_hands[0, hand_index]),
+                                 [card.ordinal for card in other_hand.get_cards(player)] + [EMPTY_SLOT])
+            self.assertEqual(batch.hand_values[0, hand_index], hand.get_value(player))
+        self.assertListEqual(list(batch.hand_sizes[0]), [5] * 5)
+        self.assertListEqual(list(np.flatnonzero(batch.cards_left[0])),
+                             [card.ordinal for card in decision.deck.get_cards_left(player)])
+
+    def test_simple_batch_matches_single_moves(self):
+        players = {True: SimplePokerAi(True), False: SimplePokerAi(False)}
+
+        def check_turn(decisions: List[Decision]):
+            if not decisions[0].is_last_move:
+                ai = players[decisions[0].is_first_player]
+                self.assertListEqual(ai.decide_batch(decisions), [ai.decide(decision) for decision in decisions])
+
+        play_lockstep(10, 7, check_turn)
+
+    def test_default_batch_keeps_none(self):
+        class KeepingPokerAi(RandomPokerAi):
+            def play_last_move(self, card_to_play, hands, other_hands, deck):
+                return None
+
+        ai = KeepingPokerAi(True)
+        last_turns = []
+
+        def check_turn(decisions: List[Decision]):
+            if decisions[0].is_last_move and decisions[0].is_first_player:
+                last_turns.append(decisions)
+                self.assertListEqual(list(ai.play_moves_batch(DecisionBatch(decisions))), [NO_REPLACEMENT] * 2)
+                self.assertListEqual(ai.decide_batch(decisions), [None, None])
+
+        play_lockstep(2, 1, check_turn)
+        self.assertEqual(len(last_turns), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
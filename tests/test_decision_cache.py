@@ -0,0 +1,133 @@
+import unittest
+from typing import List
+
+import numpy as np
+
+from game import Card, Decision, Deck, Hand
+from game.canonical import canonical_decision
+from players import AdvancedPokerAi, CachedPokerAi, DecisionCache, EquityPokerAi, SimplePokerAi
+from run_game import play_game_steps, run_game
+
+SUIT_PERMUTATION = {"CLUBS": "HEARTS", "DIAMONDS": "CLUBS", "HEARTS": "SPADES", "SPADES": "DIAMONDS"}
+SUIT_SWAP = {"CLUBS": "SPADES", "DIAMONDS": "DIAMONDS", "HEARTS": "HEARTS", "SPADES": "CLUBS"}
+HAND_PERMUTATION = [3, 0, 4, 2, 1]
+
+
+def permute_card(card: Card, suit_permutation: dict = SUIT_PERMUTATION) -> Card:
+    return Card(suit_permutation[card.suit.name], card.number)
+
+
+def permute_positions(decision: Decision, hand_permutation: List[int] = HAND_PERMUTATION) -> Decision:
+    """ The decision with its hand positions shuffled, its deck holding the same cards. """
+    player = decision.is_first_player
+    hands = [Hand(player, decision.hands[index].get_cards(player)) for index in hand_permutation]
+    other_hands = [Hand(not player, decision.other_hands[index].get_cards(player)) for index in hand_permutation]
+    deck = Deck(decision.deck.get_cards_left(player))
+    return Decision(player, decision.card, hands, other_hands, deck, decision.is_last_move)
+
+
+def early_decisions(seed: int):
+    """ Placement decisions before the last cards are hidden, played by simple players. """
+    steps = play_game_steps(Deck(rng=np.random.default_rng(seed)))
+    decision = next(steps)
+    while decision.deck.cards_left_amount > 12:
+        yield decision
+        decision = steps.send(SimplePokerAi(decision.is_first_player).decide(decision))
+
+
+def last_move_decisions(seeds):
+    """ Last move decisions of games between simple players. """
+    for seed in seeds:
+        steps = play_game_steps(Deck(rng=np.random.default_rng(seed)))
+        decision = next(steps)
+        while True:
+            if decision.is_last_move:
+                yield decision
+            try:
+                decision = steps.send(SimplePokerAi(decision.is_first_player).decide(decision))
+            except StopIteration:
+                break
+
+
+def permute_suits(decision: Decision, suit_permutation: dict = SUIT_PERMUTATION) -> Decision:
+    """ The decision with its suits renamed, its hands keeping their positions. """
+    player = decision.is_first_player
+
+    def permute(cards):
+        return [permute_card(card, suit_permutation) for card in cards]
+
+    hands = [Hand(player, permute(hand.get_cards(player))) for hand in decision.hands]
+    other_hands = [Hand(not player, permute(hand.get_cards(player))) for hand in decision.other_hands]
+    deck = Deck(permute(decision.deck.get_cards_left(player)))
+    return Decision(player, permute_card(decision.card, suit_permutation), hands, other_hands, deck,
+                    decision.is_last_move)
+
+
+class TestCanonicalDecision(unittest.TestCase):
+    def test_same_decision_has_same_key(self):
+        for decision in early_decisions(0):
+            self.assertEqual(canonical_decision(permute_positions(decision, list(range(5)))),
+                             canonical_decision(decision))
+
+    def test_hand_positions_are_not_merged(self):
+        # The AIs break ties by hand index, so reordering the hands can change the answer
+        for decision in early_decisions(0):
+            self.assertNotEqual(canonical_decision(permute_positions(decision)), canonical_decision(decision))
+
+    def test_suits_are_not_merged(self):
+        # Suits break ties between equal hands, so renaming them can change the answer
+        for decision in early_decisions(0):
+            self.assertNotEqual(canonical_decision(permute_suits(decision)), canonical_decision(decision))
+
+    def test_different_decisions_have_different_keys(self):
+        keys = [canonical_decision(decision) for seed in range(3) for decision in early_decisions(seed)]
+        self.assertEqual(len(set(keys)), len(keys))
+
+
+class TestDecisionCache(unittest.TestCase):
+    def test_least_recently_used_is_evicted(self):
+        cache = DecisionCache(max_size=2)
+        cache.lookup("a", lambda: 1)
+        cache.lookup("b", lambda: 2)
+        self.assertEqual(cache.lookup("a", lambda: 3), 1)
+        cache.lookup("c", lambda: 4)
+        self.assertEqual(cache.lookup("b", lambda: 5), 5)
+        self.assertEqual(cache.lookup("a", lambda: 6), 6)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions, len(cache)), (1, 5, 3, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 6)
+
+    def test_plays_as_uncached_on_reordered_hands(self):
+        # Simple players take the first hand that fits, so reordering the hands changes their answer
+        for ai_type in [SimplePokerAi, AdvancedPokerAi]:
+            cache = DecisionCache()
+            for seed in range(10):
+                for decision in early_decisions(seed):
+                    for played_decision in [decision, permute_positions(decision), permute_positions(decision)]:
+                        ai = ai_type(played_decision.is_first_player)
+                        cached_ai = CachedPokerAi(ai_type(played_decision.is_first_player), cache)
+                        self.assertEqual(cached_ai.decide(played_decision), ai.decide(played_decision))
+            self.assertEqual(2 * cache.hits, cache.misses)
+
+    def test_search_ai_plays_as_uncached_on_permuted_suits(self):
+        cache = DecisionCache()
+        for decision in last_move_decisions(range(40)):
+            for played_decision in [decision, permute_suits(decision), permute_suits(decision, SUIT_SWAP)]:
+                ai = EquityPokerAi(played_decision.is_first_player)
+                cached_ai = CachedPokerAi(EquityPokerAi(played_decision.is_first_player), cache,
+                                          cache_last_moves=True)
+                self.assertEqual(cached_ai.decide(played_decision), ai.decide(played_decision))
+        self.assertEqual(cache.hits, 0)
+
+    def test_replayed_games_hit_the_cache(self):
+        advanced_cache, simple_cache = DecisionCache(), DecisionCache()
+        results = [run_game(CachedPokerAi(AdvancedPokerAi(True), advanced_cache),
+                            CachedPokerAi(SimplePokerAi(False), simple_cache), seed=seed) for seed in [5, 6, 5]]
+        self.assertEqual(results[2], results[0])
+        self.assertEqual(results[0], run_game(AdvancedPokerAi(True), SimplePokerAi(False), seed=5))
+        for cache in [advanced_cache, simple_cache]:
+            self.assertEqual(cache.hits, 20)
+            self.assertEqual(cache.misses, 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
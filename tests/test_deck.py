@@ -58,6 +58,27 @@ class TestDeckSanity(unittest.TestCase):
         for card_number in range(1, 14):
             self.assertEqual(deck._number_left[card_number], 0)
 
+    def test_remove_card(self):
+        deck = Deck()
+        card = deck.get_cards_left(True)[0]
+        deck.remove_card(card)
+        deck.remove_card(card)
+
+        self.assertEqual(deck.cards_left_amount, 51)
+        self.assertNotIn(card, deck.get_cards_left(True))
+        self.assertEqual(deck.get_suit_left(card.suit, True), 12)
+        self.assertEqual(deck.get_number_left(card.number, True), 3)
+
+        popped_cards = [deck.pop() for _ in range(51)]
+        self.assertNotIn(card, popped_cards)
+        self.assertIsNone(deck.pop())
+
+    def test_initial_cards_pop_from_the_end(self):
+        cards = Deck().get_cards_left(True)[:5]
+        deck = Deck(cards)
+        self.assertEqual(deck.cards_left_amount, 5)
+        self.assertListEqual([deck.pop() for _ in range(5)], cards[::-1])
+
 
 class TestDeckHiddenCards(unittest.TestCase):
     def test_deck_first_hidden_pop_card(self):
@@ -91,6 +112,8 @@ class TestDeckHiddenCards(unittest.TestCase):
         self.assertNotEqual(players_cards[0], players_cards[1])
         self.assertListEqual(sorted(players_cards[0]), sorted(deck.get_cards_left(False)))
         self.assertListEqual(sorted(players_cards[1]), sorted(deck.get_cards_left(True)))
+        self.assertEqual(deck.get_cards_left_amount(True), 6)
+        self.assertEqual(deck.get_cards_left_amount(False), 6)
 
         first_suits = [card.suit for card in players_cards[0]]
         second_suits = [card.suit for card in players_cards[1]]
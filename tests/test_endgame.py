@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+
+from game import Deck, has_better_cards
+from game.card import CARDS
+from game.endgame import EndgamePosition, EndgameSolver
+from game.equity import last_move_equity
+from game.game_state import GameState, LAST_MOVES_TURN
+from players import AdvancedPokerAi, EndgamePokerAi, RandomPokerAi, SimplePokerAi
+from run_game import play_game_steps, run_game
+
+
+def endgame_decisions(seed: int):
+    """ The decisions of a game between simple players from the point every hand holds four cards. """
+    steps = play_game_steps(Deck(rng=np.random.default_rng(seed)))
+    decision = next(steps)
+    while True:
+        if EndgamePosition.from_decision(decision).is_endgame:
+            yield decision
+        try:
+            decision = steps.send(SimplePokerAi(decision.is_first_player).decide(decision))
+        except StopIteration:
+            return
+
+
+def brute_force_value(position: EndgamePosition, hands, unseen, card) -> float:
+    """ Expected score once `card` is drawn, searching every draw and placement without memo nor pruning. """
+    def score(own_hands, unseen_left):
+        return sum(np.mean([has_better_cards(own_cards, other_cards + [x]) if position.is_first_player
+                            else not has_better_cards(other_cards + [x], own_cards) for x in unseen_left])
+                   for own_cards, other_cards in zip(own_hands, position.other_hands))
+
+    if all(len(cards) == 5 for cards in hands):
+        return max([score(hands, unseen)] + [score(hands[:index] + [cards[:4] + [card]] + hands[index + 1:], unseen)
+                                             for index, cards in enumerate(hands)])
+    return max(np.mean([brute_force_value(position, hands[:index] + [cards + [card]] + hands[index + 1:],
+                                          unseen[:drawn] + unseen[drawn + 1:], next_card)
+                        for drawn, next_card in enumerate(unseen)])
+               for index, cards in enumerate(hands) if len(cards) == 4)
+
+
+def cards_position(position: EndgamePosition):
+    """ The own hands, the position with the opponent's cards, the unseen cards and the card to play, as cards. """
+    return ([[CARDS[ordinal] for ordinal in cards] for cards in position.hands],
+            position._replace(other_hands=[[CARDS[ordinal] for ordinal in cards] for cards in position.other_hands]),
+            [CARDS[ordinal] for ordinal in position.unseen], CARDS[position.card])
+
+
+class TestEndgameSolver(unittest.TestCase):
+    def test_last_moves_match_equity(self):
+        for seed in range(5):
+            for decision in endgame_decisions(seed):
+                if decision.is_last_move:
+                    values = EndgameSolver(EndgamePosition.from_decision(decision)).move_values()
+                    np.testing.assert_allclose(list(values.values()), last_move_equity(decision))
+                    self.assertEqual(list(values), [None, 0, 1, 2, 3, 4])
+
+    def test_matches_brute_force(self):
+        solved = 0
+        for seed in range(3):
+            for decision in endgame_decisions(seed):
+                position = EndgamePosition.from_decision(decision)
+                if decision.is_last_move or len(position.unseen) > 7:
+                    continue
+                solver = EndgameSolver(position)
+                values = solver.move_values()
+                hands, known, unseen, card = cards_position(position)
+                for hand_index, value in values.items():
+                    placed = hands[:hand_index] + [hands[hand_index] + [card]] + hands[hand_index + 1:]
+                    self.assertAlmostEqual(value, np.mean([
+                        brute_force_value(known, placed, unseen[:drawn] + unseen[drawn + 1:], next_card)
+                        for drawn, next_card in enumerate(unseen)]))
+                self.assertEqual(values[EndgameSolver(position).best_move()], max(values.values()))
+                solved += 1
+        self.assertGreater(solved, 0)
+
+    def test_pruning_keeps_best_move(self):
+        position = next(position for position in map(EndgamePosition.from_decision, endgame_decisions(4))
+                        if len(position.unseen) <= 9)
+        unpruned = EndgameSolver(position)
+        values = unpruned.move_values()
+        pruned = EndgameSolver(position)
+        self.assertEqual(values[pruned.best_move()], max(values.values()))
+        self.assertLessEqual(pruned.nodes, unpruned.nodes)
+
+    def test_game_state_position(self):
+        state = GameState(list(np.random.default_rng(0).permutation(52)))
+        while state.turn < LAST_MOVES_TURN - 4:
+            state.apply(state.legal_moves()[0])
+        position = EndgamePosition.from_game_state(state)
+        self.assertTrue(position.is_endgame)
+        self.assertEqual(position.card, state.cards[-1])
+        self.assertEqual(len(position.unseen), len(state.unseen_cards(0)) - 1)
+        self.assertEqual(set(EndgameSolver(position).move_values()), set(state.legal_moves()))
+
+    def test_rejects_early_positions(self):
+        decision = next(play_game_steps(Deck(rng=np.random.default_rng(0))))
+        with self.assertRaises(ValueError):
+            EndgameSolver(EndgamePosition.from_decision(decision))
+
+
+class TestEndgamePokerAi(unittest.TestCase):
+    def test_beats_advanced_ai(self):
+        endgame_score = sum(run_game(EndgamePokerAi(AdvancedPokerAi(True), max_cards=8), RandomPokerAi(False),
+                                     seed=seed).player_scores[0] for seed in range(100))
+        advanced_score = sum(run_game(AdvancedPokerAi(True), RandomPokerAi(False), seed=seed).player_scores[0]
+                             for seed in range(100))
+        self.assertGreater(endgame_score, advanced_score)
+
+
+if __name__ == '__main__':
+    unittest.main()
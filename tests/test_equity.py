@@ -0,0 +1,83 @@
+import unittest
+from itertools import permutations
+
+import numpy as np
+
+from game import Deck, has_better_cards
+from game.equity import BEST_REPLY, RANDOM_REPLY, best_last_move, last_move_equity
+from players import AdvancedPokerAi, EquityPokerAi, RandomPokerAi, SimplePokerAi
+from run_game import play_game_steps, run_game
+
+
+def last_move_equities(seed: int, opponent_reply: str = RANDOM_REPLY):
+    """ Equities and brute-force scores of both last moves of a game between simple players. """
+    players = {True: SimplePokerAi(True, np.random.default_rng(seed)),
+               False: SimplePokerAi(False, np.random.default_rng(seed + 1))}
+    steps = play_game_steps(Deck(rng=np.random.default_rng(seed)))
+    decision = next(steps)
+    computed = []
+    while True:
+        if decision.is_last_move:
+            computed.append((last_move_equity(decision, opponent_reply), brute_force_equity(decision, opponent_reply)))
+        try:
+            decision = steps.send(players[decision.is_first_player].decide(decision))
+        except StopIteration:
+            return computed
+
+
+def brute_force_equity(decision, opponent_reply):
+    player = decision.is_first_player
+    hands = [hand.get_cards(player) for hand in decision.hands]
+    other_visible_cards = [hand.get_cards(player)[:4] for hand in decision.other_hands]
+    unseen_cards = decision.deck.get_cards_left(player)
+
+    def score(own_hands, other_hands):
+        return sum(has_better_cards(own, other) if player else not has_better_cards(other, own)
+                   for own, other in zip(own_hands, other_hands))
+
+    equities = []
+    for option in [None, 0, 1, 2, 3, 4]:
+        own_hands = [cards[:4] + [decision.card] if index == option else cards for index, cards in enumerate(hands)]
+        world_scores = []
+        for world in permutations(unseen_cards, 6 if player else 5):
+            other_hands = [cards + [card] for cards, card in zip(other_visible_cards, world)]
+            if not player:
+                world_scores.append(score(own_hands, other_hands))
+                continue
+            reply_scores = [score(own_hands, other_hands)]
+            for reply in range(5):
+                replied_hands = [cards[:4] + [world[5]] if index == reply else cards
+                                 for index, cards in enumerate(other_hands)]
+                reply_scores.append(score(own_hands, replied_hands))
+            world_scores.append(min(reply_scores) if opponent_reply == BEST_REPLY else np.mean(reply_scores))
+        equities.append(np.mean(world_scores))
+    return equities
+
+
+class TestLastMoveEquity(unittest.TestCase):
+    def test_matches_enumeration(self):
+        for seed, opponent_reply in [(0, RANDOM_REPLY), (1, BEST_REPLY)]:
+            for equity, expected in last_move_equities(seed, opponent_reply):
+                np.testing.assert_allclose(equity, expected)
+
+    def test_unknown_opponent_reply(self):
+        steps = play_game_steps(Deck(rng=np.random.default_rng(3)))
+        decision = next(steps)
+        while not decision.is_last_move:
+            decision = steps.send(SimplePokerAi(decision.is_first_player).decide(decision))
+        with self.assertRaises(ValueError):
+            last_move_equity(decision, "psychic")
+        self.assertIn(best_last_move(decision), [None, 0, 1, 2, 3, 4])
+
+
+class TestEquityPokerAi(unittest.TestCase):
+    def test_last_moves_beat_advanced_ai(self):
+        equity_score = sum(run_game(EquityPokerAi(True), RandomPokerAi(False), seed=seed).player_scores[0]
+                           for seed in range(100))
+        advanced_score = sum(run_game(AdvancedPokerAi(True), RandomPokerAi(False), seed=seed).player_scores[0]
+                           for seed in range(100))
+        self.assertGreater(equity_score, advanced_score)
+
+
+if __name__ == '__main__':
+    unittest.main()
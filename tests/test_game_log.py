@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from game_log import NO_LAST_MOVE, RECORD_DTYPE, GameLogReader, GameLogWriter
+from players import AdvancedPokerAi, RandomPokerAi, SimplePokerAi
+from run_game import run_game
+from tournament import chunk_log_name, play_games, run_tournament
+
+
+class TestGameLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "games.cpgl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record_games(self, seeds, buffer_size=4, append=False):
+        with GameLogWriter(self.file_name, ("SimplePokerAi", "RandomPokerAi"), buffer_size, append) as recorder:
+            return [run_game(SimplePokerAi(True), RandomPokerAi(False), seed=seed, recorder=recorder)
+                    for seed in seeds]
+
+    def test_records(self):
+        results = self.record_games(range(10))
+        log = GameLogReader(self.file_name)
+
+        self.assertEqual(log.player_names, ("SimplePokerAi", "RandomPokerAi"))
+        self.assertEqual(len(log), 10)
+        self.assertLess(os.path.getsize(self.file_name) - 10 * RECORD_DTYPE.itemsize, 100)
+        for record, result in zip(log.records, results):
+            self.assertListEqual(sorted(record["deck"]), list(range(52)))
+            self.assertTrue(np.all(np.bincount(record["moves"][0::2], minlength=5) == 4))
+            self.assertTrue(all(move < 5 or move == NO_LAST_MOVE for move in record["last_moves"]))
+            self.assertEqual(tuple(record["scores"]), result.player_scores)
+
+    def test_replay(self):
+        with GameLogWriter(self.file_name, ("AdvancedPokerAi", "SimplePokerAi")) as recorder:
+            results = [run_game(AdvancedPokerAi(True), SimplePokerAi(False), seed=seed, recorder=recorder)
+                       for seed in range(10)]
+
+        log = GameLogReader(self.file_name)
+        for game_index, result in enumerate(results):
+            self.assertEqual(log.replay(game_index), result)
+
+    def test_append(self):
+        self.record_games(range(3))
+        self.record_games(range(3, 5), append=True)
+        log = GameLogReader(self.file_name)
+        self.assertEqual(len(log), 5)
+        self.assertListEqual([len(chunk) for chunk in log.chunks(2)], [2, 2, 1])
+
+        with self.assertRaises(ValueError):
+            GameLogWriter(self.file_name, ("RandomPokerAi", "RandomPokerAi"), append=True)
+
+    def test_replaces_existing_log(self):
+        self.record_games(range(3))
+        self.record_games(range(3, 5))
+        self.assertEqual(len(GameLogReader(self.file_name)), 2)
+
+        GameLogWriter(self.file_name, ("RandomPokerAi", "RandomPokerAi")).close()
+        self.assertEqual(GameLogReader(self.file_name).player_names, ("RandomPokerAi", "RandomPokerAi"))
+
+    def test_empty_log(self):
+        GameLogWriter(self.file_name, ("RandomPokerAi", "RandomPokerAi")).close()
+        self.assertEqual(len(GameLogReader(self.file_name)), 0)
+
+    def test_tournament_logs(self):
+        result = run_tournament(RandomPokerAi, SimplePokerAi, 7, seed=1, workers=1, chunk_size=3,
+                                log_directory=self.directory.name)
+        logs = [GameLogReader(os.path.join(self.directory.name, file_name))
+                for file_name in sorted(os.listdir(self.directory.name))]
+
+        self.assertListEqual([len(log) for log in logs], [3, 3, 1])
+        player1_score = sum(int(log.records["scores"][:, 0].sum()) for log in logs)
+        self.assertEqual(player1_score, result.player_scores[0])
+
+    def test_tournament_rerun_does_not_log_twice(self):
+        for _ in range(2):
+            run_tournament(RandomPokerAi, SimplePokerAi, 7, seed=1, workers=1, chunk_size=3,
+                           log_directory=self.directory.name)
+        logs = [GameLogReader(os.path.join(self.directory.name, file_name))
+                for file_name in sorted(os.listdir(self.directory.name))]
+        self.assertListEqual([len(log) for log in logs], [3, 3, 1])
+
+    def test_failing_game_keeps_recorded_games(self):
+        class FailingAi(RandomPokerAi):
+            games = 0
+
+            def reseed(self, rng):
+                super().reseed(rng)
+                FailingAi.games += 1
+                if FailingAi.games == 3:
+                    raise RuntimeError("failing game")
+
+        with self.assertRaises(RuntimeError):
+            play_games(FailingAi, SimplePokerAi, 1, 0, 5, log_directory=self.directory.name)
+        self.assertEqual(len(GameLogReader(chunk_log_name(self.directory.name, 0))), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from game import Deck, legal_moves
+from game.protocol import decode_decision, decode_message, encode_message
+from game_server import GameServer, Seat
+from players import RandomPokerAi, SimplePokerAi
+from tournament import run_tournament
+
+
+async def play_as_client(port: int, request: dict, illegal: object = False) -> List[dict]:
+    """ Connect, ask for a match and play the first legal move of every decision, returning what was received.
+    An `illegal` move other than False is played instead, True playing hand 7. """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(encode_message({"type": "play", **request}))
+    received = []
+    while line := await reader.readline():
+        message = decode_message(line)
+        received.append(message)
+        if message["type"] in ("move", "last_move"):
+            if illegal is False:
+                played_hand = legal_moves(decode_decision(message))[0]
+            else:
+                played_hand = 7 if illegal is True else illegal
+            writer.write(encode_message({"type": "move", "game": message["game"], "hand": played_hand}))
+        elif message["type"] == "match_over":
+            break
+    writer.close()
+    await writer.wait_closed()
+    return received
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.game_server = GameServer(ThreadPoolExecutor(2))
+        self.server = await self.game_server.serve("127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.game_server.executor.shutdown()
+
+    async def test_ai_match_matches_tournament(self):
+        result = await self.game_server.run_match("simple", "random", 12, seed=3)
+        expected = run_tournament(SimplePokerAi, RandomPokerAi, 12, seed=3, workers=1)
+        self.assertEqual(result.player_scores, expected.player_scores)
+        self.assertEqual(dict(result.win_by_hand_value), dict(expected.win_by_hand_value))
+
+    async def test_offloaded_ai(self):
+        result = await self.game_server.run_match("monte_carlo", "random", 2, seed=1)
+        self.assertEqual(result.games, 2)
+
+    async def test_client_against_server_ai(self):
+        received = await play_as_client(self.port, {"opponent": "simple", "games": 3, "seat": 2, "seed": 4})
+
+        moves = [message for message in received if message["type"] == "move"]
+        last_moves = [message for message in received if message["type"] == "last_move"]
+        results = [message for message in received if message["type"] == "result"]
+        self.assertEqual(len(moves), 3 * 20)
+        self.assertEqual(len(last_moves), 3)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(not message["first_player"] for message in moves))
+        self.assertTrue(all(len(message["other_hands"][0]) <= 4 for message in last_moves))
+        self.assertEqual(received[-1]["games"], 3)
+        self.assertEqual(sum(received[-1]["scores"]), 3 * 5)
+
+    async def test_two_clients(self):
+        first, second = await asyncio.gather(play_as_client(self.port, {"opponent": "remote", "games": 2}),
+                                             play_as_client(self.port, {"opponent": "remote", "games": 2}))
+        self.assertEqual(first[-1], second[-1])
+        self.assertEqual(first[-1]["games"], 2)
+        self.assertTrue(all(message["first_player"] for message in first if message["type"] == "move"))
+        self.assertTrue(all(not message["first_player"] for message in second if message["type"] == "move"))
+
+    async def test_illegal_move_aborts_game(self):
+        received = await play_as_client(self.port, {"opponent": "random", "games": 1}, illegal=True)
+        self.assertEqual(received[-2]["type"], "error")
+        self.assertEqual(received[-1]["games"], 0)
+
+    async def test_non_integer_move_aborts_game(self):
+        for illegal in [1.0, "1", [1]]:
+            received = await play_as_client(self.port, {"opponent": "random", "games": 1}, illegal=illegal)
+            self.assertEqual(received[-2]["type"], "error")
+            self.assertEqual(received[-1]["games"], 0)
+
+    async def test_failing_game_is_reported(self):
+        class FailingSeat(Seat):
+            async def decide(self, game_id, decision):
+                raise RuntimeError("broken seat")
+
+        class Connection:
+            def __init__(self):
+                self.sent = []
+
+            def send(self, message):
+                self.sent.append(message)
+
+            async def drain(self):
+                pass
+
+        connection = Connection()
+        result = await self.game_server._play_match([(FailingSeat(), FailingSeat())], [Deck()], [connection])
+        self.assertEqual(result.games, 0)
+        self.assertEqual([message["type"] for message in connection.sent], ["error", "match_over"])
+
+    async def test_invalid_fields_are_protocol_errors(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        invalid_messages = [{"type": "play", "games": "many"}, {"type": "play", "games": 0},
+                            {"type": "play", "games": 10 ** 9}, {"type": "play", "games": True},
+                            {"type": "play", "seat": "first"}, {"type": "play", "seat": 3},
+                            {"type": "play", "seed": "x"}, {"type": "play", "seed": -1},
+                            {"type": "move", "game": [1], "hand": 0}, {"type": "move", "game": {}, "hand": 0}]
+        for message in invalid_messages:
+            writer.write(encode_message(message))
+            self.assertEqual(decode_message(await reader.readline())["type"], "error", message)
+
+        # The connection still plays once the errors are answered
+        writer.write(encode_message({"type": "play", "opponent": "random", "games": 1, "seed": 2}))
+        while (message := decode_message(await reader.readline()))["type"] != "match_over":
+            if message["type"] in ("move", "last_move"):
+                writer.write(encode_message({"type": "move", "game": message["game"],
+                                             "hand": legal_moves(decode_decision(message))[0]}))
+        self.assertEqual(message["games"], 1)
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_unknown_opponent(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        for opponent in ["nobody", ["random"], {"name": "random"}, 1]:
+            writer.write(encode_message({"type": "play", "opponent": opponent}))
+            self.assertEqual(decode_message(await reader.readline())["type"], "error", opponent)
+        writer.close()
+        await writer.wait_closed()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+from typing import List
+
+import numpy as np
+
+from game import Card, Deck, Hand
+from game.game_state import GameState, FINAL_TURN
+from players import RandomPokerAi
+from run_game import run_game
+
+
+class ReplacingRandomPokerAi(RandomPokerAi):
+    def play_last_move(self, card_to_play: Card, hands: List[Hand], other_hands: List[Hand], deck: Deck) -> int | None:
+        return 2
+
+
+def shuffled_cards(seed: int) -> List[Card]:
+    deck = Deck(rng=np.random.default_rng(seed))
+    return [deck.pop() for _ in range(52)][::-1]
+
+
+class TestGameState(unittest.TestCase):
+    def test_plays_like_run_game(self):
+        for seed in range(10):
+            cards = shuffled_cards(seed)
+            state = GameState.from_cards(cards)
+            while not state.is_over:
+                state.apply(2 if state.turn >= 50 else state.legal_moves()[0])
+
+            game_result = run_game(ReplacingRandomPokerAi(True), ReplacingRandomPokerAi(False), deck=Deck(cards))
+            self.assertEqual(state.scores(), game_result.player_scores)
+
+    def test_undo_restores_state(self):
+        generator = random.Random(3)
+        state = GameState.from_cards(shuffled_cards(1))
+        initial_state = state.copy()
+
+        snapshots = []
+        while not state.is_over:
+            snapshots.append((state.snapshot(), state.copy()))
+            state.apply(generator.choice(state.legal_moves()))
+        self.assertEqual(state.turn, FINAL_TURN)
+
+        for snapshot, copied_state in reversed(snapshots[::7]):
+            state.restore(snapshot)
+            self.assertEqual(state.cards, copied_state.cards)
+            self.assertEqual(state.hands, copied_state.hands)
+            self.assertEqual(state.turn, copied_state.turn)
+
+        state.restore(0)
+        self.assertEqual(state.cards, initial_state.cards)
+        self.assertEqual(state.hands, initial_state.hands)
+
+    def test_unseen_cards(self):
+        state = GameState.from_cards(shuffled_cards(2))
+        while state.turn < 45:
+            state.apply(state.legal_moves()[0])
+        for player in range(2):
+            unseen_cards = state.unseen_cards(player)
+            self.assertEqual(len(unseen_cards), len(state.cards) + sum(len(hand) == 5 for hand in state.hands[1 - player]))
+            self.assertEqual(len(state.visible_hand(player, 1 - player, 0)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
+import random
 import unittest
 
-from game import Hand, Card
+from game import Hand, Card, evaluate_hand, calculate_hand_base_value, get_potential_values, get_potential_strengths
 from game.card import Suit
 
 
@@ -87,6 +88,50 @@ class TestHand(unittest.TestCase):
         self.assertFalse(10 in hand.get_values(self.current_player))
         self.assertFalse(10 in hand.get_values(not self.current_player))
 
+    def test_hand_incremental_value(self):
+        all_cards = [Card(suit, number) for suit in Suit for number in range(1, 14)]
+        generator = random.Random(0)
+        for _ in range(300):
+            cards = generator.sample(all_cards, 7)
+            hand = Hand(self.current_player)
+            self.assertEqual(hand.get_value(self.current_player), 0)
+
+            for card_index, card in enumerate(cards[:5]):
+                self.assertEqual(hand.get_value_with(card), evaluate_hand(cards[:card_index + 1]))
+                hand.add_card(card)
+                self.assertEqual(hand.get_value(self.current_player), evaluate_hand(cards[:card_index + 1]))
+                self.assertEqual(hand.get_value(not self.current_player), evaluate_hand(cards[:min(card_index + 1, 4)]))
+
+            self.assertEqual(hand.get_base_value(self.current_player), calculate_hand_base_value(cards[:5]))
+            for new_card in cards[5:]:
+                hand.replace_last_card(new_card)
+                self.assertEqual(hand.get_value(self.current_player), evaluate_hand(cards[:4] + [new_card]))
+                self.assertEqual(hand.get_value(not self.current_player), evaluate_hand(cards[:4]))
+
+    def test_hand_flush_value(self):
+        cards = [Card(Suit.HEARTS, number) for number in [2, 5, 7, 9, 12]]
+        hand = Hand(self.current_player, cards[:4])
+        self.assertEqual(hand.get_value_with(cards[4]), evaluate_hand(cards))
+        hand.add_card(cards[4])
+        self.assertEqual(hand.get_value(self.current_player), evaluate_hand(cards))
+
+        hand.replace_last_card(Card(Suit.SPADES, 12))
+        self.assertEqual(hand.get_value(self.current_player), evaluate_hand(cards[:4] + [Card(Suit.SPADES, 12)]))
+
+    def test_potential_values(self):
+        hands = [Hand(self.current_player, [Card(Suit.CLUBS, number), Card(Suit.HEARTS, number + 1)])
+                 for number in range(2, 7)]
+        hands[4].add_cards([Card(Suit.SPADES, 1), Card(Suit.SPADES, 2), Card(Suit.SPADES, 3)])
+        card = Card(Suit.DIAMONDS, 4)
+
+        potential_values = get_potential_values(hands, card)
+        potential_strengths = get_potential_strengths(hands, card)
+        for hand, potential_value, potential_strength in zip(hands[:4], potential_values, potential_strengths):
+            self.assertEqual(potential_value, evaluate_hand(hand.get_cards(self.current_player) + [card]))
+            self.assertEqual(potential_strength, calculate_hand_base_value(hand.get_cards(self.current_player) + [card]))
+        self.assertIsNone(potential_values[4])
+        self.assertIsNone(potential_strengths[4])
+
 
 def load_tests(loader, tests, pattern):
     suite = unittest.TestSuite()
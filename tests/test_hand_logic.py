@@ -1,7 +1,9 @@
+import random
 import unittest
 
-from game import calculate_hand_base_value, HandBaseValue, has_better_cards
+from game import calculate_hand_base_value, HandBaseValue, has_better_cards, compute_full_value, evaluate_hand
 from game.card import Card, Suit
+from game.hand_scoring import _calculate_hand_base_value_by_rules, extend_hand_base_value, factors_to_float
 
 
 class TestHandBaseValues(unittest.TestCase):
@@ -170,5 +172,28 @@ class TestHandComparison(unittest.TestCase):
             self.assertTrue(has_better_cards(hand, illegal_hand))
 
 
+class TestHandValueTable(unittest.TestCase):
+    def setUp(self):
+        all_cards = [Card(suit, number) for suit in Suit for number in range(1, 14)]
+        generator = random.Random(0)
+        self.hands = [generator.sample(all_cards, generator.randint(1, 5)) for _ in range(3000)]
+
+    def test_matches_rules(self):
+        for cards in self.hands:
+            base_value = _calculate_hand_base_value_by_rules(cards)
+            full_value = int(base_value) + factors_to_float(extend_hand_base_value(base_value, cards))
+            self.assertEqual(calculate_hand_base_value(cards), base_value)
+            self.assertEqual(compute_full_value(cards), full_value)
+
+    def test_comparison_matches_full_value(self):
+        for cards, compared_cards in zip(self.hands, reversed(self.hands)):
+            self.assertEqual(evaluate_hand(cards) > evaluate_hand(compared_cards),
+                             compute_full_value(cards) > compute_full_value(compared_cards))
+
+    def test_empty_hand(self):
+        self.assertEqual(evaluate_hand([]), 0)
+        self.assertEqual(compute_full_value([]), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+from collections import Counter
+from itertools import combinations
+
+from game import Deck, calculate_hand_base_value
+from game.card import Card, Suit
+from game.hand_odds import completion_odds, hand_completion_odds, flush_completion_probability
+
+
+class TestCompletionOdds(unittest.TestCase):
+    def assert_matches_enumeration(self, cards, cards_left):
+        draws = list(combinations(cards_left, 5 - len(cards)))
+        expected = Counter(calculate_hand_base_value(cards + list(draw)) for draw in draws)
+        odds = completion_odds(cards, cards_left)
+
+        self.assertAlmostEqual(sum(odds.values()), 1)
+        for base_value in set(expected) | set(odds):
+            self.assertAlmostEqual(odds.get(base_value, 0), expected[base_value] / len(draws))
+
+    def test_matches_enumeration(self):
+        all_cards = [Card(suit, number) for suit in Suit for number in range(1, 14)]
+        generator = random.Random(1)
+        for _ in range(20):
+            cards = generator.sample(all_cards, generator.randint(1, 4))
+            other_cards = [card for card in all_cards if card not in cards]
+            self.assert_matches_enumeration(cards, generator.sample(other_cards, 14))
+
+    def test_flush_draws(self):
+        cards = [Card(Suit.HEARTS, number) for number in [9, 10, 11]]
+        cards_left = ([Card(Suit.HEARTS, number) for number in [1, 2, 12, 13]]
+                      + [Card(Suit.SPADES, number) for number in range(2, 10)])
+        self.assert_matches_enumeration(cards, cards_left)
+        self.assert_matches_enumeration([], cards_left[:9])
+
+    def test_complete_hand(self):
+        cards = [Card(Suit.HEARTS, number) for number in [2, 4, 6, 8, 10]]
+        self.assertEqual(completion_odds(cards, []), {calculate_hand_base_value(cards): 1.0})
+
+    def test_deck_odds(self):
+        deck = Deck()
+        cards = [deck.pop() for _ in range(3)]
+        odds = hand_completion_odds(cards, deck, True)
+        self.assertAlmostEqual(sum(odds.values()), 1)
+
+    def test_flush_completion_probability(self):
+        cards = [Card(Suit.CLUBS, number) for number in [2, 7, 9]]
+        cards_left = [Card(suit, number) for suit in Suit for number in range(1, 14) if suit != Suit.CLUBS] + \
+                     [Card(Suit.CLUBS, number) for number in [3, 4, 5]]
+        odds = completion_odds(cards, cards_left)
+        flush_odds = sum(odds.get(base_value, 0) for base_value in odds if base_value.name.endswith("FLUSH"))
+        self.assertAlmostEqual(flush_completion_probability(2, 3, len(cards_left)), flush_odds)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import math
+import unittest
+
+import numpy as np
+
+from league import DEFAULT_CONFIDENCE, DEFAULT_HALF_WIDTH, DEFAULT_MAX_DEALS, DEFAULT_MIN_DEALS, MatchupResult, \
+    is_decided, look_schedule, paired_interval, play_matchup, run_league, standings
+from players import AdvancedPokerAi, RandomPokerAi, SimplePokerAi
+
+
+class TestPairedInterval(unittest.TestCase):
+    def test_known_values(self):
+        # 50 deals split evenly, plus the two pseudo-deals: mean 0.5 and variance 1 / 8 over 52 deals
+        low, high = paired_interval([25, 0, 25])
+        self.assertAlmostEqual(low, 0.5 - 1.959964 * math.sqrt(52 / 51 / 4 / 52), places=5)
+        self.assertAlmostEqual(high, 1 - low)
+
+        # Every deal won twice still leaves some doubt
+        low, high = paired_interval([0, 0, 100])
+        self.assertGreater(low, 0.9)
+        self.assertLess(low, 1.0)
+        self.assertEqual(high, 1.0)
+
+    def test_mirrored_deals_narrow_the_interval(self):
+        # The same games won, once as split deals and once as deals won or lost twice
+        split_low, split_high = paired_interval([0, 100, 0])
+        unpaired_low, unpaired_high = paired_interval([50, 0, 50])
+        self.assertLess(split_high - split_low, unpaired_high - unpaired_low)
+
+    def test_look_schedule(self):
+        self.assertEqual(look_schedule(50, 5000), [50, 100, 200, 400, 800, 1600, 3200, 5000])
+        self.assertEqual(look_schedule(10, 10), [10])
+        self.assertEqual(look_schedule(20, 5), [5])
+
+    def test_even_matchups_are_rarely_decided(self):
+        # Stopping at any look of the schedule keeps the false decisions within the confidence
+        rng = np.random.default_rng(0)
+        looks = look_schedule(DEFAULT_MIN_DEALS, DEFAULT_MAX_DEALS)
+        look_confidence = 1 - (1 - DEFAULT_CONFIDENCE) / len(looks)
+        wrongly_decided = 0
+        for _ in range(300):
+            outcomes = rng.choice(3, size=DEFAULT_MAX_DEALS, p=[0.3, 0.4, 0.3])
+            for deals in looks:
+                result = MatchupResult("a", "b", deal_wins=list(np.bincount(outcomes[:deals], minlength=3)))
+                if is_decided(result, 0.0, look_confidence):
+                    low, high = result.interval(look_confidence)
+                    wrongly_decided += low > 0.5 or high < 0.5
+                    break
+        self.assertLess(wrongly_decided / 300, 1 - DEFAULT_CONFIDENCE)
+
+
+class TestLeague(unittest.TestCase):
+    def test_mirrored_deals_cancel_out(self):
+        # Both seats of a deal give player 1 the same stream, so identical AIs play the same game twice
+        result = play_matchup("a", "b", {"a": SimplePokerAi, "b": SimplePokerAi}, seed=1, min_deals=10,
+                              max_deals=10)
+        self.assertEqual(result.games, 20)
+        self.assertEqual(result.first_wins, 10)
+        self.assertEqual(result.first_hands_won, 50)
+        self.assertEqual(result.deal_wins, [0, 10, 0])
+
+    def test_lopsided_matchups_stop_early(self):
+        ai_types = {"random": RandomPokerAi, "simple": SimplePokerAi, "advanced": AdvancedPokerAi}
+        lopsided = play_matchup("random", "advanced", ai_types, min_deals=20, max_deals=500)
+        self.assertLess(lopsided.games, 100)
+        self.assertLess(lopsided.interval()[1], 0.5)
+        # The reported interval is the one the stopping test used
+        self.assertAlmostEqual(lopsided.confidence, 1 - (1 - DEFAULT_CONFIDENCE) / len(look_schedule(20, 500)))
+        self.assertTrue(is_decided(lopsided, DEFAULT_HALF_WIDTH))
+
+        even = play_matchup("a", "b", {"a": SimplePokerAi, "b": SimplePokerAi}, half_width=0.01, min_deals=5,
+                            max_deals=30)
+        self.assertEqual(even.games, 60)
+
+    def test_round_robin(self):
+        ai_types = {"random": RandomPokerAi, "simple": SimplePokerAi, "advanced": AdvancedPokerAi}
+        results = run_league(ai_types, seed=2, min_deals=10, max_deals=20)
+        self.assertEqual([(result.first, result.second) for result in results],
+                         [("random", "simple"), ("random", "advanced"), ("simple", "advanced")])
+        for result in results:
+            self.assertEqual(result.games, 2 * result.deals)
+            self.assertIn(result.deals, look_schedule(10, 20))
+
+        table = standings(results)
+        self.assertEqual(table[-1][0], "random")
+        self.assertEqual(sum(games for _, games, _ in table), 2 * sum(result.games for result in results))
+
+    def test_empty_matchup(self):
+        result = MatchupResult("a", "b")
+        self.assertEqual(result.win_rate, 0.5)
+        self.assertEqual(result.deals, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import io
+import unittest
+
+import numpy as np
+
+from game import Deck, DecisionBatch
+from game.features import COMPARISON, FEATURES, OTHER_BASE_VALUE, OWN_DRAWS, hand_features, own_hand_features
+from players import LearnedPokerAi, LinearValueModel, RandomPokerAi
+from run_game import play_game_steps, run_game
+from training import fit_weights, self_play
+
+# Columns `own_hand_features` leaves out, the same for every placement
+HAND_INDEPENDENT = [OWN_DRAWS + 5] + list(range(OTHER_BASE_VALUE, COMPARISON)) + [COMPARISON + 1, COMPARISON + 2,
+                                                                                 COMPARISON + 3]
+
+
+def placement_decisions(seed: int):
+    """ Every placement decision of a game between learned players, taken before the move is played. """
+    players = {True: LearnedPokerAi(True), False: LearnedPokerAi(False)}
+    steps = play_game_steps(Deck(rng=np.random.default_rng(seed)))
+    decision = next(steps)
+    try:
+        while True:
+            if not decision.is_last_move:
+                yield decision
+            decision = steps.send(players[decision.is_first_player].decide(decision))
+    except StopIteration:
+        return
+
+
+class TestFeatures(unittest.TestCase):
+    def test_own_hand_features_match_arrays(self):
+        for decision in placement_decisions(0):
+            batch = DecisionBatch([decision])
+            features = hand_features(batch.hands, batch.hand_values, batch.other_hands, batch.cards_left)[0]
+            player = decision.is_first_player
+            for hand, other_hand, hand_features_row in zip(decision.hands, decision.other_hands, features):
+                sparse_features = np.zeros(FEATURES, dtype=np.float32)
+                for index, value in own_hand_features(hand.get_cards(player), hand.get_value(player),
+                                                      other_hand.get_value(player), decision.deck, player):
+                    sparse_features[index] = value
+                sparse_features[HAND_INDEPENDENT] = hand_features_row[HAND_INDEPENDENT]
+                np.testing.assert_allclose(sparse_features, hand_features_row, atol=1e-6)
+
+
+class TestLearnedPokerAi(unittest.TestCase):
+    def test_single_decisions_match_batch(self):
+        for decision in placement_decisions(1):
+            player = LearnedPokerAi(decision.is_first_player)
+            batch = DecisionBatch([decision])
+            scores = player.model.move_scores(batch.cards, batch.hands, batch.hand_sizes, batch.hand_values,
+                                              batch.other_hands, batch.cards_left)[0]
+            # Equal scores may be told apart differently by the rounding of the two paths
+            self.assertAlmostEqual(scores[player.decide(decision)], scores.max(), places=5)
+
+    def test_save_and_load(self):
+        model = LinearValueModel(np.arange(FEATURES, dtype=np.float32))
+        file = io.BytesIO()
+        model.save(file)
+        file.seek(0)
+        np.testing.assert_array_equal(LinearValueModel.load(file).weights, model.weights)
+
+    def test_beats_random_ai(self):
+        scores = [run_game(LearnedPokerAi(True), RandomPokerAi(False), seed=seed).player_scores for seed in range(50)]
+        self.assertGreater(sum(score[0] for score in scores), sum(score[1] for score in scores))
+
+
+class TestTraining(unittest.TestCase):
+    def test_self_play_normal_equations(self):
+        gram, correlations = self_play(LinearValueModel(), 200, seed=3, batch_size=64)
+        # Every hand of both players on each of their 20 placements, the last feature being constant
+        self.assertEqual(gram[-1, -1], 200 * 2 * 20 * 5)
+        self.assertTrue(0 < correlations[-1] < gram[-1, -1])
+        self.assertEqual(gram.shape, (FEATURES, FEATURES))
+        self.assertTrue(np.isfinite(fit_weights(gram, correlations)).all())
+
+    def test_self_play_is_seeded(self):
+        first = self_play(LinearValueModel(), 50, seed=4)
+        second = self_play(LinearValueModel(), 50, seed=4)
+        np.testing.assert_array_equal(first[0], second[0])
+        np.testing.assert_array_equal(first[1], second[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from game_log import GameLogReader
+from log_analysis import LogStatistics, analyze_logs
+from players import RandomPokerAi, SimplePokerAi
+from tournament import run_tournament
+
+
+class TestLogAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def log_tournament(self, player1_ai_type, player2_ai_type, games, name):
+        log_directory = os.path.join(self.directory.name, name)
+        result = run_tournament(player1_ai_type, player2_ai_type, games, seed=5, workers=1, chunk_size=7,
+                                log_directory=log_directory)
+        return result, [os.path.join(log_directory, file_name) for file_name in sorted(os.listdir(log_directory))]
+
+    def test_matches_tournament_result(self):
+        result, file_names = self.log_tournament(SimplePokerAi, RandomPokerAi, 20, "simple_random")
+        statistics = analyze_logs(file_names, chunk_size=3)
+
+        self.assertEqual(statistics.games, 20)
+        self.assertEqual(tuple(statistics.seat_wins), result.player_wins)
+        self.assertEqual(statistics.hand_wins.sum(), result.player_scores[0])
+        self.assertEqual(statistics.ai_wins, {"SimplePokerAi": result.player_wins[0],
+                                              "RandomPokerAi": result.player_wins[1]})
+        self.assertTrue(np.all(statistics.base_value_distribution.sum(axis=2) == 20))
+        self.assertEqual(sum(statistics.win_by_hand_value().values()), 20 * 5)
+
+        recorded_scores = np.concatenate([GameLogReader(file_name).records["scores"][:, 0]
+                                          for file_name in file_names])
+        self.assertListEqual(list(statistics.ai_score_histograms["SimplePokerAi"]),
+                             list(np.bincount(recorded_scores, minlength=6)))
+
+    def test_chunk_size_and_merge_do_not_change_statistics(self):
+        _, first_logs = self.log_tournament(SimplePokerAi, RandomPokerAi, 10, "first")
+        _, second_logs = self.log_tournament(RandomPokerAi, SimplePokerAi, 10, "second")
+
+        whole = analyze_logs(first_logs + second_logs, chunk_size=1000)
+        merged = LogStatistics()
+        merged.merge(analyze_logs(first_logs, chunk_size=1))
+        merged.merge(analyze_logs(second_logs, chunk_size=4))
+
+        self.assertEqual(merged.games, 20)
+        self.assertEqual(merged.ai_games, {"SimplePokerAi": 20, "RandomPokerAi": 20})
+        self.assertEqual(merged.ai_win_rates(), whole.ai_win_rates())
+        self.assertTrue(np.array_equal(merged.base_value_distribution, whole.base_value_distribution))
+        self.assertTrue(np.array_equal(merged.ai_score_histograms["RandomPokerAi"],
+                                       whole.ai_score_histograms["RandomPokerAi"]))
+        self.assertIn("SimplePokerAi", whole.summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from players import MonteCarloPokerAi, RandomPokerAi
+from run_game import run_game
+
+
+class TestMonteCarloPokerAi(unittest.TestCase):
+    def test_seeded_game_replays(self):
+        results = [run_game(MonteCarloPokerAi(True, rollouts=100), RandomPokerAi(False), seed=4) for _ in range(2)]
+        self.assertEqual(results[0], results[1])
+
+    def test_parallel_rollouts(self):
+        player = MonteCarloPokerAi(False, rollouts=200, batch_size=50, workers=2)
+        try:
+            result = run_game(RandomPokerAi(True), player, seed=6)
+        finally:
+            player.close()
+        self.assertEqual(sum(result.player_scores), 5)
+
+    def test_time_budget(self):
+        result = run_game(MonteCarloPokerAi(True, rollouts=10 ** 9, time_budget=0.001), RandomPokerAi(False), seed=1)
+        self.assertEqual(sum(result.player_scores), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import pstats
+import tempfile
+import unittest
+
+from players import RandomPokerAi, SimplePokerAi
+from profiling import GAME_PHASE, GameProfiler
+from run_game import run_game
+from tournament import run_tournament
+
+
+class TestGameProfiler(unittest.TestCase):
+    def test_phases_of_a_game(self):
+        profiler = GameProfiler()
+        for seed in range(3):
+            run_game(RandomPokerAi(True), SimplePokerAi(False), seed=seed, profiler=profiler)
+
+        calls = {phase: stats.calls for phase, stats in profiler.phases.items()}
+        self.assertDictEqual(calls, {GAME_PHASE: 3, "shuffle_deck": 3, "initialize_hands": 3,
+                                     "play_move[RandomPokerAi]": 60, "play_move[SimplePokerAi]": 60,
+                                     "play_last_move[RandomPokerAi]": 3, "play_last_move[SimplePokerAi]": 3,
+                                     "return_game_score": 3})
+        self.assertEqual(profiler.games, 3)
+        child_seconds = sum(stats.seconds for phase, stats in profiler.phases.items() if phase != GAME_PHASE)
+        self.assertLessEqual(child_seconds, profiler.phases[GAME_PHASE].seconds)
+        self.assertIn("play_move[SimplePokerAi]", profiler.summary())
+
+    def test_profiler_does_not_change_the_game(self):
+        self.assertEqual(run_game(RandomPokerAi(True), SimplePokerAi(False), seed=4, profiler=GameProfiler()),
+                         run_game(RandomPokerAi(True), SimplePokerAi(False), seed=4))
+
+    def test_dump_stats_loads_in_pstats(self):
+        profiler = GameProfiler()
+        run_game(seed=1, profiler=profiler)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "game.prof")
+            profiler.dump_stats(file_name)
+            stats = pstats.Stats(file_name)
+        self.assertEqual(stats.total_calls, sum(phase_stats.calls for phase_stats in profiler.phases.values()))
+
+    def test_tournament_profile(self):
+        result = run_tournament(RandomPokerAi, SimplePokerAi, 6, seed=2, workers=2, chunk_size=2, profile=True)
+        self.assertEqual(result.profiler.games, 6)
+        self.assertEqual(result.profiler.phases["play_move[SimplePokerAi]"].calls, 6 * 20)
+        self.assertIsNone(run_tournament(RandomPokerAi, SimplePokerAi, 2, workers=1).profiler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import io
+import os
+import socket
+import sys
+import threading
+import unittest
+from typing import List
+
+from game import Decision, Deck, legal_moves, spawn_generators
+from game.protocol import ProtocolError, decode_message, encode_message
+from players import BotConnection, RemotePokerAi, SimplePokerAi
+from players.remote_ai import run_bot
+from run_game import run_game, run_games
+
+BOT_COMMAND = [sys.executable, os.path.join(os.path.dirname(os.path.dirname(__file__)), "remote_bot.py")]
+
+
+class KeepingSimplePokerAi(SimplePokerAi):
+    """ Simple placements without the random last move, so games do not depend on the AI's stream. """
+
+    def play_last_move(self, card_to_play, hands, other_hands, deck):
+        return None
+
+
+class CountingConnection(BotConnection):
+    """ Runs the bot in process, counting the requests sent to it. """
+
+    def __init__(self, ai_type):
+        super().__init__(io.BytesIO(), io.BytesIO())
+        self.ai_type = ai_type
+        self.requests: List[dict] = []
+
+    def request(self, message: dict) -> dict:
+        self.requests.append(message)
+        output = io.BytesIO()
+        run_bot(self.ai_type, io.BytesIO(encode_message(message)), output)
+        reply = decode_message(output.getvalue())
+        if reply["type"] == "error":
+            raise ProtocolError(reply["message"])
+        return reply
+
+
+class TestRemotePokerAi(unittest.TestCase):
+    def test_batched_requests(self):
+        connection = CountingConnection(KeepingSimplePokerAi)
+        remote_results = run_games(RemotePokerAi(True, connection), KeepingSimplePokerAi(False), 8, seed=3)
+        local_results = run_games(KeepingSimplePokerAi(True), KeepingSimplePokerAi(False), 8, seed=3)
+
+        self.assertListEqual(remote_results, local_results)
+        # One request per turn of player 1 whatever the number of games
+        self.assertEqual(len(connection.requests), 21)
+        self.assertTrue(all(len(request["decisions"]) == 8 for request in connection.requests))
+
+    def test_bot_process(self):
+        connection = BotConnection.start_process(BOT_COMMAND + ["simple"])
+        try:
+            result = run_game(RemotePokerAi(True, connection), SimplePokerAi(False), seed=2)
+            self.assertEqual(sum(result.player_scores), 5)
+            results = run_games(SimplePokerAi(True), RemotePokerAi(False, connection), 5, seed=2)
+            self.assertEqual(len(results), 5)
+        finally:
+            connection.close()
+
+    def test_bot_socket(self):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            def serve_one_connection():
+                connection, _ = server.accept()
+                with connection, connection.makefile("rwb") as stream:
+                    run_bot(SimplePokerAi, stream, stream)
+
+            bot_thread = threading.Thread(target=serve_one_connection)
+            bot_thread.start()
+            connection = BotConnection.connect(*server.getsockname())
+            try:
+                results = run_games(RemotePokerAi(True, connection), SimplePokerAi(False), 3, seed=5)
+            finally:
+                connection.close()
+                bot_thread.join()
+        self.assertEqual(len(results), 3)
+
+    def test_illegal_move(self):
+        class IllegalBot(SimplePokerAi):
+            def decide_batch(self, decisions: List[Decision]):
+                return [len(legal_moves(decision)) + 1 for decision in decisions]
+
+        with self.assertRaises(ProtocolError):
+            run_game(RemotePokerAi(True, CountingConnection(IllegalBot)), SimplePokerAi(False), seed=1)
+
+    def test_non_integer_moves(self):
+        class ReplyingConnection(BotConnection):
+            def __init__(self, played_hand):
+                super().__init__(io.BytesIO(), io.BytesIO())
+                self.played_hand = played_hand
+
+            def request(self, message: dict) -> dict:
+                return {"type": "moves", "hands": [self.played_hand] * len(message["decisions"])}
+
+        for played_hand in [0.0, 2.0, True, "0"]:
+            with self.assertRaises(ProtocolError):
+                run_game(RemotePokerAi(True, ReplyingConnection(played_hand)), SimplePokerAi(False), seed=1)
+
+    def test_bot_reports_bad_requests(self):
+        output = io.BytesIO()
+        run_bot(SimplePokerAi, io.BytesIO(b'{"type": "decide"}\nnot json\n'), output)
+        replies = [decode_message(line) for line in output.getvalue().splitlines()]
+        self.assertListEqual([reply["type"] for reply in replies], ["error", "error"])
+
+
+class TestLockstepGames(unittest.TestCase):
+    def test_same_games_as_run_game(self):
+        lockstep_results = run_games(KeepingSimplePokerAi(True), KeepingSimplePokerAi(False), 6, seed=9)
+
+        _, _, *deck_rngs = spawn_generators(9, 2 + 6)
+        results = [run_game(KeepingSimplePokerAi(True), KeepingSimplePokerAi(False), deck=Deck(rng=deck_rng))
+                   for deck_rng in deck_rngs]
+        self.assertListEqual(lockstep_results, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
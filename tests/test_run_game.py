@@ -0,0 +1,50 @@
+import unittest
+from collections import defaultdict
+
+import numpy as np
+
+from game import Deck, Hand, calculate_hand_base_value, has_better_cards
+from players import AdvancedPokerAi, RandomPokerAi, SimplePokerAi
+from run_game import return_game_score, run_game
+
+
+class TestSeededGame(unittest.TestCase):
+    def test_seeded_deck(self):
+        first_deck = Deck(rng=np.random.default_rng(5))
+        second_deck = Deck(rng=np.random.default_rng(5))
+        self.assertListEqual([first_deck.pop() for _ in range(52)], [second_deck.pop() for _ in range(52)])
+
+    def test_same_seed_replays_game(self):
+        for player1_ai_type, player2_ai_type in [(RandomPokerAi, SimplePokerAi), (AdvancedPokerAi, RandomPokerAi)]:
+            results = [run_game(player1_ai_type(True), player2_ai_type(False), seed=11) for _ in range(2)]
+            self.assertEqual(results[0], results[1])
+
+    def test_seed_overrides_player_streams(self):
+        player1_ai, player2_ai = SimplePokerAi(True), SimplePokerAi(False)
+        first_result = run_game(player1_ai, player2_ai, seed=2)
+        for _ in range(3):
+            run_game(player1_ai, player2_ai)
+        self.assertEqual(run_game(player1_ai, player2_ai, seed=2), first_result)
+
+
+class TestGameScore(unittest.TestCase):
+    def test_showdown_matches_hand_comparison(self):
+        for seed in range(50):
+            deck = Deck(rng=np.random.default_rng(seed))
+            player1_hands = [Hand(True, [deck.pop() for _ in range(5)]) for _ in range(5)]
+            player2_hands = [Hand(False, [deck.pop() for _ in range(5)]) for _ in range(5)]
+
+            result = return_game_score(player1_hands, player2_hands, False)
+            won_hands = [has_better_cards(hand1.get_cards(True), hand2.get_cards(False))
+                         for hand1, hand2 in zip(player1_hands, player2_hands)]
+            self.assertEqual(result.player_scores, (sum(won_hands), 5 - sum(won_hands)))
+
+            winning_base_values = defaultdict(int)
+            for won, hand1, hand2 in zip(won_hands, player1_hands, player2_hands):
+                winning_cards = hand1.get_cards(True) if won else hand2.get_cards(False)
+                winning_base_values[calculate_hand_base_value(winning_cards)] += 1
+            self.assertDictEqual(dict(result.win_by_hand_value), dict(winning_base_values))
+
+
+if __name__ == '__main__':
+    unittest.main()
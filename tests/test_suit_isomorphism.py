@@ -0,0 +1,57 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from game import Card, Deck, calculate_hand_base_value, has_better_cards
+from game.card import CARDS
+from game.suit_isomorphism import canonical_masks, canonicalize_cards, cards_mask, inverse_permutation, mask_cards, \
+    permute_card, permute_mask
+
+
+class TestSuitIsomorphism(unittest.TestCase):
+    def test_class_counts(self):
+        # The well known amounts of starting hands and flops up to suit isomorphism
+        for cards_amount, classes in [(1, 13), (2, 169), (3, 1755)]:
+            representatives = {canonical_masks([cards_mask(cards)])[0]
+                               for cards in itertools.combinations(CARDS, cards_amount)}
+            self.assertEqual(len(representatives), classes)
+
+    def test_permuted_groups_share_a_representative(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            deck = Deck(rng=rng)
+            groups = [[deck.pop() for _ in range(size)] for size in (5, 4, 3)]
+            suits = tuple(int(suit) for suit in rng.permutation(4))
+            permuted_groups = [[permute_card(card, suits) for card in cards] for cards in groups]
+            self.assertEqual(canonicalize_cards(*permuted_groups)[0], canonicalize_cards(*groups)[0])
+
+    def test_inverse_maps_back(self):
+        deck = Deck(rng=np.random.default_rng(1))
+        cards, other_cards = [deck.pop() for _ in range(7)], [deck.pop() for _ in range(9)]
+        (canonical_cards, canonical_other_cards), permutation = canonicalize_cards(cards, other_cards)
+        inverse = inverse_permutation(permutation)
+        self.assertEqual([permute_card(card, inverse) for card in canonical_cards], cards)
+        self.assertEqual(mask_cards(permute_mask(cards_mask(canonical_other_cards), inverse)),
+                         sorted(other_cards))
+
+    def test_base_values_are_invariant(self):
+        deck = Deck(rng=np.random.default_rng(2))
+        for _ in range(10):
+            cards = [deck.pop() for _ in range(5)]
+            self.assertEqual(calculate_hand_base_value(canonicalize_cards(cards)[0][0]),
+                             calculate_hand_base_value(cards))
+
+    def test_hand_comparisons_are_not_invariant(self):
+        # Equal hands are told apart by suit, so renaming the suits can swap the winner
+        cards = [Card("CLUBS", number) for number in (2, 4, 6, 8)] + [Card("HEARTS", 11)]
+        other_cards = [Card("DIAMONDS", number) for number in (2, 4, 6, 8)] + [Card("SPADES", 11)]
+        swap = (1, 0, 3, 2)
+        permuted_cards = [permute_card(card, swap) for card in cards]
+        permuted_other_cards = [permute_card(card, swap) for card in other_cards]
+        self.assertNotEqual(has_better_cards(cards, other_cards),
+                            has_better_cards(permuted_cards, permuted_other_cards))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from players import RandomPokerAi, SimplePokerAi
+from tournament import run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    def test_totals(self):
+        result = run_tournament(RandomPokerAi, SimplePokerAi, 20, seed=3, workers=1)
+        self.assertEqual(result.games, 20)
+        self.assertEqual(sum(result.player_wins), 20)
+        self.assertEqual(sum(result.player_scores), 20 * 5)
+        self.assertEqual(sum(result.win_by_hand_value.values()), 20 * 5)
+
+    def test_same_result_for_any_worker_count(self):
+        single_worker = run_tournament(RandomPokerAi, SimplePokerAi, 24, seed=7, workers=1)
+        chunked = run_tournament(RandomPokerAi, SimplePokerAi, 24, seed=7, workers=1, chunk_size=5)
+        multiple_workers = run_tournament(RandomPokerAi, SimplePokerAi, 24, seed=7, workers=3)
+
+        for result in [chunked, multiple_workers]:
+            self.assertEqual(result.player_scores, single_worker.player_scores)
+            self.assertEqual(result.player_wins, single_worker.player_wins)
+            self.assertEqual(dict(result.win_by_hand_value), dict(single_worker.win_by_hand_value))
+
+
+if __name__ == '__main__':
+    unittest.main()
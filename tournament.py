@@ -0,0 +1,115 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import DefaultDict, List, Optional, Tuple, Type
+
+import numpy as np
+from tqdm import tqdm
+
+from game import HandBaseValue
+from game_log import GameLogWriter
+from players import PokerAi
+from profiling import GameProfiler
+from run_game import GameResult, run_game
+
+
+@dataclass
+class TournamentResult:
+    games: int = 0
+    player_scores: Tuple[int, int] = (0, 0)
+    player_wins: Tuple[int, int] = (0, 0)
+    win_by_hand_value: DefaultDict[HandBaseValue, int] = field(default_factory=lambda: defaultdict(int))
+    profiler: Optional[GameProfiler] = None
+
+    def add_game(self, game_result: GameResult) -> None:
+        player1_score, player2_score = game_result.player_scores
+        player1_won = player1_score > player2_score
+
+        self.games += 1
+        self.player_scores = (self.player_scores[0] + player1_score, self.player_scores[1] + player2_score)
+        self.player_wins = (self.player_wins[0] + player1_won, self.player_wins[1] + (not player1_won))
+        for key, value in game_result.win_by_hand_value.items():
+            self.win_by_hand_value[key] += value
+
+    def merge(self, other: "TournamentResult") -> None:
+        self.games += other.games
+        self.player_scores = (self.player_scores[0] + other.player_scores[0],
+                              self.player_scores[1] + other.player_scores[1])
+        self.player_wins = (self.player_wins[0] + other.player_wins[0], self.player_wins[1] + other.player_wins[1])
+        for key, value in other.win_by_hand_value.items():
+            self.win_by_hand_value[key] += value
+        if other.profiler is not None:
+            if self.profiler is None:
+                self.profiler = GameProfiler()
+            self.profiler.merge(other.profiler)
+
+
+def game_seed(master_seed: int, game_index: int) -> np.random.SeedSequence:
+    # Every game gets its own stream, so a game plays the same whichever worker runs it
+    return np.random.SeedSequence(master_seed, spawn_key=(game_index,))
+
+
+def chunk_log_name(log_directory: str, first_game: int) -> str:
+    return os.path.join(log_directory, f"games-{first_game:09d}.cpgl")
+
+
+def play_games(player1_ai_type: Type[PokerAi], player2_ai_type: Type[PokerAi], master_seed: int,
+               first_game: int, last_game: int, profile: bool = False,
+               log_directory: Optional[str] = None) -> TournamentResult:
+    player1_ai = player1_ai_type(True)
+    player2_ai = player2_ai_type(False)
+    recorder = None
+    if log_directory is not None:
+        # Each chunk logs to its own file so workers never write to the same one, replacing the chunk of an
+        # earlier run with the same seed instead of logging its games twice
+        player_names = (player1_ai_type.__name__, player2_ai_type.__name__)
+        recorder = GameLogWriter(chunk_log_name(log_directory, first_game), player_names)
+
+    result = TournamentResult(profiler=GameProfiler() if profile else None)
+    try:
+        for game_index in range(first_game, last_game):
+            result.add_game(run_game(player1_ai, player2_ai, seed=game_seed(master_seed, game_index),
+                                     profiler=result.profiler, recorder=recorder))
+    finally:
+        # The games recorded before a failing one are still written out
+        if recorder is not None:
+            recorder.close()
+    return result
+
+
+def split_games(games: int, chunk_size: int) -> List[Tuple[int, int]]:
+    return [(first_game, min(first_game + chunk_size, games)) for first_game in range(0, games, chunk_size)]
+
+
+def run_tournament(player1_ai_type: Type[PokerAi], player2_ai_type: Type[PokerAi], games: int, seed: int = 0,
+                   workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                   progress: bool = False, profile: bool = False,
+                   log_directory: Optional[str] = None) -> TournamentResult:
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, min(1000, -(-games // (workers * 4))))
+    chunks = split_games(games, chunk_size)
+    if log_directory is not None:
+        os.makedirs(log_directory, exist_ok=True)
+
+    result = TournamentResult()
+    progress_bar = tqdm(total=games, disable=not progress)
+
+    if workers == 1:
+        for first_game, last_game in chunks:
+            result.merge(play_games(player1_ai_type, player2_ai_type, seed, first_game, last_game, profile,
+                                    log_directory))
+            progress_bar.update(last_game - first_game)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_games, player1_ai_type, player2_ai_type, seed, first_game, last_game,
+                                       profile, log_directory)
+                       for first_game, last_game in chunks]
+            for future in as_completed(futures):
+                chunk_result = future.result()
+                result.merge(chunk_result)
+                progress_bar.update(chunk_result.games)
+
+    progress_bar.close()
+    return result
@@ -0,0 +1,128 @@
+import argparse
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from batch_game import BatchPolicy, SimpleBatchPolicy, deal_decks, simulate_games
+from game import NO_REPLACEMENT, spawn_generators
+from game.features import FEATURES, hand_features, unseen_cards
+from game.game_state import HANDS_AMOUNT
+from players.learned_ai import DEFAULT_WEIGHTS_FILE, LinearValueModel
+
+DEFAULT_RIDGE = 1e-3
+
+
+class LearnedBatchPolicy(BatchPolicy):
+    """ Places cards with a `LinearValueModel`, exploring a random playable hand on a share of the moves. Last
+    moves keep every hand. """
+
+    def __init__(self, is_first_player: bool, model: LinearValueModel, exploration: float = 0.0,
+                 rng: Optional[np.random.Generator] = None):
+        super().__init__(is_first_player, rng)
+        self.model: LinearValueModel = model
+        self.exploration: float = exploration
+
+    def observe(self, features: np.ndarray) -> None:
+        """ Called with the `hand_features` of the player's hands on every turn. """
+        pass
+
+    def play_moves(self, cards: np.ndarray, hands: np.ndarray, hand_sizes: np.ndarray, hand_values: np.ndarray,
+                   other_hands: np.ndarray) -> np.ndarray:
+        unseen = unseen_cards(hands, other_hands, cards)
+        features = hand_features(hands, hand_values, other_hands, unseen)
+        self.observe(features)
+
+        scores = self.model.move_scores(cards, hands, hand_sizes, hand_values, other_hands, unseen, features)
+        explored = self.rng.random(len(cards)) < self.exploration
+        scores[explored] = np.where(np.isinf(scores[explored]), -np.inf,
+                                    self.rng.random((np.count_nonzero(explored), HANDS_AMOUNT)))
+        return np.argmax(scores, axis=1)
+
+    def play_last_moves(self, cards: np.ndarray, hands: np.ndarray, hand_values: np.ndarray,
+                        other_hands: np.ndarray) -> np.ndarray:
+        return np.full(len(cards), NO_REPLACEMENT)
+
+
+class SelfPlayPolicy(LearnedBatchPolicy):
+    """ Sums up the features of its hands over the turns of each game, and their outer products over all of
+    them, for the least squares fit. """
+
+    def __init__(self, is_first_player: bool, model: LinearValueModel, exploration: float = 0.0,
+                 rng: Optional[np.random.Generator] = None):
+        super().__init__(is_first_player, model, exploration, rng)
+        self.feature_sums: np.ndarray = np.zeros((0, HANDS_AMOUNT, FEATURES))
+        self.gram: np.ndarray = np.zeros((FEATURES, FEATURES))
+
+    def start_games(self, games: int) -> None:
+        self.feature_sums = np.zeros((games, HANDS_AMOUNT, FEATURES))
+
+    def observe(self, features: np.ndarray) -> None:
+        self.feature_sums += features
+        flat_features = features.reshape(-1, FEATURES)
+        self.gram += flat_features.T @ flat_features
+
+
+def self_play(model: LinearValueModel, games: int, seed: int | np.random.SeedSequence | None = None,
+              exploration: float = 0.1, batch_size: int = 10_000) -> Tuple[np.ndarray, np.ndarray]:
+    """ Play `games` games of the model against itself and return the normal equations of the least squares
+    fit from the features of every hand on every turn to whether the hand was won in the end. """
+    deck_rng, player1_rng, player2_rng = spawn_generators(seed, 3)
+    policies = [SelfPlayPolicy(True, model, exploration, player1_rng),
+                SelfPlayPolicy(False, model, exploration, player2_rng)]
+    correlations = np.zeros(FEATURES)
+
+    for first_game in range(0, games, batch_size):
+        batch_games = min(batch_size, games - first_game)
+        for policy in policies:
+            policy.start_games(batch_games)
+        result = simulate_games(deal_decks(batch_games, deck_rng), *policies)
+        for policy, won_hands in zip(policies, [result.player1_won_hands, ~result.player1_won_hands]):
+            correlations += np.einsum("ghf,gh->f", policy.feature_sums, won_hands)
+
+    return sum(policy.gram for policy in policies), correlations
+
+
+def fit_weights(gram: np.ndarray, correlations: np.ndarray, ridge: float = DEFAULT_RIDGE) -> np.ndarray:
+    """ Ridge regression weights solving the normal equations, scaled by the amount of samples. """
+    samples = max(gram[-1, -1], 1.0)
+    return np.linalg.solve(gram / samples + ridge * np.eye(len(gram)), correlations / samples).astype(np.float32)
+
+
+def train(iterations: int, games: int, seed: int | None = None, exploration: float = 0.1,
+          ridge: float = DEFAULT_RIDGE, verbose: bool = False) -> LinearValueModel:
+    """ Alternate self-play and fitting, each iteration playing with the model fitted by the previous one. """
+    model = LinearValueModel()
+    for iteration, iteration_seed in enumerate(np.random.SeedSequence(seed).spawn(iterations)):
+        start = time.perf_counter()
+        model = LinearValueModel(fit_weights(*self_play(model, games, iteration_seed, exploration), ridge))
+        if verbose:
+            print(f"iteration {iteration + 1}: {games / (time.perf_counter() - start):.0f} games/s, "
+                  f"{score_against(model, SimpleBatchPolicy, 20_000, iteration_seed):.3f} hands won against simple")
+    return model
+
+
+def score_against(model: LinearValueModel, opponent_type: type, games: int,
+                  seed: int | np.random.SeedSequence | None = None) -> float:
+    """ Average hands won per game by the model against `opponent_type`, half the games in each seat. """
+    first_seat_rng, second_seat_rng = spawn_generators(seed, 2)
+    first_seat = simulate_games(deal_decks(games // 2, first_seat_rng),
+                                LearnedBatchPolicy(True, model), opponent_type(False, first_seat_rng))
+    second_seat = simulate_games(deal_decks(games // 2, second_seat_rng),
+                                 opponent_type(True, second_seat_rng), LearnedBatchPolicy(False, model))
+    hands_won = first_seat.player_scores[:, 0].sum() + second_seat.player_scores[:, 1].sum()
+    return float(hands_won) / (2 * (games // 2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the placement model of LearnedPokerAi by self-play.")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--games", type=int, default=200_000, help="self-play games per iteration")
+    parser.add_argument("--exploration", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=DEFAULT_WEIGHTS_FILE)
+    args = parser.parse_args()
+
+    trained_model = train(args.iterations, args.games, args.seed, args.exploration, verbose=True)
+    trained_model.save(args.output)
+    print(f"saved {args.output}")